@@ -0,0 +1,13 @@
+import pytest
+
+pytest.importorskip("pymunk")
+
+from tideflow.analytic import compare_with_pymunk  # noqa: E402
+
+
+@pytest.mark.parametrize("scenario", ["1", "7"])
+def test_analytic_backend_matches_pymunk(scenario):
+    # Gemessen werden etwa 1e-12 px; Spielraum für andere Plattformen und pymunk-Versionen
+    position, angle = compare_with_pymunk(scenario, steps=3600)
+    assert position <= 1e-9
+    assert angle <= 1e-9
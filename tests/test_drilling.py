@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+import pytest
+
+from tideflow.drilling import DrillPolicy, _frames_until, drill_profile, drill_stepped
+from tideflow.engine import Simulation
+from tideflow.events import EventSchedule
+from tideflow.scenario import get_scenario
+
+POLICIES = [
+    DrillPolicy(),
+    DrillPolicy(repair_threshold=None),
+    DrillPolicy(speed=(0.5, 1.0, 2.0, 0.7, 1.3), repair_frames=600, wear_exponent=2.0),
+    DrillPolicy(speed=0.3, repair_threshold=60.0, repair_amount=45.0, repair_frames=17),
+]
+
+
+def _assert_matches(profile, depth, wear):
+    # An jeder Stützstelle gilt der letzte Wert des Frames (nach einer Reparatur)
+    last = np.r_[profile.frames[1:] != profile.frames[:-1], True]
+    frames = profile.frames[last]
+    np.testing.assert_array_equal(profile.depth[last], depth[frames])
+    np.testing.assert_array_equal(profile.wear[last], wear[frames])
+
+
+@pytest.mark.parametrize("policy", POLICIES)
+def test_profile_identical_to_stepping(policy):
+    profile = drill_profile(policy)
+    stepped = drill_stepped(policy)
+    assert (profile.duration, profile.reached, profile.stalled, profile.repairs) == \
+        (stepped.duration, stepped.reached, stepped.stalled, stepped.repairs)
+    _assert_matches(profile, stepped.depth, stepped.wear)
+
+
+def test_profile_identical_to_engine():
+    # Ohne Ereignisse repariert die Engine nie; der Bohrer steht bei 100 % Verschleiß
+    frames = 4000
+    sim = Simulation(get_scenario("7", physics="analytic"), seed=0)
+    sim.events = EventSchedule(rates={})
+    depth, wear = [sim.bohrtiefe], [sim.bohrer_verschleiss]
+    for _ in range(frames):
+        sim.step()
+        depth.append(sim.bohrtiefe)
+        wear.append(sim.bohrer_verschleiss)
+
+    profile = drill_profile(DrillPolicy(speed=sim.bohrgeschwindigkeit, repair_threshold=None),
+                            max_frames=frames)
+    assert profile.stalled
+    _assert_matches(profile, np.array(depth), np.array(wear))
+
+
+@pytest.mark.parametrize("wear_exponent", [0.0, 2.0])
+def test_zero_speed_stalls(wear_exponent):
+    # Mit Exponent 0 steigt der Verschleiß trotz Stillstand weiter
+    assert _frames_until(0.0, 0.0, 300.0) == math.inf
+    policy = DrillPolicy(speed=0.0, wear_exponent=wear_exponent)
+    for drill in (drill_profile, drill_stepped):
+        profile = drill(policy)
+        assert not profile.reached and profile.stalled
+        assert profile.duration == 0
+    assert drill_profile(policy, max_frames=100).duration == 100
+
+
+def test_zero_speed_in_deeper_layer_stalls_there():
+    policy = DrillPolicy(speed=(0.5, 0.5, 0.0, 0.5, 0.5), repair_frames=10)
+    profile = drill_profile(policy)
+    stepped = drill_stepped(policy)
+    assert profile.stalled and stepped.stalled
+    assert profile.duration == stepped.duration
+    assert profile.depth[-1] == stepped.depth[-1] >= 1000
+
+
+def test_layer_speeds_count():
+    with pytest.raises(ValueError, match="je Schicht"):
+        DrillPolicy(speed=(0.5, 1.0, 2.0)).layer_speeds()
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from tideflow.metocean import FIELDS, MetOceanSeries, MetOceanStream, import_csv, synthesize
+from tideflow.scenario import DT
+
+CSV = """time,wind_speed,tide,wind_direction
+2020-01-01T00:00:00Z,5.0,1.0,350
+2020-01-01T01:00:00Z,,1.5,10
+2020-01-01T02:00:00Z,MM,2.0,20
+2020-01-01T03:00:00Z,7.0,,30
+2020-01-01T04:00:00Z,8.0,,40
+2020-01-01T05:00:00Z,9.0,0.5,50
+"""
+
+
+def test_import_csv_fills_gaps_across_blocks(tmp_path):
+    source, path = tmp_path / "buoy.csv", str(tmp_path / "buoy.bin")
+    source.write_text(CSV, encoding="utf-8")
+    # Blöcke zu zwei Zeilen: die Lücken in Zeile 2-3 und 4-5 liegen über Blockgrenzen
+    assert import_csv(str(source), path, chunk_rows=2) == 6
+    series = MetOceanSeries(path)
+    assert series.fields == ("wind_speed", "wind_direction", "tide")
+    records = series.records
+    start = np.datetime64("2020-01-01T00:00:00", "s").astype(np.int64)
+    np.testing.assert_array_equal(records["time"], start + 3600 * np.arange(6))
+    np.testing.assert_array_equal(records["wind_speed"], [5, 5, 5, 7, 8, 9])
+    np.testing.assert_array_equal(records["tide"], [1, 1.5, 2, 2, 2, 0.5])
+    assert np.isnan(records["wave_height"]).all()
+
+    # Halbe Stunde nach Beginn: Windrichtung über 0° statt über 180°
+    stream = MetOceanStream(series, speed=1800 / DT, prefetch=False)
+    sample = stream.sample(1)
+    assert "wave_height" not in sample
+    assert (sample["wind_direction"] + 180) % 360 - 180 == pytest.approx(0.0, abs=1e-9)
+    assert sample["tide"] == pytest.approx(1.25)
+
+
+def test_import_csv_rejects_unsorted_times_across_blocks(tmp_path):
+    lines = CSV.splitlines()
+    source = tmp_path / "buoy.csv"
+    source.write_text("\n".join(lines[:3] + lines[1:2] + lines[3:]) + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="sortiert"):
+        import_csv(str(source), str(tmp_path / "buoy.bin"), chunk_rows=2)
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_stream_matches_interp_across_blocks(tmp_path, prefetch):
+    path = str(tmp_path / "synthetic.bin")
+    synthesize(path, years=0.05, seed=1)
+    series = MetOceanSeries(path)
+    # 10 Minuten Datenzeit je Schritt, Blöcke zu 16 Stunden
+    stream = MetOceanStream(series, speed=36000, chunk=16, prefetch=prefetch)
+    forward = list(range(0, 2600, 7))
+    steps = forward + [1500, 30, 2599, 800, 801, 0]
+    try:
+        samples = [stream.sample(step) for step in steps]
+    finally:
+        stream.close()
+    assert stream.loads > 10
+
+    t = np.array([stream.data_time(step) for step in steps])
+    for name in FIELDS:
+        expected = np.interp(t, series.times, series.records[name])
+        actual = np.array([s[name] for s in samples])
+        if name == "wind_direction":
+            # Über den kürzeren Bogen interpoliert; fern vom Sprung bei 360° wie np.interp
+            jump = np.abs(np.diff(series.records[name]))
+            index = np.clip(np.searchsorted(series.times, t, side="right") - 1, 0, len(jump) - 1)
+            smooth = jump[index] < 180
+            np.testing.assert_allclose(actual[smooth], expected[smooth], rtol=0, atol=1e-9)
+        else:
+            np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-9)
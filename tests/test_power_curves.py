@@ -0,0 +1,18 @@
+import numpy as np
+
+from tideflow.power_curves import load_curve
+
+
+def test_wind_curve_matches_quadratic_formula_below_rated():
+    curve = load_curve("wind_turbine")
+    speeds = np.linspace(0.0, curve.rated, 10001)
+    np.testing.assert_allclose(curve(speeds), 0.2 * speeds**2, rtol=0, atol=1e-9)
+    # Windboden aus Szenario 7 liefert weiterhin Leistung
+    assert curve(2.0) > 0
+    assert curve(curve.cut_out + 1) == 0
+
+
+def test_wave_curve_matches_quadratic_formula():
+    curve = load_curve("wave_generator")
+    factors = np.linspace(-1.0, 1.0, 10001)
+    np.testing.assert_allclose(curve(factors), 15 * factors**2, rtol=0, atol=1e-9)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from tideflow.engine import Simulation
+from tideflow.golden import record_trace
+from tideflow.scenario import get_scenario
+from tideflow.scheduler import FRAME_RATE, PRESETS, SUBSYSTEMS, MultiRateScheduler, Subsystem, parse_rates
+
+STEPS = 1200
+# Alle Teilsysteme im Frame-Takt, aber über den Scheduler
+FRAME_RATES = tuple((name, FRAME_RATE) for name in SUBSYSTEMS)
+
+
+def _trace(name, rates):
+    trace, _ = record_trace(get_scenario(name, rates=rates), steps=STEPS, every=1)
+    return trace
+
+
+@pytest.mark.parametrize("name", ["4", "7", "9"])
+def test_without_rates_frame_path(name):
+    for rates in ((), PRESETS["frame"], parse_rates("frame")):
+        assert Simulation(get_scenario(name, rates=rates), seed=0).scheduler is None
+    np.testing.assert_array_equal(_trace(name, parse_rates("frame")), _trace(name, ()))
+
+
+@pytest.mark.parametrize("name", ["4", "7", "9"])
+def test_frame_rates_identical_to_frame_path(name):
+    sim = Simulation(get_scenario(name, rates=FRAME_RATES), seed=0)
+    assert all(sub.every == 1 and sub.fields is None for sub in sim.scheduler.subsystems)
+    np.testing.assert_array_equal(_trace(name, FRAME_RATES), _trace(name, ()))
+
+
+def test_multi_rates_call_counts():
+    sim = Simulation(get_scenario("9", rates=PRESETS["multi"]), seed=0).run(600)
+    calls = sim.scheduler.calls_per_second()
+    assert calls["physics"] == 240
+    assert calls["devices"] == calls["drive"] == 60
+    assert calls["structure"] == 10
+    assert calls["weather"] == calls["sky"] == 1
+
+
+def test_interpolated_weather_stays_continuous():
+    sim = Simulation(get_scenario("7", rates=(("weather", 1),)), seed=0)
+    wind = []
+    for _ in range(3 * FRAME_RATE):
+        sim.step()
+        wind.append(sim.wind_speed)
+    # Linear über jede Periode: konstante Schrittweite innerhalb einer Sekunde
+    steps = np.diff(np.reshape(wind, (3, FRAME_RATE)), axis=1)
+    np.testing.assert_allclose(steps, steps[:, :1].repeat(FRAME_RATE - 1, axis=1), atol=1e-9)
+    # Nach der letzten Periode steht nichts mehr zum Interpolieren an
+    weather, = (sub for sub in sim.scheduler.subsystems if sub.name == "weather")
+    assert weather.delta is None
+
+
+@pytest.mark.parametrize("rate", [30, 90, 150])
+def test_physics_rate_must_be_frame_multiple(rate):
+    rates = parse_rates(f"physics={rate}")
+    assert rates == (("physics", float(rate)),)
+    with pytest.raises(ValueError, match="Vielfaches"):
+        Subsystem("physics", lambda substeps: None, rate)
+    with pytest.raises(ValueError, match="Vielfaches"):
+        MultiRateScheduler(rates, [("physics", lambda substeps: None)])
+
+
+def test_rejects_fast_or_unknown_subsystems():
+    with pytest.raises(ValueError, match="schneller"):
+        Subsystem("weather", lambda frames: None, 120)
+    with pytest.raises(ValueError, match="Unbekannte"):
+        MultiRateScheduler(parse_rates("wetter=1"), [])
@@ -0,0 +1,7 @@
+"""TideFlow - gemeinsame Bausteine der Offshore-Simulation.
+
+Das Paket importiert bewusst nichts Schweres auf Modulebene, damit
+Headless-Läufe und Worker-Prozesse schnell starten.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,201 @@
+"""Vektorisierte Plattform-Dynamik als leichtgewichtige Alternative zu pymunk.
+
+``PlatformEnsemble`` integriert viele Plattformen gleichzeitig: jede ist ein
+starrer 2D-Körper an linearen Federn mit Dämpfern zu festen Ankerpunkten
+(den Säulenköpfen). Der Schritt folgt der Reihenfolge von Chipmunk -
+Positionen, Federimpulse, Geschwindigkeiten, dann iterierte Dämpfung - als
+semi-impliziter Euler auf NumPy-Arrays. Kontakte zwischen Plattform und
+Säulen werden nicht modelliert; ``compare_with_pymunk`` prüft die Abweichung
+gegen einen pymunk-Space mit deaktivierten Kollisionen.
+"""
+
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from .scenario import DT
+
+Vec = namedtuple("Vec", "x y")
+
+
+def moment_for_box(mass, size):
+    width, height = size
+    return mass * (width ** 2 + height ** 2) / 12.0
+
+
+def _rotate(points, angle):
+    # points (N, 2) oder (N, S, 2) um angle (N,) drehen
+    shape = angle.shape + (1,) * (np.ndim(points) - 2)
+    c = np.cos(angle).reshape(shape)
+    s = np.sin(angle).reshape(shape)
+    x, y = points[..., 0], points[..., 1]
+    return np.stack([x * c - y * s, x * s + y * c], axis=-1)
+
+
+class PlatformEnsemble:
+    """N Plattformen mit je S Federn zu statischen Ankerpunkten."""
+
+    def __init__(self, n, mass, moment, position, platform_anchors, column_anchors,
+                 stiffness, damping, rest_length=0.0, gravity=(0, 1000), iterations=10):
+        self.n = n
+        self.mass = np.broadcast_to(np.asarray(mass, dtype=np.float64), (n,)).copy()
+        self.moment = np.broadcast_to(np.asarray(moment, dtype=np.float64), (n,)).copy()
+        self.platform_anchors = np.asarray(platform_anchors, dtype=np.float64)  # (S, 2) lokal
+        self.column_anchors = np.asarray(column_anchors, dtype=np.float64)  # (S, 2) Welt
+        springs = len(self.platform_anchors)
+        self.stiffness = np.broadcast_to(np.asarray(stiffness, dtype=np.float64), (n, springs)).copy()
+        self.damping = np.broadcast_to(np.asarray(damping, dtype=np.float64), (n, springs)).copy()
+        self.rest_length = np.broadcast_to(np.asarray(rest_length, dtype=np.float64), (n, springs)).copy()
+        self.gravity = np.asarray(gravity, dtype=np.float64)
+        self.iterations = iterations
+
+        self.position = np.tile(np.asarray(position, dtype=np.float64), (n, 1))
+        self.velocity = np.zeros((n, 2))
+        self.angle = np.zeros(n)
+        self.angular_velocity = np.zeros(n)
+        self.force = np.zeros((n, 2))
+        self.torque = np.zeros(n)
+
+    @classmethod
+    def from_scenario(cls, scenario, n=1, iterations=10):
+        sc = scenario
+        if sc.joint not in ("spring", "none"):
+            raise ValueError(f"Analytisches Backend unterstützt nur Federn, nicht {sc.joint!r}")
+        size = (sc.platform_width, sc.platform_height)
+        if sc.joint == "spring":
+            platform_anchors = [((-sc.platform_width // 2) + (i + 0.5) * sc.column_spacing, 0)
+                                for i in range(sc.num_columns)]
+            column_anchors = [(sc.column_x(i), sc.column_y) for i in range(sc.num_columns)]
+        else:
+            platform_anchors = column_anchors = np.zeros((0, 2))
+        return cls(n, sc.platform_mass, moment_for_box(sc.platform_mass, size),
+                   (sc.platform_x + sc.platform_width // 2, sc.platform_y),
+                   platform_anchors, column_anchors, sc.spring_stiffness, sc.spring_damping,
+                   iterations=iterations)
+
+    def apply_force(self, force, point=(0, 0)):
+        """Kraft in lokalen Koordinaten an einem lokalen Punkt, wie ``apply_force_at_local_point``."""
+        force = np.broadcast_to(np.asarray(force, dtype=np.float64), (self.n, 2))
+        world_force = _rotate(force, self.angle)
+        self.force += world_force
+        if point[0] or point[1]:
+            r = _rotate(np.broadcast_to(np.asarray(point, dtype=np.float64), (self.n, 2)), self.angle)
+            self.torque += r[:, 0] * world_force[:, 1] - r[:, 1] * world_force[:, 0]
+
+    def step(self, dt=DT):
+        m_inv = 1.0 / self.mass
+        i_inv = 1.0 / self.moment
+
+        # Positionen integrieren
+        self.position += self.velocity * dt
+        self.angle += self.angular_velocity * dt
+
+        # Federkräfte als Impuls (alle Federn gleichzeitig, Form (N, S))
+        r1 = _rotate(self.platform_anchors[None, :, :], self.angle)
+        delta = self.column_anchors[None, :, :] - (self.position[:, None, :] + r1)
+        dist = np.hypot(delta[..., 0], delta[..., 1])
+        normal = delta / np.where(dist > 0, dist, np.inf)[..., None]
+        r1xn = r1[..., 0] * normal[..., 1] - r1[..., 1] * normal[..., 0]
+        k = m_inv[:, None] + i_inv[:, None] * r1xn ** 2
+        n_mass = 1.0 / k
+        v_coef = 1.0 - np.exp(-self.damping * dt * k)
+        j_spring = (self.rest_length - dist) * self.stiffness * dt
+        # Auf die Plattform wirkt -n * j
+        self.velocity -= np.einsum("ns,nsd->nd", j_spring, normal) * m_inv[:, None]
+        self.angular_velocity -= np.sum(r1xn * j_spring, axis=1) * i_inv
+
+        # Geschwindigkeiten integrieren (Schwerkraft und äußere Kräfte)
+        self.velocity += (self.gravity + self.force * m_inv[:, None]) * dt
+        self.angular_velocity += self.torque * i_inv * dt
+        self.force[:] = 0
+        self.torque[:] = 0
+
+        # Dämpfung iterativ wie im Chipmunk-Solver (Gauss-Seidel über die Federn);
+        # die Spalten je Feder werden einmal herausgelöst statt in jeder Iteration
+        springs = [(r1[:, s, 0].copy(), r1[:, s, 1].copy(), normal[:, s, 0].copy(), normal[:, s, 1].copy(),
+                    v_coef[:, s].copy(), n_mass[:, s] * m_inv, n_mass[:, s] * r1xn[:, s] * i_inv)
+                   for s in range(r1.shape[1])]
+        target = [0.0] * len(springs)
+        vx, vy = self.velocity[:, 0].copy(), self.velocity[:, 1].copy()
+        w = self.angular_velocity
+        for _ in range(self.iterations):
+            for s, (rx, ry, nx, ny, coef, lin, ang) in enumerate(springs):
+                vrn = -((vx - w * ry) * nx + (vy + w * rx) * ny)
+                v_damp = (target[s] - vrn) * coef
+                target[s] = vrn + v_damp
+                vx -= nx * v_damp * lin
+                vy -= ny * v_damp * lin
+                w -= v_damp * ang
+        self.velocity[:, 0] = vx
+        self.velocity[:, 1] = vy
+
+
+class AnalyticPlatform:
+    """Einzelne Plattform mit der Schnittstelle von ``PlatformPhysics``."""
+
+    column_bodies = ()
+
+    def __init__(self, scenario):
+        self.ensemble = PlatformEnsemble.from_scenario(scenario, n=1)
+
+    @property
+    def position(self):
+        return Vec(*self.ensemble.position[0].tolist())
+
+    @property
+    def velocity(self):
+        return Vec(*self.ensemble.velocity[0].tolist())
+
+    @property
+    def angle(self):
+        return float(self.ensemble.angle[0])
+
+    @property
+    def iterations(self):
+        return self.ensemble.iterations
+
+    @iterations.setter
+    def iterations(self, value):
+        self.ensemble.iterations = value
+
+    def apply_force(self, force, point=(0, 0)):
+        self.ensemble.apply_force(force, point)
+
+    def set_height(self, y):
+        self.ensemble.position[0, 1] = y
+
+    def step(self, dt=DT):
+        self.ensemble.step(dt)
+
+
+def compare_with_pymunk(scenario="7", steps=600, wave_amplitude=15.0, wave_frequency=0.01):
+    """Trajektorie gegen pymunk (ohne Kontakte) vergleichen.
+
+    Beide Backends bekommen dieselbe Wellenkraft wie in 7.py. Rückgabe ist die
+    größte Abweichung von Position (Pixel) und Winkel (rad) über den Lauf.
+    """
+    import pymunk
+
+    from .physics import PlatformPhysics
+    from .scenario import get_scenario
+
+    sc = get_scenario(scenario) if isinstance(scenario, str) else scenario
+    reference = PlatformPhysics(sc)
+    # Gleiche Gruppe: Plattform und Säulen kollidieren nicht
+    for shape in reference.column_shapes + [reference.platform_shape]:
+        shape.filter = pymunk.ShapeFilter(group=1)
+    analytic = AnalyticPlatform(sc)
+
+    max_position = max_angle = 0.0
+    for t in range(steps):
+        force = (abs(math.sin(wave_frequency * t)) * wave_amplitude * 2000,
+                 abs(math.sin(wave_frequency * t * 0.7)) * wave_amplitude * 1000)
+        reference.apply_force(force)
+        analytic.apply_force(force)
+        reference.step(DT)
+        analytic.step(DT)
+        p, q = reference.position, analytic.position
+        max_position = max(max_position, math.hypot(p.x - q.x, p.y - q.y))
+        max_angle = max(max_angle, abs(reference.angle - analytic.angle))
+    return max_position, max_angle
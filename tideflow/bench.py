@@ -0,0 +1,96 @@
+"""Headless-Benchmarks für alle Szenarien.
+
+Aufruf: ``python -m tideflow.bench [szenario ...] [--steps N] [--rates multi]``
+"""
+
+import argparse
+import time
+
+from .engine import Simulation
+from .scenario import SCENARIOS, get_scenario
+
+
+def bench_scenario(name, steps=600, seed=0):
+    """Schritte pro Sekunde von ``Simulation.step`` ohne Darstellung."""
+    sim = Simulation(name, seed=seed)
+    start = time.perf_counter()
+    sim.run(steps)
+    return steps / (time.perf_counter() - start)
+
+
+def bench_ensemble(n, steps=600, scenario="7"):
+    """Plattform-Schritte pro Sekunde des analytischen Backends für n Plattformen."""
+    from .analytic import PlatformEnsemble
+
+    ensemble = PlatformEnsemble.from_scenario(get_scenario(scenario), n=n)
+    start = time.perf_counter()
+    for t in range(steps):
+        ensemble.apply_force((abs(t % 100 - 50) * 600.0, 0.0))
+        ensemble.step()
+    return n * steps / (time.perf_counter() - start)
+
+
+def bench_debris(n, steps=600, scenario="7", kind="debris", collide=False, spatial_hash=True, park=True, seed=0,
+                 threads=1):
+    """Mikrosekunden je ``Simulation.step`` mit ``n`` schwimmenden Körpern, mittlere Zahl im ``Space`` und
+    zuletzt genutzte Fäden (``threads=0``: vom ``ThreadTuner`` gewählt)."""
+    sim = Simulation(get_scenario(scenario, physics_threads=threads), seed=seed)
+    if n:
+        from .debris import DebrisField
+        sim.debris = DebrisField(sim.physics, sim.scenario, n, kind, seed=seed, collide=collide,
+                                 spatial_hash=spatial_hash, park_margin=150.0 if park else None)
+    sim.run(steps // 10)  # Einschwingen: Stau an den Säulen aufbauen
+    active = 0
+    elapsed = 0.0
+    for _ in range(steps):
+        start = time.perf_counter()
+        sim.step()
+        elapsed += time.perf_counter() - start
+        active += sim.debris.active_count if n else 0
+    return elapsed / steps * 1e6, active / steps, sim.physics.threads
+
+
+def bench_rates(name, rates, steps=600, seed=0, repeats=5, physics=True):
+    """Mikrosekunden je Frame mit den Taktraten ``rates`` (leer: Frame-Takt), bestes von ``repeats``
+    Läufen; ``physics=False`` überspringt ``physics.step`` und misst nur die übrigen Teilsysteme."""
+    sim = Simulation(get_scenario(name, rates=rates), seed=seed)
+    if not physics:
+        sim.physics.step = lambda dt: None
+    sim.run(steps // 10)
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        sim.run(steps)
+        best = min(best, time.perf_counter() - start)
+    return best / steps * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", default=list(SCENARIOS))
+    parser.add_argument("--steps", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ensemble", type=int, nargs="*", default=[],
+                        help="zusätzlich analytische Ensembles dieser Größen messen")
+    parser.add_argument("--rates", help="zusätzlich Frame-Takt gegen diese Taktraten messen "
+                                        "(Preset oder name=Hz,...), mit und ohne Physik")
+    args = parser.parse_args(argv)
+
+    for name in args.scenarios:
+        rate = bench_scenario(name, args.steps, args.seed)
+        print(f"Szenario {name}: {rate:10.0f} Schritte/s ({1e6 / rate:7.1f} µs/Schritt)")
+    for n in args.ensemble:
+        rate = bench_ensemble(n, args.steps)
+        print(f"Ensemble {n:6d}: {rate:10.0f} Plattform-Schritte/s ({1e6 / rate:7.3f} µs/Plattform)")
+    if args.rates:
+        from .scheduler import parse_rates
+
+        rates = parse_rates(args.rates)
+        for name in args.scenarios:
+            times = [bench_rates(name, r, args.steps, args.seed, physics=p) for p in (True, False) for r in ((), rates)]
+            print(f"Szenario {name}: Frame-Takt {times[0]:7.1f}, {args.rates} {times[1]:7.1f} µs/Frame; "
+                  f"ohne Physik {times[2]:7.1f} / {times[3]:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
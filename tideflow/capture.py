@@ -0,0 +1,167 @@
+"""Aufzeichnung ohne Fenster: Frames offscreen rendern und als Bildfolge speichern.
+
+Die ``View`` zeichnet in eine gewöhnliche ``pygame.Surface``. Jeder
+aufgezeichnete Frame wird per ``surfarray`` kopiert und über eine begrenzte
+Warteschlange an Encoder-Threads übergeben. Ist die Warteschlange voll, wird
+nach der gewählten Politik ein Frame verworfen, statt die Simulation
+anzuhalten. PNG wird mit ``zlib`` komprimiert, das dabei den GIL freigibt;
+``raw`` schreibt unkomprimierte ``.npy``-Dateien.
+"""
+
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+
+import numpy as np
+
+FORMATS = ("png", "raw")
+DROP_POLICIES = ("newest", "oldest")
+
+
+def _png_chunk(kind, data):
+    chunk = kind + data
+    return struct.pack(">I", len(data)) + chunk + struct.pack(">I", zlib.crc32(chunk) & 0xFFFFFFFF)
+
+
+def encode_png(pixels, level=1):
+    """RGB-Array in ``surfarray``-Anordnung (Breite, Höhe, 3) als PNG-Bytes."""
+    width, height = pixels.shape[:2]
+    rows = np.empty((height, 1 + width * 3), dtype=np.uint8)
+    rows[:, 0] = 0  # Filtertyp "None" je Zeile
+    rows[:, 1:] = pixels.transpose(1, 0, 2).reshape(height, width * 3)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"".join([b"\x89PNG\r\n\x1a\n",
+                     _png_chunk(b"IHDR", header),
+                     _png_chunk(b"IDAT", zlib.compress(rows.tobytes(), level)),
+                     _png_chunk(b"IEND", b"")])
+
+
+class FrameEncoder:
+    """Encoder-Threads hinter einer begrenzten Warteschlange mit Verwerf-Politik.
+
+    ``drop="newest"`` verwirft bei voller Warteschlange den neuen Frame (ohne
+    ihn zu kopieren), ``drop="oldest"`` den ältesten noch wartenden. ``dropped``
+    zählt alle nicht geschriebenen Frames, ``evicted`` davon die bereits
+    eingereihten, die für einen neueren weichen mussten.
+    """
+
+    def __init__(self, directory, fmt="png", workers=2, queue_size=16, drop="newest", level=1):
+        if workers < 1:
+            raise ValueError(f"Mindestens ein Encoder-Thread nötig, nicht {workers}")
+        if fmt not in FORMATS:
+            raise ValueError(f"Unbekanntes Format {fmt!r}, erlaubt: {', '.join(FORMATS)}")
+        if drop not in DROP_POLICIES:
+            raise ValueError(f"Unbekannte Verwerf-Politik {drop!r}, erlaubt: {', '.join(DROP_POLICIES)}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.fmt = fmt
+        self.drop = drop
+        self.level = level
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.submitted = 0
+        self.dropped = 0
+        self.evicted = 0
+        self.written = 0
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def path(self, index):
+        return os.path.join(self.directory, f"frame_{index:06d}.{'png' if self.fmt == 'png' else 'npy'}")
+
+    def submit(self, index, surface):
+        """Frame übergeben; ``True``, wenn genau dieser Frame eingereiht wurde.
+
+        Mit ``drop="oldest"`` kann dabei ein älterer Frame verdrängt werden;
+        das zählt ``evicted``.
+        """
+        import pygame
+
+        self.submitted += 1
+        if self.drop == "newest" and self.queue.full():
+            self.dropped += 1
+            return False
+        item = (index, pygame.surfarray.array3d(surface))
+        try:
+            self.queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+        if self.drop == "newest":
+            self.dropped += 1
+            return False
+        # Ältesten wartenden Frame verwerfen und erneut einreihen
+        try:
+            self.queue.get_nowait()
+            self.queue.task_done()
+            self.dropped += 1
+            self.evicted += 1
+        except queue.Empty:
+            pass
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                index, pixels = item
+                if self.fmt == "png":
+                    with open(self.path(index), "wb") as f:
+                        f.write(encode_png(pixels, self.level))
+                else:
+                    np.save(self.path(index), pixels.transpose(1, 0, 2))
+                with self._lock:
+                    self.written += 1
+            finally:
+                self.queue.task_done()
+
+    def close(self):
+        """Restliche Frames schreiben und die Threads beenden."""
+        for _ in self._threads:
+            self.queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+
+def capture(scenario="7", directory="capture", frames=600, every=1, seed=None,
+            fmt="png", workers=2, queue_size=16, drop="newest"):
+    """Szenario ohne Fenster laufen lassen und jeden ``every``-ten Frame speichern.
+
+    Rückgabe: Dict mit Zählern und Laufzeiten.
+    """
+    if every < 1:
+        raise ValueError(f"every muss mindestens 1 sein, nicht {every}")
+    # Ohne Anzeige rendern; kein Fenster, auch wenn ein Display vorhanden ist
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from .engine import Simulation
+    from .view import View
+
+    sim = Simulation(scenario, seed)
+    view = View(sim, offscreen=True)
+    encoder = FrameEncoder(directory, fmt, workers, queue_size, drop)
+    start = time.perf_counter()
+    try:
+        for t in range(frames):
+            sim.step()
+            if t % every == 0:
+                view.draw()
+                encoder.submit(t, view.screen)
+        sim_time = time.perf_counter() - start
+    finally:
+        encoder.close()
+        view.close()
+    return {"frames": frames, "submitted": encoder.submitted, "written": encoder.written,
+            "dropped": encoder.dropped, "evicted": encoder.evicted, "sim_seconds": sim_time,
+            "total_seconds": time.perf_counter() - start}
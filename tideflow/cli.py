@@ -0,0 +1,614 @@
+"""Kommandozeile: ``python -m tideflow <befehl> [optionen]``.
+
+Jeder Befehl importiert seine Module erst beim Aufruf. Der Headless-Modus
+lädt damit weder Pygame noch Matplotlib und beginnt den ersten
+Simulationsschritt ohne Fenster- und Figure-Aufbau.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"muss mindestens 1 sein, nicht {number}")
+    return number
+
+
+def _add_scenario_args(parser):
+    # scenario.py importiert nur die Standardbibliothek, das hält den Start schnell
+    from .scenario import SCENARIOS
+
+    parser.add_argument("-s", "--scenario", default="7",
+                        help=f"Szenario-Name ({', '.join(SCENARIOS)})")
+    parser.add_argument("--seed", type=int, default=None, help="Zufalls-Seed für reproduzierbare Läufe")
+    parser.add_argument("--physics", choices=("pymunk", "analytic"), default=None,
+                        help="Physik-Backend (Standard: wie im Szenario)")
+    parser.add_argument("--threads", choices=("1", "2", "auto"), default=None,
+                        help="Fäden für den pymunk-Schritt, 'auto' misst und wählt den schnelleren Modus")
+    parser.add_argument("--events", choices=("roll", "poisson"), default=None,
+                        help="Ereignisse pro Frame würfeln oder vorab als Zeitleiste ziehen")
+    parser.add_argument("--rates", default=None,
+                        help="Taktraten je Teilsystem, z.B. physics=240,weather=1 oder 'multi'")
+
+
+def _add_metocean_args(parser):
+    parser.add_argument("--metocean", default=None, help="Wetter aus einer umgewandelten Messreihe (.bin)")
+    parser.add_argument("--metocean-start", default=None, help="Startzeitpunkt in der Reihe (ISO 8601)")
+    parser.add_argument("--metocean-speed", type=float, default=60.0,
+                        help="Sekunden Messreihe je simulierter Sekunde")
+
+
+def _metocean(args):
+    if not args.metocean:
+        return None
+    import numpy as np
+
+    from .metocean import MetOceanStream
+
+    start = None
+    if args.metocean_start:
+        start = float(np.datetime64(args.metocean_start, "s").astype(np.int64))
+    return MetOceanStream(args.metocean, start, args.metocean_speed)
+
+
+def _scenario(args):
+    from .scenario import get_scenario
+
+    overrides = {key: getattr(args, key) for key in ("physics", "events") if getattr(args, key)}
+    if args.threads:
+        overrides["physics_threads"] = 0 if args.threads == "auto" else int(args.threads)
+    if args.rates:
+        from .scheduler import parse_rates
+        overrides["rates"] = parse_rates(args.rates)
+    return get_scenario(args.scenario, **overrides)
+
+
+def cmd_run(args):
+    # Pygame-Begrüßung unterdrücken, bevor Pygame geladen wird
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    from .view import run
+
+    run(_scenario(args), args.seed, args.budget_ms, args.record, args.record_every, _metocean(args))
+
+
+def cmd_headless(args):
+    start = time.perf_counter()
+    from .engine import Simulation
+
+    sim = Simulation(_scenario(args), seed=args.seed, stats=args.stats, metocean=_metocean(args))
+    if args.record:
+        from .telemetry import TelemetryRecorder
+        recorder = TelemetryRecorder(args.record, sim, args.record_every)
+    sim.step()
+    first_step = time.perf_counter() - start
+    if args.record:
+        recorder.record()
+        for _ in range(args.steps - 1):
+            sim.step()
+            recorder.record()
+        recorder.close()
+    else:
+        sim.run(args.steps - 1)
+    elapsed = time.perf_counter() - start - first_step
+
+    print(f"Szenario {sim.scenario.name}: {args.steps} Schritte")
+    print(f"  Erster Schritt nach {first_step * 1000:.1f} ms, "
+          f"danach {(args.steps - 1) / elapsed if elapsed > 0 else float('inf'):.0f} Schritte/s")
+    print(f"  Energie: {sim.power} kW, Ölförderung: {sim.oelfoerderung:.2f} Barrel/s, "
+          f"Bohrtiefe: {sim.bohrtiefe:.1f}m")
+    if sim.stats is not None:
+        _print_stats(sim.stats)
+    if sim.scheduler is not None:
+        rates = sim.scheduler.calls_per_second()
+        print("  Aufrufe je simulierter Sekunde: " + ", ".join(f"{name} {rate:g}" for name, rate in rates.items()))
+    if sim.metocean is not None:
+        import numpy as np
+
+        stream = sim.metocean
+        print(f"  Messreihe bis {np.datetime64(int(stream.data_time(sim.time_step)), 's')}, "
+              f"{stream.loads} Blöcke gelesen")
+
+
+def _print_stats(stats):
+    print(f"  {'Kennzahl':<17}{'Mittel':>9}{'Std':>9}{'Min':>9}{'P5':>9}{'P50':>9}{'P95':>9}{'Max':>9}{'EWMA':>9}")
+    for name, s in stats.summary().items():
+        print(f"  {name:<17}" + "".join(f"{s[key]:9.2f}" for key in
+                                         ("mean", "std", "min", "p05", "p50", "p95", "max", "ewma")))
+
+
+def cmd_stats(args):
+    from .stats import ensemble_stats
+
+    start = time.perf_counter()
+    stats = ensemble_stats(_scenario(args), args.members, args.steps, args.seed or 0, args.workers)
+    print(f"Szenario {args.scenario}: {args.members} Läufe à {args.steps} Schritte "
+          f"in {time.perf_counter() - start:.2f} s zusammengeführt")
+    _print_stats(stats)
+
+
+def cmd_replay(args):
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    from .view import replay
+
+    replay(args.path, args.speed)
+
+
+def cmd_bench(args):
+    from .bench import main
+
+    main(args.scenarios + ["--steps", str(args.steps), "--ensemble", *map(str, args.ensemble)]
+         + (["--rates", args.rates] if args.rates else []))
+
+
+def cmd_debris_bench(args):
+    from .bench import bench_debris
+
+    # Zuwachs je zusätzlichem Körper zwischen aufeinanderfolgenden Größen: bei linearem Wachstum konstant
+    previous = None
+    for n in sorted(set(args.counts)):
+        us, active, _ = bench_debris(n, args.steps, args.scenario, args.kind, args.collide, not args.tree,
+                                     not args.no_park, args.seed)
+        slope = f"{(us - previous[1]) / (n - previous[0]) * 1e3:8.0f} ns je weiterem Körper" if previous else ""
+        print(f"{n:6d} Körper ({active:7.1f} im Space): {us:9.1f} µs/Schritt {slope}")
+        previous = n, us
+
+
+def cmd_threads_bench(args):
+    from .bench import bench_debris
+
+    # Alle Körper im Space und untereinander stoßend, damit der Löser Arbeit hat
+    for n in args.counts:
+        single, active, _ = bench_debris(n, args.steps, args.scenario, args.kind, True, park=False, seed=args.seed)
+        threaded = bench_debris(n, args.steps, args.scenario, args.kind, True, park=False, seed=args.seed,
+                                threads=2)[0]
+        auto, _, chosen = bench_debris(n, args.steps, args.scenario, args.kind, True, park=False, seed=args.seed,
+                                       threads=0)
+        print(f"{n:6d} Körper ({active:6.0f} im Space): 1 Faden {single:8.1f} µs, 2 Fäden {threaded:8.1f} µs "
+              f"(x{single / threaded:.2f}), automatisch {chosen} {'Faden' if chosen == 1 else 'Fäden'} {auto:8.1f} µs")
+
+
+def cmd_physics_check(args):
+    from .analytic import compare_with_pymunk
+
+    position, angle = compare_with_pymunk(args.scenario, args.steps)
+    ok = position <= args.tolerance
+    print(f"Analytisch vs. pymunk über {args.steps} Schritte: "
+          f"max. Positionsabweichung {position:.3g} px, Winkel {angle:.3g} rad "
+          f"-> {'OK' if ok else 'ABWEICHUNG'}")
+    return 0 if ok else 1
+
+
+def cmd_golden_record(args):
+    from .golden import record
+
+    rates = record(args.path, args.scenarios, args.steps, args.seed, args.every)
+    print(f"Goldene Spuren von {len(rates)} Szenarien à {args.steps} Schritte nach {args.path}")
+    for name, rate in rates.items():
+        print(f"  Szenario {name}: {rate:10.0f} Schritte/s")
+
+
+def cmd_golden_check(args):
+    from .golden import check
+
+    results = check(args.path, args.scenarios, args.tolerance_scale)
+    for r in results:
+        worst = max(r["worst"], key=r["worst"].get)
+        status = "OK" if r["ok"] else f"ABWEICHUNG ab Schritt {r['first']}"
+        speed = f" ({r['rate'] / r['golden_rate']:.2f}x)" if r["golden_rate"] else ""
+        print(f"Szenario {r['scenario']}: {status:<28} max. {worst} {r['worst'][worst]:.3g}   "
+              f"{r['rate']:10.0f} Schritte/s{speed}")
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+def cmd_field(args):
+    import numpy as np
+
+    from .subsurface import SubsurfaceGrid, WellBank, well_pattern
+
+    nx, ny = args.cells
+    grid = SubsurfaceGrid.generate(nx, ny, args.spacing, seed=args.seed)
+    wells = np.array(well_pattern(args.wells, spacing=min(nx, ny) * args.spacing / (np.sqrt(args.wells) + 1),
+                                  center=(nx * args.spacing / 2, ny * args.spacing / 2)))
+    bank = WellBank(grid, *wells.T, seed=args.seed)
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        bank.drill(args.speed)
+        oil = bank.produce()
+    elapsed = time.perf_counter() - start
+    pressure = bank.pressure()
+    print(f"{len(bank)} Bohrungen auf {nx}x{ny} Zellen à {args.spacing:g} m, {args.steps} Frames: "
+          f"{elapsed / args.steps * 1e6:.1f} µs/Frame ({elapsed / args.steps / len(bank) * 1e9:.0f} ns je Bohrung)")
+    print(f"  Tiefe {bank.depth.min():.0f}-{bank.depth.max():.0f} m, Förderung {oil:.2f} Barrel/s, "
+          f"Druck an den Bohrköpfen {pressure.min():.1f}-{pressure.max():.1f} %")
+
+
+def cmd_drill(args):
+    from .drilling import DrillPolicy, drill_profile, drill_stepped
+    from .geology import SCHICHTEN
+
+    policy = DrillPolicy(speed=args.speed, repair_threshold=args.repair_threshold,
+                         repair_amount=args.repair_amount, repair_frames=args.repair_frames,
+                         wear_exponent=args.wear_exponent)
+    start = time.perf_counter()
+    profile = drill_profile(policy, max_depth=args.depth)
+    event_time = time.perf_counter() - start
+    start = time.perf_counter()
+    stepped = drill_stepped(policy, max_depth=args.depth)
+    stepped_time = time.perf_counter() - start
+
+    status = "erreicht" if profile.reached else "Stillstand" if profile.stalled else "offen"
+    print(f"Bohrung bis {args.depth:.0f}m: {status} nach {profile.duration} Frames, "
+          f"{profile.repairs} Reparaturen")
+    for layer in SCHICHTEN:
+        frame = profile.time_to_depth(layer["tiefe"]) if 0 < layer["tiefe"] <= args.depth else None
+        if frame is not None:
+            print(f"  {layer['name']:<12} ab {layer['tiefe']:>5}m nach {frame} Frames")
+    deviation = abs(profile.depth_at(stepped.frames) - stepped.depth).max()
+    print(f"  Segmentweise {event_time * 1000:.2f} ms ({len(profile.frames)} Stützstellen), "
+          f"Frame für Frame {stepped_time * 1000:.1f} ms")
+    print(f"  Abweichung zur Schrittrechnung: Tiefe {deviation:.2g} m, "
+          f"Dauer {profile.duration - stepped.duration:+d} Frames, "
+          f"Reparaturen {profile.repairs - stepped.repairs:+d}")
+
+
+def cmd_optimize(args):
+    from .geology import SCHICHTEN
+    from .optimize import DrillModel, PolicyOptimizer
+
+    model = DrillModel(horizon=args.horizon, repair_frames=args.repair_frames,
+                       wear_exponent=args.wear_exponent)
+    optimizer = PolicyOptimizer(args.objective, model, workers=args.workers, cache_path=args.cache)
+    cached = len(optimizer.cache)
+    start = time.perf_counter()
+    speeds, threshold, result = optimizer.optimize(rounds=args.rounds)
+    elapsed = time.perf_counter() - start
+
+    print(f"Ziel {args.objective}: {optimizer.evaluations} Politiken bewertet "
+          f"({cached} aus dem Cache, {optimizer.workers} Prozesse) in {elapsed:.2f} s")
+    for layer, speed in zip(SCHICHTEN, speeds):
+        print(f"  {layer['name']:<12} Bohrgeschwindigkeit {speed:.3f}")
+    print(f"  Reparatur ab Verschleiß {threshold:.1f}%, {result['repairs']} Reparaturen")
+    frames = f"{result['frames']} Frames" if result["frames"] is not None else "nicht erreicht"
+    oil = f", Öl über {args.horizon} Frames: {result['oil']:.2f} Barrel" if result["oil"] is not None else ""
+    print(f"  Zieltiefe: {frames}{oil}")
+
+
+def cmd_env_bench(args):
+    import numpy as np
+
+    from .env import BatchedOffshoreEnv, OffshoreEnv, VectorEnv
+
+    action = [1.0, 0.0, 0.0]
+    if args.mode == "batched":
+        env = BatchedOffshoreEnv(args.envs, seed=args.seed, frame_skip=args.frame_skip)
+    elif args.mode == "vector":
+        env = VectorEnv(args.envs, workers=args.workers, seed=args.seed, frame_skip=args.frame_skip)
+    else:
+        env = OffshoreEnv(seed=args.seed, frame_skip=args.frame_skip)
+    single = args.mode == "single"
+    actions = action if single else np.tile(action, (args.envs, 1))
+    env.reset()
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        env.step(actions)
+    elapsed = time.perf_counter() - start
+    env.close()
+    n = 1 if single else args.envs
+    print(f"{args.mode}: {n} Umgebungen, {args.steps * n / elapsed:,.0f} Aktionen/s, "
+          f"{args.steps * n * args.frame_skip / elapsed:,.0f} Frames/s")
+
+
+def cmd_metocean_import(args):
+    import numpy as np
+
+    from .metocean import MetOceanSeries, import_csv, synthesize
+
+    start = time.perf_counter()
+    if args.synthetic:
+        count = synthesize(args.output, years=args.synthetic, seed=args.seed)
+    else:
+        count = import_csv(args.source, args.output, args.chunk_rows)
+    series = MetOceanSeries(args.output)
+    first, last = (np.datetime64(int(t), "s") for t in (series.start, series.end))
+    print(f"{count} Datensätze ({', '.join(series.fields)}) von {first} bis {last} "
+          f"nach {args.output} in {time.perf_counter() - start:.2f} s")
+
+
+def cmd_sensitivity(args):
+    from .sensitivity import OUTPUTS, analyze
+
+    start = time.perf_counter()
+    result = analyze(_scenario(args), args.parameters, args.method, args.samples, args.levels, args.sampler,
+                     args.steps, args.seed or 0, args.workers, args.bootstrap)
+    print(f"{args.method.capitalize()}-Analyse, Szenario {args.scenario}: {result['runs']} Läufe "
+          f"à {args.steps} Schritte in {time.perf_counter() - start:.1f} s (± halbes 95%-Intervall)")
+    names = result["parameters"]
+    for output in OUTPUTS:
+        r = result[output]
+        print(f"  {output}")
+        for i, name in enumerate(names):
+            if args.method == "sobol":
+                print(f"    {name:<20} S1 {r['S1'][i]:6.3f} ± {r['S1_conf'][i]:.3f}   "
+                      f"ST {r['ST'][i]:6.3f} ± {r['ST_conf'][i]:.3f}")
+            else:
+                print(f"    {name:<20} mu* {r['mu_star'][i]:10.4g} ± {r['mu_star_conf'][i]:.3g}   "
+                      f"mu {r['mu'][i]:10.4g}   sigma {r['sigma'][i]:10.4g}")
+
+
+def cmd_surrogate_fit(args):
+    from .surrogate import Surrogate
+
+    start = time.perf_counter()
+    if os.path.exists(args.model) and not args.new:
+        model = Surrogate.load(args.model)
+    else:
+        model = Surrogate(args.scenario, args.parameters, args.steps, args.seed)
+    model.run(args.runs, args.workers)
+    model.save(args.model)
+    print(f"{len(model)} Läufe à {model.steps} Schritte, Szenario {model.scenario}, "
+          f"nach {args.model} in {time.perf_counter() - start:.1f} s")
+    print("  Längenskalen " + ", ".join(f"{name} {length:.3g}" for name, length in zip(model.names, model.gp.lengths)))
+    for output, rmse in model.cross_validation().items():
+        print(f"  {output:<12} Leave-one-out-RMSE {rmse:.4g}")
+
+
+def cmd_surrogate_query(args):
+    from .surrogate import Surrogate
+
+    model = Surrogate.load(args.model)
+    params = {}
+    for item in args.values:
+        name, _, value = item.partition("=")
+        params[name.strip()] = float(value)
+    result = model.query(**params)
+    repeats = 10000
+    start = time.perf_counter()
+    for _ in range(repeats):
+        model.query(**params)
+    elapsed = (time.perf_counter() - start) / repeats
+    for output, (mean, std) in result.items():
+        print(f"  {output:<12} {mean:12.4g} ± {std:.3g}")
+    print(f"  {elapsed * 1e6:.1f} µs je Abfrage ({len(model)} Läufe im Modell)")
+
+
+def cmd_memprofile(args):
+    from .memprofile import profile_loop
+
+    start = time.perf_counter()
+    profiler = profile_loop(_scenario(args), args.frames, args.seed, args.every, args.rss_every, args.window,
+                            not args.no_plot, args.record)
+    report = profiler.report(args.top)
+    print(f"Szenario {args.scenario}: {report['frames']} Frames in {time.perf_counter() - start:.1f} s "
+          f"(Zeilen aus jedem {args.every}. Frame)")
+    print("  Phase      Spitze/Frame  Wachstum/Frame")
+    for name, phase in report["phases"].items():
+        print(f"  {name:<10} {phase['peak']:10.0f} B  {phase['growth']:12.1f} B")
+    print("  Allokationen je Frame, die ihre Phase überleben:")
+    for line in report["lines"]:
+        print(f"  {line['phase']:<8} {line['count']:8.1f} x {line['bytes']:10.1f} B  "
+              f"{os.path.relpath(line['file'])}:{line['line']}")
+    samples = report["samples"]
+    if samples:
+        frame, resident, traced = samples[-1]
+        print(f"  RSS {resident / 2**20:.1f} MiB, verfolgt {traced / 2**20:.2f} MiB nach {frame} Frames; "
+              f"Steigung in der zweiten Hälfte: RSS {report['rss_slope']:.1f} B/Frame, "
+              f"verfolgt {report['traced_slope']:.1f} B/Frame")
+
+
+def cmd_capture(args):
+    from .capture import capture
+
+    stats = capture(_scenario(args), args.output, args.frames, args.every, args.seed,
+                    args.format, args.workers, args.queue_size, args.drop)
+    print(f"{stats['written']} von {stats['submitted']} Frames nach {args.output} geschrieben, "
+          f"{stats['dropped']} verworfen (davon {stats['evicted']} aus der Warteschlange verdrängt)")
+    print(f"  Simulation {stats['sim_seconds']:.2f} s, gesamt {stats['total_seconds']:.2f} s")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="tideflow", description="TideFlow Offshore-Simulation")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("run", help="Interaktive Simulation im Pygame-Fenster")
+    _add_scenario_args(p)
+    p.add_argument("--budget-ms", type=float, default=None,
+                   help="Frame-Budget des Qualitätsreglers (Standard: 1000 / Ziel-FPS)")
+    p.add_argument("--record", default=None,
+                   help="Telemetrie aufzeichnen; der Graph zoomt dann bis auf Einzelschritte")
+    p.add_argument("--record-every", type=int, default=1)
+    _add_metocean_args(p)
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("capture", help="Ohne Fenster rendern und Frames als Bilder speichern")
+    _add_scenario_args(p)
+    p.add_argument("-o", "--output", default="capture", help="Zielverzeichnis")
+    p.add_argument("-n", "--frames", type=int, default=600)
+    p.add_argument("--every", type=_positive_int, default=1, help="nur jeden n-ten Frame speichern")
+    p.add_argument("--format", choices=("png", "raw"), default="png")
+    p.add_argument("--workers", type=_positive_int, default=2, help="Encoder-Threads")
+    p.add_argument("--queue-size", type=int, default=16)
+    p.add_argument("--drop", choices=("newest", "oldest"), default="newest",
+                   help="welcher Frame bei voller Warteschlange verworfen wird")
+    p.set_defaults(func=cmd_capture)
+
+    p = sub.add_parser("headless", help="Simulation ohne Fenster und Graphen")
+    _add_scenario_args(p)
+    p.add_argument("-n", "--steps", type=_positive_int, default=3600)
+    p.add_argument("--record", default=None, help="Telemetrie in diese Datei schreiben")
+    p.add_argument("--record-every", type=int, default=1, help="nur jeden n-ten Schritt aufzeichnen")
+    p.add_argument("--stats", action="store_true", help="laufende Statistiken der Kennzahlen ausgeben")
+    _add_metocean_args(p)
+    p.set_defaults(func=cmd_headless)
+
+    p = sub.add_parser("stats", help="Statistiken über ein Ensemble von Läufen, parallel gerechnet")
+    _add_scenario_args(p)
+    p.add_argument("-n", "--steps", type=int, default=3600)
+    p.add_argument("-m", "--members", type=int, default=4)
+    p.add_argument("--workers", type=int, default=None, help="Prozesse (Standard: alle Kerne)")
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser("replay", help="Aufgezeichnete Telemetrie im Pygame-Fenster abspielen")
+    p.add_argument("path")
+    p.add_argument("--speed", type=float, default=1.0,
+                   help="Schritte pro Frame, negativ rückwärts (Pfeiltasten ändern das Tempo)")
+    p.set_defaults(func=cmd_replay)
+
+    p = sub.add_parser("bench", help="Schritte pro Sekunde aller Szenarien messen")
+    p.add_argument("scenarios", nargs="*", default=[])
+    p.add_argument("--steps", type=int, default=600)
+    p.add_argument("--ensemble", type=int, nargs="*", default=[])
+    p.add_argument("--rates", default=None, help="zusätzlich Frame-Takt gegen diese Taktraten messen")
+    p.set_defaults(func=cmd_bench)
+
+    p = sub.add_parser("debris-bench", help="Schrittzeit mit schwimmenden Körpern über die Körperzahl messen")
+    p.add_argument("counts", type=int, nargs="*", default=[0, 250, 500, 1000, 2000, 4000])
+    p.add_argument("-s", "--scenario", default="7")
+    p.add_argument("-n", "--steps", type=int, default=600)
+    p.add_argument("--kind", choices=("debris", "ice"), default="debris")
+    p.add_argument("--collide", action="store_true", help="Körper stoßen auch untereinander")
+    p.add_argument("--tree", action="store_true", help="Standard-Broadphase (Baum) statt Spatial Hash")
+    p.add_argument("--no-park", action="store_true", help="alle Körper im Space, auch fern der Säulen")
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(func=cmd_debris_bench)
+
+    p = sub.add_parser("threads-bench", help="pymunk-Schritt mit einem und zwei Fäden über die Körperzahl messen")
+    p.add_argument("counts", type=int, nargs="*", default=[0, 250, 1000, 4000])
+    p.add_argument("-s", "--scenario", default="7")
+    p.add_argument("-n", "--steps", type=int, default=600)
+    p.add_argument("--kind", choices=("debris", "ice"), default="ice")
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(func=cmd_threads_bench)
+
+    p = sub.add_parser("physics-check", help="Analytisches Backend gegen pymunk validieren")
+    p.add_argument("-s", "--scenario", default="7")
+    p.add_argument("-n", "--steps", type=int, default=3600)
+    p.add_argument("--tolerance", type=float, default=1e-3, help="erlaubte Abweichung in Pixel")
+    p.set_defaults(func=cmd_physics_check)
+
+    p = sub.add_parser("memprofile", help="Allokationen je Schleifenphase und Quellzeile, RSS über die Zeit")
+    _add_scenario_args(p)
+    p.add_argument("-n", "--frames", type=int, default=1800)
+    p.add_argument("--every", type=int, default=10, help="Quellzeilen in jedem n-ten Frame zuordnen")
+    p.add_argument("--rss-every", type=int, default=60, help="RSS alle n Frames messen")
+    p.add_argument("--top", type=int, default=15)
+    p.add_argument("--window", action="store_true", help="mit Fenster und Ziel-FPS statt offscreen")
+    p.add_argument("--no-plot", action="store_true", help="ohne Live-Graph")
+    p.add_argument("--record", default=None, help="Telemetrie mitschreiben (Phase record)")
+    p.set_defaults(func=cmd_memprofile)
+
+    p = sub.add_parser("golden-record", help="Goldene Spuren aller Szenarien mit festem Seed aufnehmen")
+    p.add_argument("path", nargs="?", default="golden.npz")
+    p.add_argument("scenarios", nargs="*", default=None)
+    p.add_argument("-n", "--steps", type=int, default=3600)
+    p.add_argument("--every", type=int, default=30, help="Zustand alle n Schritte speichern")
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(func=cmd_golden_record)
+
+    p = sub.add_parser("golden-check", help="Szenarien gegen goldene Spuren prüfen und Durchsatz vergleichen")
+    p.add_argument("path", nargs="?", default="golden.npz")
+    p.add_argument("scenarios", nargs="*", default=None)
+    p.add_argument("--tolerance-scale", type=float, default=1.0, help="Faktor auf golden.TOLERANCES")
+    p.set_defaults(func=cmd_golden_check)
+
+    p = sub.add_parser("field", help="Viele Bohrungen im räumlichen Untergrundmodell rechnen und messen")
+    p.add_argument("-w", "--wells", type=int, default=100)
+    p.add_argument("-n", "--steps", type=int, default=3600)
+    p.add_argument("--cells", type=int, nargs=2, default=(40, 20), metavar=("NX", "NY"))
+    p.add_argument("--spacing", type=float, default=100.0, help="Zellgröße in Metern")
+    p.add_argument("--speed", type=float, default=0.5, help="Bohrgeschwindigkeit")
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(func=cmd_field)
+
+    p = sub.add_parser("drill", help="Bohrverlauf segmentweise berechnen und prüfen")
+    p.add_argument("--depth", type=float, default=5000.0, help="Zieltiefe in Metern")
+    p.add_argument("--speed", type=float, nargs="+", default=[0.5],
+                   help="Bohrgeschwindigkeit, ein Wert oder einer je Schicht")
+    p.add_argument("--repair-threshold", type=float, default=90.0)
+    p.add_argument("--repair-amount", type=float, default=30.0)
+    p.add_argument("--repair-frames", type=int, default=0, help="Stillstand je Reparatur")
+    p.add_argument("--wear-exponent", type=float, default=0.0)
+    p.set_defaults(func=cmd_drill)
+
+    p = sub.add_parser("optimize", help="Bohrgeschwindigkeit je Schicht und Reparaturschwelle optimieren")
+    p.add_argument("--objective", choices=("time", "oil"), default="time",
+                   help="Zeit bis 5000m minimieren oder Ölförderung maximieren")
+    p.add_argument("--workers", type=int, default=None, help="Prozesse (Standard: alle Kerne)")
+    p.add_argument("--cache", default=None, help="JSON-Datei für bereits bewertete Politiken")
+    p.add_argument("--rounds", type=int, default=50)
+    p.add_argument("--horizon", type=int, default=120000, help="Frames für das Öl-Ziel")
+    p.add_argument("--repair-frames", type=int, default=600, help="Stillstand je Reparatur")
+    p.add_argument("--wear-exponent", type=float, default=2.0)
+    p.set_defaults(func=cmd_optimize)
+
+    p = sub.add_parser("sensitivity", help="Sobol- oder Morris-Sensitivität von Förderung, Energie und Ermüdung")
+    _add_scenario_args(p)
+    p.add_argument("--method", choices=("sobol", "morris"), default="sobol")
+    p.add_argument("-N", "--samples", type=int, default=64,
+                   help="Basisstichproben (Sobol, N * (k + 2) Läufe) bzw. Trajektorien (Morris)")
+    p.add_argument("--sampler", choices=("sobol", "lhs"), default="sobol", help="Sobol-Folge oder Latin Hypercube")
+    p.add_argument("--levels", type=int, default=4, help="Gitterstufen für Morris")
+    p.add_argument("-p", "--parameters", nargs="+", default=None,
+                   help="Teilmenge der Parameter (Standard: alle aus sensitivity.PARAMETERS)")
+    p.add_argument("-n", "--steps", type=int, default=6000, help="Schritte je Lauf")
+    p.add_argument("--workers", type=int, default=None, help="Prozesse (Standard: alle Kerne)")
+    p.add_argument("--bootstrap", type=int, default=500)
+    p.set_defaults(func=cmd_sensitivity)
+
+    p = sub.add_parser("surrogate-fit", help="Surrogatmodell aus Läufen anpassen oder um Läufe erweitern")
+    p.add_argument("model", help="Modelldatei (.npz); vorhandene wird erweitert")
+    p.add_argument("-s", "--scenario", default="7")
+    p.add_argument("-r", "--runs", type=int, default=32, help="neue Läufe (Fortsetzung der Sobol-Folge)")
+    p.add_argument("-p", "--parameters", nargs="+", default=None,
+                   help="Teilmenge der Parameter (Standard: alle aus sensitivity.PARAMETERS)")
+    p.add_argument("-n", "--steps", type=int, default=6000, help="Schritte je Lauf")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--new", action="store_true", help="vorhandene Modelldatei überschreiben")
+    p.add_argument("--workers", type=int, default=None, help="Prozesse (Standard: alle Kerne)")
+    p.set_defaults(func=cmd_surrogate_fit)
+
+    p = sub.add_parser("surrogate-query", help="Kennzahlen für Parameterwerte aus dem Surrogat vorhersagen")
+    p.add_argument("model")
+    p.add_argument("values", nargs="*", help="Parameter als name=wert, übrige wie im Szenario")
+    p.set_defaults(func=cmd_surrogate_query)
+
+    p = sub.add_parser("metocean-import", help="Boje- oder Hindcast-CSV blockweise in eine Messreihe umwandeln")
+    p.add_argument("source", nargs="?", help="CSV mit Spalte time und z.B. wind_speed, wave_height, tide")
+    p.add_argument("-o", "--output", required=True)
+    p.add_argument("--chunk-rows", type=int, default=65536)
+    p.add_argument("--synthetic", type=float, default=None, metavar="JAHRE",
+                   help="statt einer CSV synthetische Stundenwerte über so viele Jahre erzeugen")
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(func=cmd_metocean_import)
+
+    p = sub.add_parser("env-bench", help="Durchsatz der Trainingsumgebungen messen")
+    p.add_argument("--mode", choices=("single", "vector", "batched"), default="batched")
+    p.add_argument("--envs", type=int, default=1024)
+    p.add_argument("--workers", type=int, default=0, help="Prozesse für --mode vector")
+    p.add_argument("-n", "--steps", type=int, default=200)
+    p.add_argument("--frame-skip", type=int, default=4)
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(func=cmd_env_bench)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.func is cmd_metocean_import and (args.source is None) == (args.synthetic is None):
+        parser.error("metocean-import braucht entweder eine CSV-Quelle oder --synthetic JAHRE")
+    if args.func is cmd_drill:
+        from .geology import SCHICHTEN
+
+        if len(args.speed) not in (1, len(SCHICHTEN)):
+            parser.error(f"drill --speed braucht einen Wert oder {len(SCHICHTEN)} (einen je Schicht), "
+                         f"nicht {len(args.speed)}")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
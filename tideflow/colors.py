@@ -0,0 +1,16 @@
+# Farben für Pygame (RGB 0-255)
+WHITE = (255, 255, 255)
+BLUE = (0, 102, 204)
+DARK_BLUE = (0, 51, 102)
+LIGHT_BLUE = (100, 150, 255)
+GRAY = (160, 160, 160)
+DARK_GRAY = (100, 100, 100)
+YELLOW = (255, 204, 0)
+RED = (255, 50, 50)
+GREEN = (50, 255, 50)
+BLACK = (0, 0, 0)
+BROWN = (139, 69, 19)
+
+# Farben für Matplotlib (RGB 0-1)
+YELLOW_MPL = (1.0, 0.8, 0.0)
+BLACK_MPL = (0.0, 0.0, 0.0)
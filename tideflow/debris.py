@@ -0,0 +1,310 @@
+"""Treibgut und Eisschollen: Hunderte bis Tausende schwimmende pymunk-Körper.
+
+Die Körper treiben mit derselben Beschleunigung, die Wellen, Wind und Strömung
+im Frame auf ``platform_body`` ausüben, dazu Auftrieb zur Wellenoberfläche und
+Wasserwiderstand. Alle Kräfte werden in einem Zug über ``pymunk.batch``
+gelesen und geschrieben (NumPy statt einer Python-Funktion je Körper). Stöße
+auf die Säulen kommen aus den Arbitern des Schritts und mindern die Gesundheit
+der Säulen im Tragwerk.
+
+Damit die Schrittzeit linear mit der Körperzahl wächst:
+
+* Broadphase über ``Space.use_spatial_hash`` mit einer Zellgröße aus der
+  Körpergröße statt des Standard-Baums,
+* Kollisionsfilter: Treibgut trifft nur Säulen (optional auch sich selbst),
+  nie die Plattform, Paare ohne Kontaktmöglichkeit fallen in der Broadphase weg,
+* die Körper verteilen sich auf eine Anfahrtsstrecke, die mit ihrer Zahl wächst
+  (gleichbleibende Dichte, am rechten Rand wieder stromauf eingesetzt),
+* Körper, die ``SLIDE_FRAMES`` Frames an einer Säule anliegen, gleiten seitlich
+  an ihr vorbei (in der Seitenansicht: Kollisionsmaske ohne Säulen, bis sie
+  stromauf neu eingesetzt werden); sonst staut sich alles an der ersten Säule,
+* Ruhen: Körper weiter als ``park_margin`` von den Säulen entfernt werden aus
+  dem ``Space`` genommen und in NumPy kinematisch mitgeführt. Der Schlafmodus
+  von Chipmunk greift hier nicht, weil schwimmende Körper nie zur Ruhe kommen
+  und jede gesetzte Kraft sie wieder weckt.
+"""
+
+import numpy as np
+import pymunk
+import pymunk.batch
+
+from .scenario import DT
+
+# Kollisionskategorien (Bits von ShapeFilter)
+COLUMN = 0b001
+PLATFORM = 0b010
+DEBRIS = 0b100
+
+# Art: Dichte relativ zu Wasser, Abstand je Körper auf der Anfahrtsstrecke (px)
+KINDS = {
+    "debris": (0.6, 15.0),
+    "ice": (0.9, 50.0),
+}
+MASS_PER_AREA = 0.01
+DRAG_X = 1.5  # Wasserwiderstand je Sekunde, waagerecht
+DRAG_Y = 4.0  # senkrecht, dämpft das Wippen
+CURRENT_PIXELS = 10.0  # Strömung in px/s je m/s
+ICE_RIGHTING = 8.0  # aufrichtendes Moment der Schollen je rad
+IMPACT_DAMAGE = 2e-4  # Gesundheitsprozent je Impulseinheit auf einer Säule
+SLIDE_FRAMES = 30  # so lange an einer Säule, dann gleitet der Körper seitlich vorbei
+
+_BODY_FIELDS = (pymunk.batch.BodyFields.BODY_ID | pymunk.batch.BodyFields.POSITION
+                | pymunk.batch.BodyFields.ANGLE | pymunk.batch.BodyFields.VELOCITY
+                | pymunk.batch.BodyFields.ANGULAR_VELOCITY | pymunk.batch.BodyFields.FORCE
+                | pymunk.batch.BodyFields.TORQUE)
+_FORCE_FIELDS = pymunk.batch.BodyFields.FORCE | pymunk.batch.BodyFields.TORQUE
+_ARBITER_FIELDS = (pymunk.batch.ArbiterFields.BODY_A_ID | pymunk.batch.ArbiterFields.BODY_B_ID
+                   | pymunk.batch.ArbiterFields.TOTAL_IMPULSE)
+
+
+def wave_surface(x, time_step, level, amplitude, frequency):
+    """Höhe der Wasseroberfläche bei ``x`` wie in ``View.draw_water_surface``."""
+    return level + amplitude * 0.5 * np.sin(frequency * (time_step + x * 0.2))
+
+
+def _lookup(sorted_ids, order, ids):
+    # Index in ``order`` je ID, -1 für fremde Körper
+    if not len(sorted_ids):
+        return np.full(len(ids), -1)
+    pos = np.minimum(np.searchsorted(sorted_ids, ids), len(sorted_ids) - 1)
+    return np.where(sorted_ids[pos] == ids, order[pos], -1)
+
+
+class DebrisField:
+    """Schwimmende Körper in ``physics.space``; ``drive`` vor, ``collect`` nach jedem Physikschritt."""
+
+    def __init__(self, physics, scenario, count, kind="debris", seed=None, collide=False,
+                 spatial_hash=True, park_margin=150.0, spacing=None):
+        if kind not in KINDS:
+            raise ValueError(f"Unbekannte Treibgutart {kind!r}, verfügbar: {', '.join(KINDS)}")
+        if not physics.column_shapes:
+            raise ValueError("Treibgut braucht Säulen als pymunk-Körper (column_bodies)")
+        sc = scenario
+        self.physics = physics
+        self.space = space = physics.space
+        self.kind = kind
+        rng = np.random.default_rng(seed)
+        density, default_spacing = KINDS[kind]
+
+        # Größe, Masse und Trägheit je Körper
+        if kind == "ice":
+            self.width = rng.uniform(14, 36, count)
+            self.height = rng.uniform(5, 9, count)
+        else:
+            self.width = self.height = 2 * rng.uniform(3, 7, count)
+        area = self.width * self.height * (np.pi / 4 if kind == "debris" else 1.0)
+        self.mass = area * MASS_PER_AREA
+        self.density = density
+
+        # Anfahrtsstrecke links vom Bildschirm, Dichte unabhängig von der Zahl
+        margin = float(self.width.max()) if count else 0.0
+        self.x_max = sc.width + margin
+        self.x_min = min(-margin, self.x_max - count * (spacing or default_spacing))
+        left = min(sc.column_x(i) for i in range(sc.num_columns)) - sc.column_radius
+        right = max(sc.column_x(i) for i in range(sc.num_columns)) + sc.column_radius
+        self.band = (left - park_margin, right + park_margin) if park_margin is not None else None
+
+        level = sc.column_y
+        self.x = rng.uniform(self.x_min, self.x_max, count)
+        self.y = level + (density - 0.5) * self.height
+        self.vx = np.zeros(count)
+        self.vy = np.zeros(count)
+        self.angle = np.zeros(count)
+        self.active = np.zeros(count, dtype=bool)
+        self.contact = np.zeros(count, dtype=np.int64)  # Frames an einer Säule
+        self.passing = np.zeros(count, dtype=bool)  # gleitet gerade an den Säulen vorbei
+
+        # Kollisionsfilter: Säulen und Plattform bekommen eigene Kategorien, die Plattform ignoriert Treibgut
+        for shape in physics.column_shapes:
+            shape.filter = pymunk.ShapeFilter(categories=COLUMN)
+        physics.platform_shape.filter = pymunk.ShapeFilter(
+            categories=PLATFORM, mask=pymunk.ShapeFilter.ALL_MASKS() ^ DEBRIS)
+        shape_filter = pymunk.ShapeFilter(categories=DEBRIS, mask=COLUMN | (DEBRIS if collide else 0))
+        self._shape_filter = shape_filter
+        self._passing_filter = pymunk.ShapeFilter(categories=DEBRIS, mask=DEBRIS if collide else 0)
+
+        self.bodies = []
+        self.shapes = []
+        for w, h, m in zip(self.width.tolist(), self.height.tolist(), self.mass.tolist()):
+            if kind == "ice":
+                body = pymunk.Body(m, pymunk.moment_for_box(m, (w, h)))
+                shape = pymunk.Poly.create_box(body, (w, h))
+                shape.friction = 0.3
+            else:
+                body = pymunk.Body(m, pymunk.moment_for_circle(m, 0, w / 2))
+                shape = pymunk.Circle(body, w / 2)
+                shape.friction = 0.5
+            shape.elasticity = 0.2
+            shape.filter = shape_filter
+            self.bodies.append(body)
+            self.shapes.append(shape)
+        self.moment = np.array([body.moment for body in self.bodies])
+        ids = np.array([body.id for body in self.bodies], dtype=np.uintp)
+        self._order = np.argsort(ids)
+        self._ids = ids[self._order]
+
+        # Broadphase: Zellen etwa doppelt so groß wie ein typischer Körper
+        if spatial_hash and count:
+            space.use_spatial_hash(2 * float(np.median(np.maximum(self.width, self.height))), max(1000, 10 * count))
+
+        # Säulen-IDs für die Stoßauswertung
+        column_ids = np.array([body.id for body in physics.column_bodies], dtype=np.uintp)
+        self._column_order = np.argsort(column_ids)
+        self._column_ids = column_ids[self._column_order]
+        self.impulse = np.zeros(len(column_ids))  # seit der letzten Auswertung
+        self.total_impulse = 0.0
+
+        self._get = pymunk.batch.Buffer()
+        self._put = pymunk.batch.Buffer()
+        self._forces = None
+        self._arbiters = pymunk.batch.Buffer()
+        self._update_parking()
+        physics.debris = self
+
+    def __len__(self):
+        return len(self.bodies)
+
+    @property
+    def active_count(self):
+        return int(np.count_nonzero(self.active))
+
+    def _read(self):
+        self._get.clear()
+        pymunk.batch.get_space_bodies(self.space, _BODY_FIELDS, self._get)
+        ids = np.frombuffer(self._get.int_buf(), dtype=np.uintp)
+        data = np.frombuffer(self._get.float_buf()).reshape(-1, 9)
+        return _lookup(self._ids, self._order, ids), data
+
+    def _update_parking(self):
+        # Körper in der Nähe der Säulen in den Space, die übrigen heraus; True wenn sich etwas geändert hat
+        if self.band is None:
+            inside = np.ones(len(self), dtype=bool)
+        else:
+            inside = (self.x > self.band[0]) & (self.x < self.band[1])
+        changed = False
+        for i in np.flatnonzero(inside & ~self.active).tolist():
+            body = self.bodies[i]
+            body.position = (self.x[i], self.y[i])
+            body.velocity = (self.vx[i], self.vy[i])
+            body.angle = self.angle[i]
+            body.angular_velocity = 0.0
+            self.space.add(body, self.shapes[i])
+            changed = True
+        for i in np.flatnonzero(~inside & self.active).tolist():
+            self.space.remove(self.bodies[i], self.shapes[i])
+            changed = True
+        self.active = inside
+        return changed
+
+    def _wrap(self):
+        # Über den rechten Rand abgetriebene Körper stromauf wieder einsetzen (und umgekehrt); True wenn welche
+        outside = (self.x > self.x_max) | (self.x < self.x_min)
+        if not outside.any():
+            return False
+        self.x[outside] = self.x_min + (self.x[outside] - self.x_min) % (self.x_max - self.x_min)
+        for i in np.flatnonzero(outside & self.passing).tolist():
+            self.shapes[i].filter = self._shape_filter
+        self.passing[outside] = False
+        self.contact[outside] = 0
+        for i in np.flatnonzero(outside & self.active).tolist():
+            self.bodies[i].position = (self.x[i], self.y[i])
+        return True
+
+    def drive(self, sim, offset=0.0):
+        """Auftrieb, Wellen- und Strömungskraft für alle Körper setzen; vor ``space.step``."""
+        sc = sim.scenario
+        physics = self.physics
+        index, data = self._read()
+        rows = index >= 0
+        i = index[rows]
+        active = data[rows]
+        self.x[i], self.y[i], self.angle[i] = active[:, 0], active[:, 1], active[:, 2]
+        self.vx[i], self.vy[i] = active[:, 3], active[:, 4]
+
+        # Gleiche Antriebsbeschleunigung wie die Plattform, Strömung als Wassergeschwindigkeit
+        accel = physics.platform_body.force.x / sc.platform_mass
+        current = sim.current_speed * CURRENT_PIXELS
+        time_step = sim.time_step + offset
+        level = sim.water_level()
+
+        # Ruhende Körper kinematisch mit der Strömung treiben, einmal je Frame (nicht je Unterschritt)
+        parked = ~self.active
+        if not offset and parked.any():
+            vx = self.vx[parked]
+            vx += (accel + DRAG_X * (current - vx)) * self.density * DT
+            self.vx[parked] = vx
+            self.x[parked] += vx * DT
+            self.y[parked] = (wave_surface(self.x[parked], time_step, level, sim.wave_amplitude, sim.wave_frequency)
+                              + (self.density - 0.5) * self.height[parked])
+            self.vy[parked] = 0.0
+            self.angle[parked] = 0.0
+        wrapped = self._wrap()
+        if (self.band is not None and self._update_parking()) or wrapped:
+            index, data = self._read()
+            rows = index >= 0
+            i = index[rows]
+
+        # Eingetauchter Anteil, Auftrieb und Widerstand
+        x, y, vx, vy = self.x[i], self.y[i], self.vx[i], self.vy[i]
+        height = self.height[i]
+        mass = self.mass[i]
+        water = wave_surface(x, time_step, level, sim.wave_amplitude, sim.wave_frequency)
+        submerged = np.clip((y + height / 2 - water) / height, 0.0, 1.0)
+        gravity = self.space.gravity.y
+        forces = data[:, 6:9].copy()
+        forces[rows, 0] += mass * submerged * (accel + DRAG_X * (current - vx))
+        forces[rows, 1] -= mass * submerged * (gravity / self.density + DRAG_Y * vy)
+        spin = data[rows, 5]
+        if self.kind == "ice":
+            # Schollen legen sich flach aufs Wasser
+            tilt = (self.angle[i] + np.pi / 2) % np.pi - np.pi / 2
+            forces[rows, 2] -= self.moment[i] * submerged * (ICE_RIGHTING * tilt + DRAG_Y * spin)
+        else:
+            forces[rows, 2] -= self.moment[i] * submerged * DRAG_Y * spin
+        if self._forces is None or self._forces.shape != forces.shape:
+            self._forces = forces
+            self._put.set_float_buf(self._forces.reshape(-1))
+        else:
+            self._forces[...] = forces
+        pymunk.batch.set_space_bodies(self.space, _FORCE_FIELDS, self._put)
+
+    def collect(self):
+        """Stoßimpulse auf die Säulen aus den Arbitern des letzten Schritts aufsummieren."""
+        self._arbiters.clear()
+        pymunk.batch.get_space_arbiters(self.space, _ARBITER_FIELDS, self._arbiters)
+        ids = np.frombuffer(self._arbiters.int_buf(), dtype=np.uintp).reshape(-1, 2)
+        if not len(ids):
+            return
+        impulse = np.hypot(*np.frombuffer(self._arbiters.float_buf()).reshape(-1, 2).T)
+        # Nur Paare aus Säule und Treibgut (die Plattform liegt in manchen Szenarien auf den Säulen auf)
+        column_a = _lookup(self._column_ids, self._column_order, ids[:, 0])
+        column_b = _lookup(self._column_ids, self._column_order, ids[:, 1])
+        column = np.where(column_a >= 0, column_a, column_b)
+        other = np.where(column_a >= 0, ids[:, 1], ids[:, 0])
+        hit = (column >= 0) & (_lookup(self._ids, self._order, other) >= 0)
+        if hit.any():
+            np.add.at(self.impulse, column[hit], impulse[hit])
+            self.total_impulse += float(impulse[hit].sum())
+            touching = _lookup(self._ids, self._order, other[hit])
+            self.contact[touching] += 1
+            for i in touching[self.contact[touching] >= SLIDE_FRAMES].tolist():
+                self.shapes[i].filter = self._passing_filter
+                self.passing[i] = True
+
+    def damage(self, structure):
+        """Gesammelte Impulse als Gesundheitsverlust auf die Säulen des Tragwerks buchen."""
+        from .structure import KINDS as MEMBER_KINDS
+
+        columns = np.flatnonzero(structure.kind == MEMBER_KINDS["column"][0])
+        n = min(len(columns), len(self.impulse))
+        structure.health[columns[:n]] -= self.impulse[:n] * IMPACT_DAMAGE
+        np.maximum(structure.health, 0.0, out=structure.health)
+        self.impulse[:] = 0.0
+
+    def corners(self, index=slice(None)):
+        """Eckpunkte der Schollen ``index``, Form (N, 4, 2)."""
+        x, y, angle = self.x[index], self.y[index], self.angle[index]
+        c, s = np.cos(angle)[:, None], np.sin(angle)[:, None]
+        lx = np.array([-0.5, 0.5, 0.5, -0.5]) * self.width[index][:, None]
+        ly = np.array([-0.5, -0.5, 0.5, 0.5]) * self.height[index][:, None]
+        return np.stack((x[:, None] + lx * c - ly * s, y[:, None] + lx * s + ly * c), axis=-1)
@@ -0,0 +1,131 @@
+"""Geräte-Bänke für Windturbinen und Wellengeneratoren.
+
+Statt einem Python-Objekt pro Gerät hält jede Bank Position, Blattwinkel,
+Wirkungsgrad und Gesundheit in zusammenhängenden NumPy-Arrays. Update und
+Energieberechnung laufen so in einem Array-Durchgang, egal ob die Plattform
+zwei oder ein ganzer Park mehrere tausend Geräte trägt. Die Leistung kommt
+aus tabellierten Leistungskurven (siehe ``power_curves``).
+"""
+
+import numpy as np
+
+from .colors import DARK_GRAY, GRAY, WHITE
+from .power_curves import load_curve
+
+
+class TurbineBank:
+    """Windturbinen als Struct-of-Arrays."""
+
+    __slots__ = ("x", "y", "radius", "blades_rotation", "efficiency", "health", "curve")
+
+    def __init__(self, x, y, radius=20, efficiency=0.9, health=100.0, curve=None):
+        self.x = np.asarray(x, dtype=np.float64).copy()
+        self.y = np.asarray(y, dtype=np.float64).copy()
+        n = len(self.x)
+        self.radius = radius
+        self.blades_rotation = np.zeros(n)
+        self.efficiency = np.full(n, efficiency, dtype=np.float64)
+        self.health = np.full(n, health, dtype=np.float64)
+        self.curve = curve if curve is not None else load_curve("wind_turbine")
+
+    def __len__(self):
+        return len(self.x)
+
+    def update(self, wind_speed, wind_direction, frames=1):
+        # Rotationsgeschwindigkeit basierend auf Wind und Ausrichtung
+        # (Skalar für die ganze Plattform oder ein Wert je Turbine)
+        wind_factor = wind_speed * np.abs(np.cos(np.radians(wind_direction)))
+        self.blades_rotation += wind_factor * 5 * frames
+        if frames == 1:
+            self.blades_rotation[self.blades_rotation > 360] -= 360
+        else:
+            np.mod(self.blades_rotation, 360, out=self.blades_rotation)
+
+        # Turbine wird durch Winde oberhalb der Abschaltgeschwindigkeit beschädigt
+        damaged = np.broadcast_to(np.asarray(wind_speed) > self.curve.cut_out, self.health.shape)
+        if damaged.any():
+            self.health[damaged] -= 0.1 * frames
+            self.efficiency[damaged] = np.maximum(0.5, self.health[damaged] / 100)
+
+    def energy(self, wind_speed):
+        return float(np.sum(self.efficiency * self.curve(wind_speed)))
+
+    def annual_energy(self, wind_series, dt_hours=1.0):
+        """Jahresenergie in kWh aus einer Windzeitreihe (Zeit oder Zeit x Turbine)."""
+        speeds = np.asarray(wind_series, dtype=np.float64)
+        if speeds.ndim == 1:
+            speeds = speeds[:, None]
+        return self.curve.annual_energy(speeds, dt_hours, self.efficiency)
+
+    def draw(self, surface):
+        import pygame
+
+        hub_y = self.y - 30
+        angles = np.radians(self.blades_rotation[:, None] + np.array([0, 120, 240]))
+        end_x = self.x[:, None] + np.cos(angles) * self.radius
+        end_y = hub_y[:, None] + np.sin(angles) * self.radius
+        for i in range(len(self)):
+            x, y = self.x[i], hub_y[i]
+            # Turm
+            pygame.draw.rect(surface, DARK_GRAY, (x - 5, y, 10, 30))
+            # Propellergehäuse
+            pygame.draw.circle(surface, GRAY, (x, y), 8)
+            # Propellerblätter
+            for j in range(3):
+                pygame.draw.line(surface, WHITE, (x, y), (end_x[i, j], end_y[i, j]), 3)
+
+
+class WaveGeneratorBank:
+    """Wellengeneratoren als Struct-of-Arrays."""
+
+    __slots__ = ("x", "y", "width", "height", "efficiency", "health", "curve")
+
+    def __init__(self, x, y, width=40, height=20, efficiency=0.85, health=100.0, curve=None):
+        self.x = np.asarray(x, dtype=np.float64).copy()
+        self.y = np.asarray(y, dtype=np.float64).copy()
+        n = len(self.x)
+        self.width = width
+        self.height = height
+        self.efficiency = np.full(n, efficiency, dtype=np.float64)
+        self.health = np.full(n, health, dtype=np.float64)
+        self.curve = curve if curve is not None else load_curve("wave_generator")
+
+    def __len__(self):
+        return len(self.x)
+
+    def update(self, wave_amplitude, frames=1):
+        # Generatoreffizienz sinkt mit der Zeit
+        self.health -= 0.005 * frames
+        np.maximum(0.6, self.health / 100, out=self.efficiency)
+
+    def energy(self, wave_factor):
+        return float(np.sum(self.efficiency * self.curve(wave_factor)))
+
+    def draw(self, surface):
+        import pygame
+
+        left = self.x - self.width // 2
+        top = self.y - self.height // 2
+        fraction = self.health / 100
+        for i in range(len(self)):
+            pygame.draw.rect(surface, DARK_GRAY, (left[i], top[i], self.width, self.height))
+            # Statusanzeige
+            health_color = (int(255 * (1 - fraction[i])), int(255 * fraction[i]), 0)
+            pygame.draw.rect(surface, health_color, (left[i], top[i] - 5,
+                                                   self.width * fraction[i], 3))
+
+
+# Energieproduktion berechnen
+def energy_output(turbines, generators, wind_speed, wave_factor):
+    return round(turbines.energy(wind_speed) + generators.energy(wave_factor), 2)
+
+
+def platform_devices(platform_x, platform_y, platform_width, platform_height):
+    """Standardbestückung der Plattform aus 7.py: je zwei Turbinen und Generatoren."""
+    turbines = TurbineBank(
+        [platform_x + 100, platform_x + platform_width - 100],
+        [platform_y, platform_y])
+    generators = WaveGeneratorBank(
+        [platform_x + 150, platform_x + platform_width - 150],
+        [platform_y + platform_height // 2 + 20] * 2)
+    return turbines, generators
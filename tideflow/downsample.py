@@ -0,0 +1,155 @@
+"""Ausdünnen langer Zeitreihen für die Darstellung.
+
+``lttb`` wählt mit Largest-Triangle-Three-Buckets so viele Punkte aus, wie
+der Graph Pixel breit ist, und erhält dabei Spitzen und Knicke.
+``SummaryPyramid`` fasst eine laufende Messreihe auf mehreren Auflösungen
+zusammen (Minimum, Maximum, Mittel je Bucket; jede Stufe ``factor``-mal
+gröber). Jede Stufe behält höchstens ``capacity`` Buckets, die gröbste reicht
+immer bis zum Anfang des Laufs zurück. Der Speicher ist damit beschränkt, und
+jeder Zeitbereich lässt sich in passender Auflösung abfragen.
+"""
+
+import numpy as np
+
+
+def lttb(x, y, threshold):
+    """Indizes der ``threshold`` nach LTTB ausgewählten Punkte (erster und letzter inklusive)."""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # Innere Punkte gleichmäßig auf threshold - 2 Buckets verteilen
+    edges = (np.arange(threshold - 1) * (n - 2) / (threshold - 2)).astype(np.int64) + 1
+    edges[-1] = n - 1
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # Mittelpunkt des nächsten Buckets (beim letzten: der letzte Punkt)
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        if i + 2 < len(edges):
+            cx, cy = x[end:next_end].mean(), y[end:next_end].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        ax, ay = x[a], y[a]
+        # Doppelte Dreiecksfläche zu jedem Kandidaten im aktuellen Bucket
+        area = np.abs((ax - cx) * (y[start:end] - ay) - (ax - x[start:end]) * (cy - ay))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+class _Level:
+    # Ringpuffer als doppelt so großes Array, das beim Überlaufen zusammengeschoben wird
+    __slots__ = ("t", "lo", "hi", "mean", "start", "end", "capacity", "last")
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.t = np.empty(2 * capacity, dtype=np.int64)
+        self.lo = np.empty(2 * capacity)
+        self.hi = np.empty(2 * capacity)
+        self.mean = np.empty(2 * capacity)
+        self.start = self.end = 0
+        self.last = None  # letzter Schritt im jüngsten Bucket
+
+    def __len__(self):
+        return self.end - self.start
+
+    def push(self, t, lo, hi, mean, last):
+        if self.end == len(self.t):
+            keep = slice(self.end - self.capacity + 1, self.end)
+            for array in (self.t, self.lo, self.hi, self.mean):
+                array[:self.capacity - 1] = array[keep]
+            self.start, self.end = 0, self.capacity - 1
+        i = self.end
+        self.t[i], self.lo[i], self.hi[i], self.mean[i] = t, lo, hi, mean
+        self.end += 1
+        self.last = last
+        if self.end - self.start > self.capacity:
+            self.start += 1
+
+    def first(self):
+        return self.t[self.start] if len(self) else None
+
+    def select(self, t0, t1, after=None):
+        # Buckets, die [t0, t1] überlappen; mit after nur die, die danach beginnen
+        t = self.t[self.start:self.end]
+        if after is None:
+            i0 = max(int(np.searchsorted(t, t0, side="right")) - 1, 0)
+        else:
+            i0 = int(np.searchsorted(t, after, side="right"))
+        i1 = int(np.searchsorted(t, t1, side="right"))
+        s = slice(self.start + i0, self.start + max(i0, i1))
+        return self.t[s], self.lo[s], self.hi[s], self.mean[s]
+
+
+class SummaryPyramid:
+    """Messreihe auf mehreren Auflösungen: Stufe 0 roh, Stufe k mit Buckets aus ``factor**k`` Schritten."""
+
+    def __init__(self, capacity=4096, factor=4, max_levels=12):
+        self.capacity = capacity
+        self.factor = factor
+        self.levels = [_Level(capacity)]
+        # Offene Buckets je höherer Stufe: [Start, Min, Max, Summe, Rohwerte, Teil-Buckets, Ende]
+        self._pending = [None] * max_levels
+        self.max_levels = max_levels
+        self.count = 0
+
+    def append(self, t, value):
+        self.levels[0].push(t, value, value, value, t)
+        self.count += 1
+        bucket = (t, value, value, value, 1)
+        for k in range(1, self.max_levels):
+            pending = self._pending[k]
+            start, lo, hi, total, n = bucket
+            if pending is None:
+                pending = self._pending[k] = [start, lo, hi, total, n, 0, t]
+            else:
+                pending[1] = min(pending[1], lo)
+                pending[2] = max(pending[2], hi)
+                pending[3] += total
+                pending[4] += n
+                pending[6] = t
+            pending[5] += 1
+            if pending[5] < self.factor:
+                break
+            # Bucket der Stufe k ist voll: ablegen und an Stufe k + 1 weiterreichen
+            self._pending[k] = None
+            if k == len(self.levels):
+                self.levels.append(_Level(self.capacity))
+            start, lo, hi, total, n, _, last = pending
+            self.levels[k].push(start, lo, hi, total / n, last)
+            bucket = (start, lo, hi, total, n)
+
+    def span(self):
+        """Erster und letzter gespeicherter Schritt."""
+        if not self.count:
+            return None
+        first = min(level.first() for level in self.levels if len(level))
+        return first, self.levels[0].t[self.levels[0].end - 1]
+
+    def query(self, t0, t1, max_points):
+        """Zusammenfassung von ``[t0, t1]`` mit höchstens etwa ``max_points`` Buckets.
+
+        Gewählt wird die feinste Stufe, die ``t0`` noch abdeckt und nicht mehr
+        als ``max_points`` Buckets liefert. Das jüngste Stück, dessen Bucket
+        auf dieser Stufe noch offen ist, kommt aus den feineren Stufen.
+        Rückgabe: ``(stufe, t, min, max, mittel)``.
+        """
+        chosen = len(self.levels) - 1
+        for k, level in enumerate(self.levels):
+            if not len(level) or level.first() > t0:
+                continue
+            if len(level.select(t0, t1)[0]) <= max_points:
+                chosen = k
+                break
+        parts = [self.levels[chosen].select(t0, t1)]
+        last = self.levels[chosen].last
+        for k in range(chosen - 1, -1, -1):
+            if last is None or last >= t1:
+                break
+            parts.append(self.levels[k].select(t0, t1, after=last))
+            last = self.levels[k].last
+        return (chosen,) + tuple(np.concatenate(column) for column in zip(*parts))
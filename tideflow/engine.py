@@ -0,0 +1,455 @@
+"""Headless-Simulationskern für alle Szenarien.
+
+``Simulation.step`` führt genau einen Frame der ursprünglichen Skripte aus -
+ohne Pygame und ohne Matplotlib. Darstellung und Eingabe liegen in ``view``.
+Mit ``Scenario.rates`` laufen die Teilsysteme mit eigenen Taktraten (``scheduler``).
+NumPy wird nur für Szenarien mit Geräte-Bänken geladen.
+"""
+
+import math
+import random
+
+from .geology import MAX_TIEFE, SCHICHTEN, get_current_layer
+from .scenario import DT, get_scenario
+from .scheduler import chance
+
+
+class Simulation:
+    def __init__(self, scenario="7", seed=None, stats=False, metocean=None):
+        if isinstance(scenario, str):
+            scenario = get_scenario(scenario)
+        self.scenario = sc = scenario
+        self.rng = random.Random(seed)
+        if sc.physics == "analytic":
+            from .analytic import AnalyticPlatform
+            self.physics = AnalyticPlatform(sc)
+        else:
+            from .physics import PlatformPhysics
+            self.physics = PlatformPhysics(sc)
+        self.time_step = 0
+
+        # Strömungs- & Wetterparameter
+        self.wave_amplitude = sc.wave_amplitude
+        self.wave_frequency = sc.wave_frequency
+        self.current_speed = sc.current_speed
+        self.wind_speed = sc.wind_speed
+        self.wind_direction = 0  # In Grad (0 = Ost, 90 = Nord, usw.)
+        self.temperature = sc.temperature
+        self.storm_intensity = 0
+        self.storm_rate = sc.storm_rate if sc.storm_rate is not None else (0.002 if sc.weather == "full" else 0.01)
+        self.material_fatigue = 0
+        self.wave_factor_x = 0.0
+        self.wave_factor_y = 0.0
+
+        # Tageszeit und Wettersimulation
+        self.tageszeit = 0  # 0-24 Stunden
+        self.wetterbedingungen = {
+            "regen": 0,  # 0-10 Skala
+            "nebel": 0,  # 0-10 Skala
+            "wolken": 3  # 0-10 Skala
+        }
+
+        # Bohrkopf & Förderung
+        self.bohrtiefe = 0  # Fortschritt des Bohrens in Metern
+        self.bohrgeschwindigkeit = sc.bohrgeschwindigkeit
+        self.bohrer_verschleiss = 0  # Verschleiß des Bohrkopfes
+        self.drill_downtime = 0  # Frames, in denen nach einer Reparatur nicht gebohrt wird
+        self.oelfoerderung = 0  # Menge des geförderten Öls
+        self.reservoir_druck = 100.0  # Anfangsdruck im Reservoir
+        self.current_layer = SCHICHTEN[0]
+
+        # Mehrere Bohrungen in einem räumlichen Untergrundmodell; Bohrtiefe und Verschleiß oben zeigen die erste
+        self.wells = None
+        if sc.wells and sc.drilling == "layered":
+            from .subsurface import field_from_scenario
+            self.wells = field_from_scenario(sc, seed=self.rng.getrandbits(64))
+
+        # Gesundheitszustand von Säulen, Streben und Steigleitungen, 100% zu Beginn
+        self.structure = None
+        if sc.column_health:
+            from .structure import platform_structure
+            self.structure = platform_structure(sc, seed=self.rng.getrandbits(64))
+
+        # Treibgut oder Eisschollen als schwimmende pymunk-Körper, Stöße schwächen die Säulen
+        self.debris = None
+        if sc.debris:
+            if sc.physics != "pymunk":
+                raise ValueError("Treibgut braucht das pymunk-Backend")
+            from .debris import DebrisField
+            self.debris = DebrisField(self.physics, sc, sc.debris, sc.debris_kind,
+                                      seed=self.rng.getrandbits(64), collide=sc.debris_collide)
+
+        if sc.energy == "devices":
+            # NumPy erst laden, wenn das Szenario Geräte-Bänke braucht
+            from .devices import platform_devices
+            self.wind_turbines, self.wave_generators = platform_devices(
+                sc.platform_x, sc.platform_y, sc.platform_width, sc.platform_height)
+        else:
+            self.wind_turbines = self.wave_generators = None
+        self.power = 0.0
+        self.curtailment = 0.0  # Abregelung der Windturbinen (0 = voll im Wind, 1 = aus dem Wind)
+
+        # Stürme, Wetterumschwünge und Reparaturen vorab als Ereignis-Warteschlange
+        self.events = None
+        if sc.events == "poisson":
+            from .events import EventSchedule
+            rates = None
+            if sc.storm_rate is not None:
+                from .events import RATES
+                rates = dict(RATES[sc.weather], storm=sc.storm_rate)
+            self.events = EventSchedule(sc.weather, seed=seed, rates=rates)
+
+        # Laufende Statistiken der Kennzahlen (Mittel, Streuung, Quantile)
+        self.stats = None
+        if stats:
+            from .stats import SimulationStats
+            self.stats = SimulationStats()
+
+        # Gemessene Wetter- und Seegangsreihe (MetOceanStream) statt Random Walk
+        self.metocean = metocean
+        self.tide = 0.0  # Tidenhub in Metern, nur mit Messreihe
+
+        # Eigene Taktrate je Teilsystem (leer: alles im Frame-Takt)
+        self.scheduler = None
+        self._structure_load = None
+        if sc.rates:
+            from .scheduler import MultiRateScheduler
+            self._structure_load = 0.0
+            self.scheduler = MultiRateScheduler(sc.rates, self._subsystems())
+
+    # Steuerung (Tastatur im View, Controller im Headless-Betrieb)
+    def adjust_drill_speed(self, delta):
+        self.bohrgeschwindigkeit = max(0.1, self.bohrgeschwindigkeit + delta)
+
+    def repair_bit(self, downtime=0):
+        self.bohrer_verschleiss = 0
+        self.drill_downtime = downtime
+        if self.wells is not None:
+            self.wells.repair(downtime)
+
+    def curtail(self, fraction):
+        # Turbinenblätter aus dem Wind drehen: weniger Leistung, aber Schutz bei Sturm
+        self.curtailment = min(1.0, max(0.0, fraction))
+
+    def trigger_storm(self):
+        self.storm_intensity = self.rng.uniform(10, 20)
+        self.wind_speed += self.storm_intensity
+        self.wave_amplitude += self.storm_intensity * 0.5
+
+    def adjust_flow(self, current_delta=0.0, wind_delta=0.0):
+        if current_delta:
+            self.current_speed = min(5.0, max(0.5, self.current_speed + current_delta))
+        if wind_delta:
+            self.wind_speed = min(5.0, max(-5.0, self.wind_speed + wind_delta))
+
+    def step(self):
+        sc = self.scenario
+        if self.events is not None:
+            for _, kind, data in self.events.due(self.time_step):
+                self._apply_event(kind, data)
+        if self.scheduler is not None:
+            self.scheduler.step(self, self.time_step)
+            self.time_step += 1
+            if self.stats is not None:
+                self.stats.update(self)
+            return
+        if sc.weather == "full":
+            self._update_sky()
+        self._drive_platform()
+        self._update_weather()
+        if self.structure is not None:
+            self._update_structure()
+        if sc.drilling == "linear":
+            self._drill_linear()
+        elif sc.drilling == "layered":
+            self._drill_layered()
+            self._produce()
+        self.power = self._energy()
+        self.physics.step(DT)
+        self.time_step += 1
+        if self.stats is not None:
+            self.stats.update(self)
+
+    def _subsystems(self):
+        # Teilsysteme in der Reihenfolge von step; jedes rechnet ``frames`` Frames in einem Zug
+        sc = self.scenario
+        systems = []
+        if sc.weather == "full":
+            systems.append(("sky", self._update_sky))
+        systems.append(("drive", self._drive_and_load))
+        systems.append(("weather", self._update_weather))
+        if self.structure is not None:
+            systems.append(("structure", self._update_structure))
+        if sc.drilling == "linear":
+            systems.append(("drilling", self._drill_linear_frames))
+        elif sc.drilling == "layered":
+            systems.append(("drilling", self._drill_layered))
+            systems.append(("reservoir", self._produce))
+        systems.append(("devices", self._update_energy))
+        systems.append(("physics", self._step_physics))
+        return systems
+
+    def run(self, steps):
+        for _ in range(steps):
+            self.step()
+        return self
+
+    def next_event_step(self):
+        """Frame des nächsten vorab geplanten Ereignisses (nur im Poisson-Modus)."""
+        return self.events.next_step() if self.events is not None else None
+
+    def _apply_event(self, kind, data):
+        if kind == "storm":
+            self._storm(data["intensity"], data["direction"])
+        elif kind == "weather":
+            self._shift_weather(data["wolken"], data["regen"], data["nebel"])
+        elif kind == "repair":
+            # Wartungscrew: verschlissenen Bohrkopf und beschädigte Säulen instand setzen
+            if self.bohrer_verschleiss > 90:
+                self.bohrer_verschleiss = max(0, self.bohrer_verschleiss - 30)
+            if self.wells is not None:
+                self.wells.repair(threshold=90, amount=30)
+            if self.structure is not None:
+                self.structure.repair_damaged()
+
+    def _storm(self, intensity, direction=0.0):
+        self.storm_intensity = intensity
+        self.wind_speed += intensity
+        if self.scenario.weather == "full":
+            self.wind_direction += direction
+            self.wave_amplitude += intensity * 0.3
+
+    def _shift_weather(self, wolken, regen, nebel):
+        w = self.wetterbedingungen
+        w["wolken"] = min(10, max(0, w["wolken"] + wolken))
+        w["regen"] = min(10, max(0, w["regen"] + regen))
+        w["nebel"] = min(10, max(0, w["nebel"] + nebel))
+
+    def _update_sky(self, frames=1):
+        # Tageszeit aktualisieren
+        self.tageszeit = (self.tageszeit + 0.01 * frames) % 24
+
+        # Zufällige Wetteränderungen
+        rng = self.rng
+        if self.events is None and rng.random() < chance(0.005, frames):
+            self._shift_weather(rng.uniform(-2, 2), rng.uniform(-1, 1), rng.uniform(-0.5, 0.5))
+
+    def _drive_platform(self, offset=0.0):
+        sc = self.scenario
+        phase = self.wave_frequency * (self.time_step + offset)
+        if sc.drive == "position":
+            # Plattform bewegt sich auf und ab durch Wellen
+            self.wave_factor_x = math.sin(phase)
+            self.physics.set_height(sc.platform_y + self.wave_factor_x * self.wave_amplitude)
+        elif sc.wave_force == "rectified_xy":
+            # Mehrdimensionale Wellenbewegung, Plattform reagiert auf Wellen und Wind
+            self.wave_factor_x = abs(math.sin(phase))
+            self.wave_factor_y = abs(math.sin(phase * 0.7))
+            wave_force_x = self.wave_factor_x * self.wave_amplitude * 2000
+            wave_force_y = self.wave_factor_y * self.wave_amplitude * 1000
+            wind_force = self.wind_speed * 100 * math.cos(math.radians(self.wind_direction))
+            self.physics.apply_force((wave_force_x + wind_force, wave_force_y))
+        else:
+            wave = math.sin(phase)
+            self.wave_factor_x = abs(wave) if sc.wave_force == "rectified" else wave
+            self.physics.apply_force((self.wave_factor_x * self.wave_amplitude * 2000, 0))
+
+        if sc.wind_tilt:
+            # Wind beeinflusst Plattformneigung leicht
+            self.physics.apply_force((self.wind_speed * 1000, 0), (sc.platform_width // 2, 0))
+        if sc.current_force:
+            # Strömungseinfluss auf Plattform
+            self.physics.apply_force((self.current_speed * 3000, 0))
+        if self.debris is not None:
+            # Treibgut mit derselben Antriebsbeschleunigung wie die Plattform
+            self.debris.drive(self, offset)
+
+    def _update_weather(self, frames=1):
+        if self.metocean is not None:
+            self._update_weather_recorded(frames)
+        elif self.scenario.weather == "full":
+            self._update_weather_full(frames)
+        else:
+            self._update_weather_gusts(frames)
+
+    def _random_walk(self, width, frames):
+        # Summe von ``frames`` gleichverteilten Schritten in [-width, width], ab zwei Frames genähert
+        if frames == 1:
+            return self.rng.uniform(-width, width)
+        return self.rng.gauss(0.0, width * math.sqrt(frames / 3))
+
+    def _storms(self, p, frames, storm):
+        # Stürme mit Wahrscheinlichkeit ``p`` je Frame; über mehrere Frames werden die
+        # Abstände geometrisch gezogen und das Wetter klingt dazwischen ab
+        rng = self.rng
+        if frames == 1:
+            if self.events is None and rng.random() < p:
+                storm()
+            self._decay_weather(1)
+            return
+        decayed, frame = 0, -1
+        while self.events is None:
+            frame += 1 + int(math.log(1.0 - rng.random()) / math.log1p(-p))
+            if frame >= frames:
+                break
+            self._decay_weather(frame - decayed)
+            decayed = frame
+            storm()
+        self._decay_weather(frames - decayed)
+
+    def _decay_weather(self, frames):
+        # Wetterfaktoren abklingen lassen
+        if self.scenario.weather == "full":
+            self.wind_speed = max(2.0, self.wind_speed * 0.995 ** frames)
+            self.wave_amplitude = max(10.0, self.wave_amplitude * 0.998 ** frames)
+        else:
+            self.wind_speed *= 0.98 ** frames
+
+    def _update_weather_gusts(self, frames=1):
+        # Unwetter & Materialermüdung simulieren
+        rng = self.rng
+        self._storms(self.storm_rate, frames, lambda: self._storm(rng.uniform(2, 8)))
+        self.material_fatigue += self.current_speed * 0.001 * frames
+
+        # Temperatur dynamisch verändern
+        if self.scenario.temperature_drift:
+            self.temperature += self._random_walk(0.1, frames)
+
+    def _update_weather_full(self, frames=1):
+        # Unwetter simulieren
+        rng = self.rng
+        self._storms(self.storm_rate, frames, lambda: self._storm(rng.uniform(2, 15), rng.uniform(-30, 30)))
+
+        # Wind-Richtung ändern
+        self.wind_direction = (self.wind_direction + self._random_walk(1, frames)) % 360
+
+    def _update_weather_recorded(self, frames=1):
+        # Wetter aus der Messreihe zum letzten der ``frames`` Frames; fehlende Werte bleiben stehen
+        from .metocean import PIXELS_PER_METER
+
+        for name, value in self.metocean.sample(self.time_step + frames - 1).items():
+            if math.isnan(value):
+                continue
+            if name == "wave_height":
+                self.wave_amplitude = value / 2 * PIXELS_PER_METER
+            else:
+                setattr(self, name, value)
+        if self.scenario.weather == "gusts":
+            self.material_fatigue += self.current_speed * 0.001 * frames
+
+    def _drive_and_load(self, frames=1):
+        # Im Mehrtakt-Betrieb: Antrieb jeden Frame, Wellenlast für das Tragwerk aufsummieren
+        self._drive_platform()
+        if self._structure_load is not None:
+            self._structure_load += (self.wave_factor_x + self.wave_factor_y) * 0.01
+
+    def _update_structure(self, frames=1):
+        # Materialermüdung aller Bauteile aus der Wellenbelastung, Reparaturen
+        # werden nur ohne vorab gezogene Ereignisse gewürfelt
+        if self._structure_load is None:
+            stress_factor = (self.wave_factor_x + self.wave_factor_y) * 0.01
+        else:
+            stress_factor, self._structure_load = self._structure_load, 0.0
+        self.structure.update(stress_factor, roll_repairs=self.events is None, frames=frames)
+        if self.debris is not None:
+            self.debris.damage(self.structure)
+
+    def _drill_linear(self):
+        # Bohrkopf bewegt sich nach unten, Öl steigt mit der Tiefe
+        if self.bohrtiefe < MAX_TIEFE:
+            self.bohrtiefe += self.bohrgeschwindigkeit
+            self.oelfoerderung = self.bohrtiefe * 0.002
+        else:
+            self.oelfoerderung = min(self.oelfoerderung + 0.1, 50)  # Maximal 50 Barrel pro Sekunde
+
+        # Ölförderung steigt, sobald der Bohrer tief genug ist
+        if self.bohrtiefe > 1000:
+            self.oelfoerderung += 0.05
+
+    def _drill_linear_frames(self, frames=1):
+        for _ in range(frames):
+            self._drill_linear()
+
+    def _drill_layered(self, frames=1):
+        if self.wells is not None:
+            self._drill_wells(frames)
+            return
+        layer = self.current_layer = get_current_layer(self.bohrtiefe)
+        if self.bohrtiefe < MAX_TIEFE:
+            # Bohrgeschwindigkeit hängt vom Gesteinstyp ab
+            if self.drill_downtime:
+                self.drill_downtime = max(0, self.drill_downtime - frames)
+            elif self.bohrer_verschleiss < 100:  # Bohrer ist noch funktionsfähig
+                widerstand = layer["widerstand"] * self.scenario.widerstand_scale
+                self.bohrtiefe += self.bohrgeschwindigkeit / widerstand * frames
+                self.bohrer_verschleiss += 0.01 * widerstand * frames
+
+        # Bohrkopf-Reparatur wenn stark verschlissen
+        if self.events is None and self.bohrer_verschleiss > 90 and self.rng.random() < chance(0.1, frames):
+            self.bohrer_verschleiss = max(0, self.bohrer_verschleiss - 30)
+
+    def _drill_wells(self, frames=1):
+        # Alle Bohrungen mit derselben Bohrgeschwindigkeit; Reparaturen ohne Ereignisse gewürfelt
+        wells = self.wells
+        wells.drill(self.bohrgeschwindigkeit, self.scenario.widerstand_scale, self.events is None, frames)
+        self.bohrtiefe = float(wells.depth[0])
+        self.bohrer_verschleiss = float(wells.wear[0])
+        self.current_layer = SCHICHTEN[int(wells.layer[0])]
+
+    def _produce(self, frames=1):
+        if self.wells is not None:
+            # Summe aller Bohrungen, Druck im Mittel über die Bohrköpfe
+            self.oelfoerderung = self.wells.produce(frames)
+            self.reservoir_druck = float(self.wells.pressure().mean())
+            return
+        # Öl-Förderung nach dem Erreichen der ölhaltigen Schicht
+        if self.bohrtiefe > SCHICHTEN[2]["tiefe"]:
+            base_rate = self.current_layer["oelgehalt"] * 0.5
+            self.oelfoerderung = base_rate * (self.reservoir_druck / 100)
+            self.reservoir_druck = max(10, self.reservoir_druck - 0.01 * frames)  # Druck nimmt langsam ab
+
+    def _update_energy(self, frames=1):
+        self.power = self._energy(frames)
+
+    def _step_physics(self, substeps=1):
+        # Unterschritte mit der Wellenkraft zum jeweiligen Zeitpunkt; die
+        # Wellenfaktoren des Frames bleiben für die übrigen Teilsysteme stehen
+        if substeps == 1:
+            self.physics.step(DT)
+            return
+        wave_factors = self.wave_factor_x, self.wave_factor_y
+        self.physics.step(DT / substeps)
+        for k in range(1, substeps):
+            self._drive_platform(k / substeps)
+            self.physics.step(DT / substeps)
+        self.wave_factor_x, self.wave_factor_y = wave_factors
+
+    def _energy(self, frames=1):
+        sc = self.scenario
+        if sc.energy == "devices":
+            rotor_wind = self.wind_speed * (1 - self.curtailment)
+            self.wind_turbines.update(rotor_wind, self.wind_direction, frames)
+            self.wave_generators.update(self.wave_amplitude, frames)
+            return round(self.wind_turbines.energy(rotor_wind)
+                         + self.wave_generators.energy(self.wave_factor_x), 2)
+
+        # Wirkungsgradverlust, wenn Temperatur von ~20 °C abweicht
+        efficiency_factor = 1 - 0.002 * abs(self.temperature - 20)
+        power = 5 * self.current_speed**2 * efficiency_factor
+        if sc.energy == "current_wave":
+            power *= self.wave_factor_x  # Wellen verstärken Energieproduktion
+        return round(power, 2)
+
+    # Gezeitenfunktion: einfache Sinusfunktion (12-Stunden-Zyklus)
+    def tide_level(self):
+        if self.metocean is not None:
+            from .metocean import PIXELS_PER_METER
+            return self.tide * PIXELS_PER_METER
+        return 30 * math.sin(self.time_step * 0.0001)
+
+    def water_level(self):
+        sc = self.scenario
+        if sc.water_waves:
+            return sc.column_y + self.tide_level()
+        return sc.height - sc.water_offset + self.wave_amplitude * math.sin(self.wave_frequency * self.time_step)
+
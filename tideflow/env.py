@@ -0,0 +1,409 @@
+"""Umgebungen im Gym-Stil zum Trainieren und Bewerten von Reglern.
+
+``OffshoreEnv`` kapselt eine ``Simulation`` mit ``reset()`` und
+``step(action)`` nach der Gymnasium-Konvention (``obs, reward, terminated,
+truncated, info``). Die Aktion ist ``[bohrgeschwindigkeit, reparatur,
+abregelung]``, die Belohnung gewichtet Energie und Ölförderung. Optional
+liefert die Umgebung verkleinerte Bilder aus ``surfarray`` als Beobachtung.
+
+Für viele Schritte gibt es zwei Vektor-Varianten mit gemeinsamem Aufruf
+(Beobachtungen als (N, D)-Array, automatischer Reset beendeter Episoden):
+``VectorEnv`` verteilt ``OffshoreEnv``-Instanzen auf Worker-Prozesse, und
+``BatchedOffshoreEnv`` rechnet die Dynamik von Szenario 7 ohne Plattformphysik
+(die weder Beobachtung noch Belohnung beeinflusst) für alle Umgebungen
+gleichzeitig auf NumPy-Arrays.
+"""
+
+import math
+
+import numpy as np
+
+from .geology import MAX_TIEFE, SCHICHTEN
+from .scenario import DT, get_scenario
+
+# Beobachtung: Name und Skalierung auf etwa [0, 1]
+OBSERVATION = (
+    ("bohrtiefe", MAX_TIEFE),
+    ("bohrer_verschleiss", 100.0),
+    ("reservoir_druck", 100.0),
+    ("bohrgeschwindigkeit", 3.0),
+    ("layer", len(SCHICHTEN) - 1),
+    ("wind_speed", 30.0),
+    ("wind_direction_sin", 1.0),
+    ("wind_direction_cos", 1.0),
+    ("wave_amplitude", 30.0),
+    ("wave_factor_x", 1.0),
+    ("wave_factor_y", 1.0),
+    ("storm_intensity", 15.0),
+    ("turbine_health", 100.0),
+    ("member_health_min", 100.0),
+    ("member_health_mean", 100.0),
+    ("tageszeit", 24.0),
+)
+OBSERVATION_FIELDS = tuple(name for name, _ in OBSERVATION)
+OBSERVATION_SCALE = np.array([scale for _, scale in OBSERVATION], dtype=np.float32)
+
+# Aktion: Bohrgeschwindigkeit, Reparatur (> 0.5 repariert), Abregelung der Turbinen
+ACTION_LOW = np.array([0.1, 0.0, 0.0], dtype=np.float32)
+ACTION_HIGH = np.array([3.0, 1.0, 1.0], dtype=np.float32)
+
+# 1 Barrel/s zählt so viel wie 100 kW
+REWARD_WEIGHTS = {"power": 0.01, "oil": 1.0}
+
+
+def observe(sim):
+    """Beobachtungsvektor einer ``Simulation``."""
+    direction = math.radians(sim.wind_direction)
+    structure = sim.structure
+    turbines = sim.wind_turbines
+    raw = (sim.bohrtiefe, sim.bohrer_verschleiss, sim.reservoir_druck, sim.bohrgeschwindigkeit,
+           SCHICHTEN.index(sim.current_layer), sim.wind_speed, math.sin(direction), math.cos(direction),
+           sim.wave_amplitude, sim.wave_factor_x, sim.wave_factor_y, sim.storm_intensity,
+           float(turbines.health.mean()) if turbines is not None else 100.0,
+           float(structure.health.min()) if structure is not None else 100.0,
+           float(structure.health.mean()) if structure is not None else 100.0,
+           sim.tageszeit)
+    return np.array(raw, dtype=np.float32) / OBSERVATION_SCALE
+
+
+class OffshoreEnv:
+    """Eine Simulation als Umgebung; ``frame_skip`` Frames je Aktion."""
+
+    def __init__(self, scenario="7", seed=None, frame_skip=4, max_steps=36000, repair_downtime=600,
+                 pixels=None, reward_weights=None):
+        self.scenario = get_scenario(scenario) if isinstance(scenario, str) else scenario
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.repair_downtime = repair_downtime
+        self.pixels = pixels  # (Breite, Höhe) oder None
+        self.reward_weights = dict(REWARD_WEIGHTS, **(reward_weights or {}))
+        self._seed = seed
+        self._episode = 0
+        self.sim = None
+        self._view = None
+
+    def _observation(self):
+        state = observe(self.sim)
+        if self.pixels is None:
+            return state
+        return {"state": state, "pixels": self.render()}
+
+    def render(self):
+        """Verkleinertes RGB-Bild des aktuellen Frames, Form (Höhe, Breite, 3)."""
+        import os
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        import pygame
+
+        from .view import View
+
+        if self._view is None or self._view.sim is not self.sim:
+            self._view = View(self.sim, offscreen=True)
+        self._view.draw()
+        small = pygame.transform.smoothscale(self._view.screen, self.pixels or self._view.screen.get_size())
+        return pygame.surfarray.array3d(small).transpose(1, 0, 2)
+
+    def reset(self, seed=None):
+        from .engine import Simulation
+
+        if seed is not None:
+            self._seed, self._episode = seed, 0
+        episode_seed = None if self._seed is None else self._seed + self._episode
+        self._episode += 1
+        self.sim = Simulation(self.scenario, episode_seed)
+        self.steps = 0
+        return self._observation(), {}
+
+    def step(self, action):
+        sim = self.sim
+        speed, repair, curtail = np.clip(np.asarray(action, dtype=np.float64), ACTION_LOW, ACTION_HIGH)
+        sim.bohrgeschwindigkeit = float(speed)
+        sim.curtail(float(curtail))
+        if repair > 0.5:
+            sim.repair_bit(self.repair_downtime)
+
+        power = oil = 0.0
+        for _ in range(self.frame_skip):
+            sim.step()
+            power += sim.power
+            oil += sim.oelfoerderung
+        self.steps += self.frame_skip
+        reward = self.reward_weights["power"] * power + self.reward_weights["oil"] * oil
+        # Versagen des Tragwerks beendet die Episode
+        terminated = sim.structure is not None and float(sim.structure.health.min()) <= 0.0
+        truncated = self.steps >= self.max_steps
+        return self._observation(), reward, terminated, truncated, {"power": power * DT, "oil": oil * DT}
+
+    def close(self):
+        if self._view is not None:
+            self._view.close()
+            self._view = None
+
+
+def _stack(observations):
+    if isinstance(observations[0], dict):
+        return {key: np.stack([o[key] for o in observations]) for key in observations[0]}
+    return np.stack(observations)
+
+
+class _EnvGroup:
+    # Mehrere Umgebungen mit automatischem Reset; läuft im Hauptprozess oder im Worker
+    def __init__(self, kwargs_list):
+        self.envs = [OffshoreEnv(**kwargs) for kwargs in kwargs_list]
+
+    def reset(self, seeds):
+        return [env.reset(seed)[0] for env, seed in zip(self.envs, seeds)]
+
+    def step(self, actions):
+        results = []
+        for env, action in zip(self.envs, actions):
+            obs, reward, terminated, truncated, info = env.step(action)
+            if terminated or truncated:
+                info["final_observation"] = obs
+                obs, _ = env.reset()
+            results.append((obs, reward, terminated, truncated, info))
+        return results
+
+    def close(self):
+        for env in self.envs:
+            env.close()
+
+
+def _worker(conn, kwargs_list):
+    group = _EnvGroup(kwargs_list)
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == "close":
+                break
+            conn.send(getattr(group, command)(data))
+    finally:
+        group.close()
+        conn.close()
+
+
+class VectorEnv:
+    """``n`` ``OffshoreEnv`` mit einem Aufruf; ``workers > 0`` verteilt sie auf Prozesse."""
+
+    def __init__(self, n, workers=0, seed=None, **env_kwargs):
+        self.n = n
+        self.seed = seed
+        kwargs_list = [dict(env_kwargs) for _ in range(n)]
+        self._local = None
+        self._pipes = []
+        self._processes = []
+        if not workers:
+            self._local = _EnvGroup(kwargs_list)
+            return
+        import multiprocessing
+
+        chunks = np.array_split(np.arange(n), min(workers, n))
+        for chunk in chunks:
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_worker, args=(child, [kwargs_list[i] for i in chunk]),
+                                              daemon=True)
+            process.start()
+            child.close()
+            self._pipes.append((parent, chunk))
+            self._processes.append(process)
+
+    def _call(self, command, per_env):
+        if self._local is not None:
+            return getattr(self._local, command)(per_env)
+        for parent, chunk in self._pipes:
+            parent.send((command, [per_env[i] for i in chunk]))
+        results = []
+        for parent, _ in self._pipes:
+            results.extend(parent.recv())
+        return results
+
+    def reset(self, seed=None):
+        seed = self.seed if seed is None else seed
+        seeds = [None if seed is None else seed + i * 1_000_003 for i in range(self.n)]
+        return _stack(self._call("reset", seeds)), {}
+
+    def step(self, actions):
+        results = self._call("step", list(np.asarray(actions)))
+        obs, rewards, terminated, truncated, infos = zip(*results)
+        return (_stack(obs), np.array(rewards), np.array(terminated), np.array(truncated),
+                {"episode_info": infos})
+
+    def close(self):
+        if self._local is not None:
+            self._local.close()
+        for parent, _ in self._pipes:
+            parent.send(("close", None))
+        for process in self._processes:
+            process.join()
+
+
+class BatchedOffshoreEnv:
+    """Szenario 7 für ``n`` Umgebungen als NumPy-Zustand, ohne Plattformphysik.
+
+    Übernimmt Wetter, Stürme, Bohrung, Förderung, Tragwerk und Geräte aus
+    ``Simulation`` (Szenario 7, Ereignisse gewürfelt); Wolken, Regen und Nebel
+    sind reine Darstellung und fehlen.
+    """
+
+    def __init__(self, n, seed=None, frame_skip=4, max_steps=36000, repair_downtime=600,
+                 reward_weights=None, scenario="7"):
+        from .devices import platform_devices
+        from .structure import platform_structure
+
+        sc = get_scenario(scenario) if isinstance(scenario, str) else scenario
+        if sc.weather != "full" or sc.energy != "devices" or sc.drilling != "layered" \
+                or sc.events != "roll" or sc.rates or sc.wells or sc.debris:
+            raise ValueError("BatchedOffshoreEnv bildet nur Szenarien wie 7 nach")
+        self.scenario = sc
+        self.n = n
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.repair_downtime = repair_downtime
+        self.reward_weights = dict(REWARD_WEIGHTS, **(reward_weights or {}))
+        self.rng = np.random.default_rng(seed)
+
+        turbines, generators = platform_devices(sc.platform_x, sc.platform_y, sc.platform_width, sc.platform_height)
+        self.wind_curve, self.wave_curve = turbines.curve, generators.curve
+        self.n_turbines, self.n_generators = len(turbines), len(generators)
+        self.member_weight = platform_structure(sc).weight if sc.column_health else np.zeros(0)
+        self.tops = np.array([layer["tiefe"] for layer in SCHICHTEN], dtype=np.float64)
+        self.widerstand = np.array([layer["widerstand"] for layer in SCHICHTEN], dtype=np.float64) * sc.widerstand_scale
+        self.storm_rate = sc.storm_rate if sc.storm_rate is not None else 0.002
+        self.oelgehalt = np.array([layer["oelgehalt"] for layer in SCHICHTEN], dtype=np.float64)
+        self._allocate()
+
+    def _allocate(self):
+        n = self.n
+        for name in ("t", "steps", "downtime", "layer"):
+            setattr(self, name, np.zeros(n, dtype=np.int64))
+        for name in ("tageszeit", "wind_speed", "wind_direction", "wave_amplitude", "storm_intensity",
+                     "wave_factor_x", "wave_factor_y", "bohrtiefe", "bohrer_verschleiss", "reservoir_druck",
+                     "oelfoerderung", "bohrgeschwindigkeit", "curtailment", "power"):
+            setattr(self, name, np.zeros(n))
+        self.turbine_health = np.zeros((n, self.n_turbines))
+        self.turbine_efficiency = np.zeros((n, self.n_turbines))
+        self.generator_health = np.zeros((n, self.n_generators))
+        self.generator_efficiency = np.zeros((n, self.n_generators))
+        self.member_health = np.zeros((n, len(self.member_weight)))
+
+    def _reset_where(self, mask):
+        sc = self.scenario
+        for name in ("t", "steps", "downtime", "layer", "tageszeit", "wind_direction", "storm_intensity",
+                     "wave_factor_x", "wave_factor_y", "bohrtiefe", "bohrer_verschleiss", "oelfoerderung",
+                     "curtailment", "power"):
+            getattr(self, name)[mask] = 0
+        self.wind_speed[mask] = sc.wind_speed
+        self.wave_amplitude[mask] = sc.wave_amplitude
+        self.reservoir_druck[mask] = 100.0
+        self.bohrgeschwindigkeit[mask] = sc.bohrgeschwindigkeit
+        self.turbine_health[mask] = 100.0
+        self.turbine_efficiency[mask] = 0.9
+        self.generator_health[mask] = 100.0
+        self.generator_efficiency[mask] = 0.85
+        self.member_health[mask] = 100.0
+
+    def observe(self):
+        direction = np.radians(self.wind_direction)
+        members = self.member_health if self.member_health.shape[1] else np.full((self.n, 1), 100.0)
+        raw = np.stack([self.bohrtiefe, self.bohrer_verschleiss, self.reservoir_druck, self.bohrgeschwindigkeit,
+                        self.layer, self.wind_speed, np.sin(direction), np.cos(direction), self.wave_amplitude,
+                        self.wave_factor_x, self.wave_factor_y, self.storm_intensity,
+                        self.turbine_health.mean(axis=1), members.min(axis=1), members.mean(axis=1),
+                        self.tageszeit], axis=1)
+        return raw.astype(np.float32) / OBSERVATION_SCALE
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self._reset_where(np.ones(self.n, dtype=bool))
+        return self.observe(), {}
+
+    def _frame(self):
+        # Ein Frame in der Reihenfolge von Simulation.step
+        rng, n = self.rng, self.n
+        self.tageszeit = (self.tageszeit + 0.01) % 24
+
+        phase = self.scenario.wave_frequency * self.t
+        self.wave_factor_x = np.abs(np.sin(phase))
+        self.wave_factor_y = np.abs(np.sin(phase * 0.7))
+
+        # Stürme und Abklingen des Wetters
+        storm = rng.random(n) < self.storm_rate
+        if storm.any():
+            intensity = rng.uniform(2, 15, n)
+            self.storm_intensity = np.where(storm, intensity, self.storm_intensity)
+            self.wind_speed += np.where(storm, intensity, 0.0)
+            self.wind_direction += np.where(storm, rng.uniform(-30, 30, n), 0.0)
+            self.wave_amplitude += np.where(storm, intensity * 0.3, 0.0)
+        np.maximum(2.0, self.wind_speed * 0.995, out=self.wind_speed)
+        np.maximum(10.0, self.wave_amplitude * 0.998, out=self.wave_amplitude)
+        self.wind_direction = (self.wind_direction + rng.uniform(-1, 1, n)) % 360
+
+        # Tragwerk
+        if self.member_health.shape[1]:
+            stress = (self.wave_factor_x + self.wave_factor_y) * 0.01
+            self.member_health -= stress[:, None] * self.member_weight + 0.001
+            np.maximum(self.member_health, 0.0, out=self.member_health)
+            damaged = self.member_health < 50
+            if damaged.any():
+                self.member_health[damaged & (rng.random(self.member_health.shape) < 0.05)] += 10
+
+        # Bohrung und Förderung
+        layer = self.layer = np.searchsorted(self.tops, self.bohrtiefe, side="right") - 1
+        active = self.bohrtiefe < MAX_TIEFE
+        paused = active & (self.downtime > 0)
+        self.downtime[paused] -= 1
+        drilling = active & ~paused & (self.bohrer_verschleiss < 100)
+        widerstand = self.widerstand[layer]
+        self.bohrtiefe += np.where(drilling, self.bohrgeschwindigkeit / widerstand, 0.0)
+        self.bohrer_verschleiss += np.where(drilling, 0.01 * widerstand, 0.0)
+        producing = self.bohrtiefe > self.tops[2]
+        self.oelfoerderung = np.where(producing, self.oelgehalt[layer] * 0.5 * self.reservoir_druck / 100,
+                                      self.oelfoerderung)
+        self.reservoir_druck = np.where(producing, np.maximum(10, self.reservoir_druck - 0.01), self.reservoir_druck)
+        repaired = (self.bohrer_verschleiss > 90) & (rng.random(n) < 0.1)
+        self.bohrer_verschleiss[repaired] = np.maximum(0, self.bohrer_verschleiss[repaired] - 30)
+
+        # Energie der Geräte
+        rotor_wind = self.wind_speed * (1 - self.curtailment)
+        damaged = rotor_wind > self.wind_curve.cut_out
+        if damaged.any():
+            self.turbine_health[damaged] -= 0.1
+            self.turbine_efficiency[damaged] = np.maximum(0.5, self.turbine_health[damaged] / 100)
+        self.generator_health -= 0.005
+        np.maximum(0.6, self.generator_health / 100, out=self.generator_efficiency)
+        power = (self.turbine_efficiency.sum(axis=1) * self.wind_curve(rotor_wind)
+                 + self.generator_efficiency.sum(axis=1) * self.wave_curve(self.wave_factor_x))
+        self.power = np.round(power, 2)
+        self.t += 1
+
+    def step(self, actions):
+        actions = np.clip(np.asarray(actions, dtype=np.float64), ACTION_LOW, ACTION_HIGH)
+        self.bohrgeschwindigkeit[:] = actions[:, 0]
+        repair = actions[:, 1] > 0.5
+        self.bohrer_verschleiss[repair] = 0
+        self.downtime[repair] = self.repair_downtime
+        self.curtailment[:] = actions[:, 2]
+
+        power = np.zeros(self.n)
+        oil = np.zeros(self.n)
+        for _ in range(self.frame_skip):
+            self._frame()
+            power += self.power
+            oil += self.oelfoerderung
+        self.steps += self.frame_skip
+        rewards = self.reward_weights["power"] * power + self.reward_weights["oil"] * oil
+
+        members = self.member_health if self.member_health.shape[1] else np.full((self.n, 1), 100.0)
+        terminated = members.min(axis=1) <= 0.0
+        truncated = self.steps >= self.max_steps
+        obs = self.observe()
+        info = {"power": power * DT, "oil": oil * DT}
+        done = terminated | truncated
+        if done.any():
+            info["final_observation"] = obs.copy()
+            self._reset_where(done)
+            obs[done] = self.observe()[done]
+        return obs, rewards, terminated, truncated, info
+
+    def close(self):
+        pass
@@ -0,0 +1,131 @@
+"""Vorab gezogene Ereignisse: Stürme, Wetterumschwünge und Reparaturen.
+
+Statt jeden Frame ``random.random() < p`` zu würfeln, werden die Ereignisse als
+Erneuerungsprozess mit geometrisch verteilten Abständen (dem diskreten
+Gegenstück zum Poisson-Prozess bei Frame-Takt) gezogen und mit ihren
+Intensitäten in eine ``heapq``-Warteschlange gelegt. So ist jederzeit bekannt,
+wann das nächste Ereignis kommt, und ``sample_timelines`` zieht ganze
+Zeitleisten für ein Ensemble in einem Aufruf.
+
+Reparaturen sind Besuche einer Wartungscrew: ein Besuch setzt den Bohrkopf
+instand, wenn er stark verschlissen ist, und verstärkt beschädigte Säulen.
+"""
+
+import heapq
+import itertools
+
+import numpy as np
+
+# Ereignisrate pro Frame je Wettermodell
+RATES = {
+    "full": {"storm": 0.002, "weather": 0.005, "repair": 0.05},
+    "gusts": {"storm": 0.01},
+}
+
+# Sturmintensität (gleichverteilt) je Wettermodell
+STORM_INTENSITY = {"full": (2.0, 15.0), "gusts": (2.0, 8.0)}
+
+
+def sample_payload(kind, rng, size, storm_intensity=(2.0, 15.0)):
+    """Intensitäten für ``size`` Ereignisse einer Art als Dict von Arrays."""
+    if kind == "storm":
+        return {"intensity": rng.uniform(*storm_intensity, size),
+                "direction": rng.uniform(-30, 30, size)}
+    if kind == "weather":
+        return {"wolken": rng.uniform(-2, 2, size),
+                "regen": rng.uniform(-1, 1, size),
+                "nebel": rng.uniform(-0.5, 0.5, size)}
+    return {}
+
+
+class EventQueue:
+    """Min-Heap aus ``(frame, laufende Nummer, art, daten)``."""
+
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, step, kind, data=None):
+        heapq.heappush(self._heap, (step, next(self._counter), kind, data or {}))
+
+    def next_step(self):
+        return self._heap[0][0] if self._heap else None
+
+    def pop(self):
+        step, _, kind, data = heapq.heappop(self._heap)
+        return step, kind, data
+
+
+class EventSchedule:
+    """Erneuerungsprozesse je Ereignisart, gespeist aus vorab gezogenen Blöcken."""
+
+    def __init__(self, weather="full", seed=None, rates=None, start=0, chunk=256):
+        self.rates = dict(rates if rates is not None else RATES[weather])
+        self.storm_intensity = STORM_INTENSITY[weather]
+        self.rng = np.random.default_rng(seed)
+        self.chunk = chunk
+        self.queue = EventQueue()
+        self._buffers = {}
+        for kind in self.rates:
+            self._schedule_next(kind, start)
+
+    def _draw(self, kind):
+        # Block aus Abständen und Intensitäten ziehen, dann einzeln abgeben
+        gaps = self.rng.geometric(self.rates[kind], self.chunk)
+        payload = sample_payload(kind, self.rng, self.chunk, self.storm_intensity)
+        for i in range(self.chunk):
+            yield int(gaps[i]), {key: float(values[i]) for key, values in payload.items()}
+
+    def _schedule_next(self, kind, after):
+        if self.rates[kind] <= 0:
+            return
+        buffer = self._buffers.get(kind)
+        item = next(buffer, None) if buffer is not None else None
+        if item is None:
+            buffer = self._buffers[kind] = self._draw(kind)
+            item = next(buffer)
+        gap, data = item
+        self.queue.push(after + gap, kind, data)
+
+    def next_step(self):
+        """Frame des nächsten geplanten Ereignisses oder None."""
+        return self.queue.next_step()
+
+    def due(self, step):
+        """Alle Ereignisse bis einschließlich ``step`` entnehmen und nachplanen."""
+        events = []
+        while self.queue and self.queue.next_step() <= step:
+            event = self.queue.pop()
+            events.append(event)
+            self._schedule_next(event[1], event[0])
+        return events
+
+
+def sample_timelines(n, horizon, weather="full", seed=None, rates=None):
+    """Ereignis-Zeitleisten für ``n`` Ensemble-Mitglieder über ``horizon`` Frames.
+
+    Rückgabe je Ereignisart: ``(steps, mask, payload)``; ``steps`` hat die Form
+    (n, k) mit den Frames der Ereignisse, ``mask`` markiert die gültigen
+    Einträge (< horizon), ``payload`` enthält die Intensitäten als (n, k)-Arrays.
+    Arten mit Rate <= 0 bekommen leere Zeitleisten mit k = 0.
+    """
+    rng = np.random.default_rng(seed)
+    rates = rates if rates is not None else RATES[weather]
+    timelines = {}
+    for kind, rate in rates.items():
+        if rate <= 0:
+            steps = np.zeros((n, 0), dtype=np.int64)
+            payload = sample_payload(kind, rng, (n, 0), STORM_INTENSITY[weather])
+            timelines[kind] = (steps, steps < horizon, payload)
+            continue
+        # Genug Ereignisse für fast sicher den ganzen Horizont (Mittel + 6 Sigma)
+        mean = horizon * rate
+        k = max(1, int(mean + 6 * np.sqrt(mean) + 10))
+        steps = np.cumsum(rng.geometric(rate, (n, k)), axis=1)
+        mask = steps < horizon
+        payload = sample_payload(kind, rng, (n, k), STORM_INTENSITY[weather])
+        timelines[kind] = (steps, mask, payload)
+    return timelines
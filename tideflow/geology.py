@@ -0,0 +1,21 @@
+from .colors import BLUE, BROWN
+
+# Geologische Schichten
+SCHICHTEN = [
+    {"tiefe": 0, "name": "Wasser", "farbe": BLUE, "widerstand": 1, "oelgehalt": 0},
+    {"tiefe": 300, "name": "Sediment", "farbe": BROWN, "widerstand": 3, "oelgehalt": 0.1},
+    {"tiefe": 1000, "name": "Sandstein", "farbe": (194, 178, 128), "widerstand": 8, "oelgehalt": 0.3},
+    {"tiefe": 2000, "name": "Ölreservoir", "farbe": (50, 50, 50), "widerstand": 5, "oelgehalt": 1.0},
+    {"tiefe": 3500, "name": "Grundgestein", "farbe": (100, 100, 100), "widerstand": 15, "oelgehalt": 0.2}
+]
+
+# Maximale Bohrtiefe in Metern
+MAX_TIEFE = 5000
+
+
+# Aktuelle geologische Schicht ermitteln
+def get_current_layer(tiefe):
+    for i in range(len(SCHICHTEN)-1, -1, -1):
+        if tiefe >= SCHICHTEN[i]["tiefe"]:
+            return SCHICHTEN[i]
+    return SCHICHTEN[0]
@@ -0,0 +1,110 @@
+"""Goldene Spuren: Regressionsprüfung der Szenarien mit Durchsatzmessung.
+
+Optimierungen an den heißen Schleifen dürfen die Ergebnisse nicht unbemerkt
+verändern. ``record`` rechnet jedes Szenario headless mit festem Seed und
+speichert alle ``every`` Schritte den Kernzustand (Plattformposition und
+-geschwindigkeit, Winkel, erzeugte Energie, Förderung, Bohrtiefe,
+Bohrerverschleiß, Gesundheit) komprimiert in einer ``.npz``-Datei, zusammen
+mit den gemessenen Schritten pro Sekunde. ``check`` rechnet dieselben Läufe
+erneut, vergleicht Feld für Feld innerhalb der Toleranzen aus ``TOLERANCES``
+und meldet den ersten abweichenden Schritt sowie den Durchsatz im Verhältnis
+zur Aufnahme. Gemessen wird nur ``Simulation.step``, nicht das Abtasten.
+"""
+
+import json
+import time
+
+import numpy as np
+
+from .engine import Simulation
+from .scenario import DT, SCENARIOS
+
+# Feld der Spur: absolute Toleranz
+TOLERANCES = {
+    "x": 1e-6,
+    "y": 1e-6,
+    "vx": 1e-6,
+    "vy": 1e-6,
+    "angle": 1e-9,
+    "energy": 1e-9,
+    "oil": 1e-9,
+    "depth": 1e-9,
+    "bit_wear": 1e-9,
+    "health": 1e-9,
+}
+FIELDS = tuple(TOLERANCES)
+
+
+def _health(sim):
+    # Tragwerk, sonst Windturbinen, sonst Materialermüdung
+    if sim.structure is not None:
+        return float(sim.structure.health.mean())
+    if sim.wind_turbines is not None:
+        return float(sim.wind_turbines.health.mean())
+    return 100.0 - sim.material_fatigue
+
+
+def record_trace(scenario, steps=3600, seed=0, every=30):
+    """Spur (Abtastungen, ``FIELDS``) eines Laufs und Schritte pro Sekunde von ``Simulation.step``."""
+    sim = Simulation(scenario, seed=seed)
+    trace = np.empty((steps // every, len(FIELDS)))
+    energy = oil = 0.0
+    elapsed = 0.0
+    for i in range(len(trace)):
+        start = time.perf_counter()
+        for _ in range(every):
+            sim.step()
+            energy += sim.power
+            oil += sim.oelfoerderung
+        elapsed += time.perf_counter() - start
+        (x, y), (vx, vy) = sim.physics.position, sim.physics.velocity
+        trace[i] = (x, y, vx, vy, sim.physics.angle, energy * DT / 3600, oil * DT,
+                    sim.bohrtiefe, sim.bohrer_verschleiss, _health(sim))
+    return trace, len(trace) * every / elapsed if elapsed else float("inf")
+
+
+def record(path, scenarios=None, steps=3600, seed=0, every=30):
+    """Goldene Spuren aller ``scenarios`` (Standard: alle) nach ``path`` schreiben."""
+    scenarios = list(scenarios or SCENARIOS)
+    traces, rates = {}, {}
+    for name in scenarios:
+        traces[name], rates[name] = record_trace(name, steps, seed, every)
+    meta = {"fields": FIELDS, "steps": steps, "seed": seed, "every": every, "rates": rates}
+    np.savez_compressed(path, meta=json.dumps(meta), **{f"trace_{name}": traces[name] for name in scenarios})
+    return rates
+
+
+def load(path):
+    """Metadaten und Dict Szenario -> Spur."""
+    with np.load(path) as data:
+        meta = json.loads(str(data["meta"]))
+        traces = {key[len("trace_"):]: data[key] for key in data.files if key.startswith("trace_")}
+    return meta, traces
+
+
+def compare(golden, trace, every, scale=1.0):
+    """Größte Abweichung je Feld und erster Schritt außerhalb der Toleranz (``None`` wenn keiner)."""
+    tolerance = np.array([TOLERANCES[field] for field in FIELDS]) * scale
+    deviation = np.abs(trace - golden)
+    # NaN gilt als Abweichung
+    outside = ~(deviation <= tolerance)
+    rows = np.flatnonzero(outside.any(axis=1))
+    first = None if not len(rows) else int((rows[0] + 1) * every)
+    worst = dict(zip(FIELDS, np.nan_to_num(deviation, nan=np.inf).max(axis=0).tolist()))
+    return worst, first
+
+
+def check(path, scenarios=None, scale=1.0):
+    """Läufe aus ``path`` wiederholen; Liste von Dicts je Szenario mit Abweichung und Durchsatz."""
+    meta, traces = load(path)
+    if tuple(meta["fields"]) != FIELDS:
+        raise ValueError(f"{path}: Felder {meta['fields']} passen nicht zu {FIELDS}, neu aufnehmen")
+    results = []
+    for name in scenarios or traces:
+        if name not in traces:
+            raise ValueError(f"{path}: keine Spur für Szenario {name!r}")
+        trace, rate = record_trace(name, meta["steps"], meta["seed"], meta["every"])
+        worst, first = compare(traces[name], trace, meta["every"], scale)
+        results.append({"scenario": name, "ok": first is None, "first": first, "worst": worst,
+                        "rate": rate, "golden_rate": meta["rates"].get(name)})
+    return results
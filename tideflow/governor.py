@@ -0,0 +1,78 @@
+"""Adaptive Darstellungsqualität nach Frame-Zeit-Budget.
+
+Der ``QualityGovernor`` misst die Rechenzeit pro Frame (ohne das Warten in
+``clock.tick``) als gleitenden Mittelwert. Liegt sie länger über dem Budget,
+wird eine Qualitätsstufe heruntergeschaltet; bleibt deutlich Luft, wird
+wieder hochgeschaltet. Die Hysterese verhindert ständiges Hin- und Herspringen.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    name: str
+    rain: float  # Anteil der Regenpartikel
+    clouds: int  # maximale Anzahl Wolken
+    water_step: int  # Breite der Wassersäulen in Pixel
+    plot_interval: int  # Faktor auf das Plot-Intervall des Szenarios
+    iterations: int  # pymunk-Solver-Iterationen
+
+
+LEVELS = (
+    QualityLevel("hoch", rain=1.0, clouds=10, water_step=5, plot_interval=1, iterations=10),
+    QualityLevel("mittel", rain=0.6, clouds=6, water_step=10, plot_interval=2, iterations=8),
+    QualityLevel("niedrig", rain=0.3, clouds=4, water_step=20, plot_interval=4, iterations=6),
+    QualityLevel("minimal", rain=0.0, clouds=2, water_step=40, plot_interval=8, iterations=4),
+)
+
+
+class QualityGovernor:
+    def __init__(self, budget_ms=1000 / 60, levels=LEVELS, smoothing=0.1,
+                 headroom=0.6, degrade_after=10, recover_after=120):
+        self.budget_ms = budget_ms
+        self.levels = levels
+        self.smoothing = smoothing
+        self.headroom = headroom
+        self.degrade_after = degrade_after
+        self.recover_after = recover_after
+        self.level = 0
+        self.frame_ms = None
+        self._over = 0
+        self._under = 0
+
+    @property
+    def knobs(self):
+        return self.levels[self.level]
+
+    @property
+    def label(self):
+        frame_ms = self.frame_ms or 0.0
+        return f"{self.knobs.name} ({frame_ms:.1f}/{self.budget_ms:.1f} ms)"
+
+    def record(self, frame_seconds):
+        """Frame-Zeit melden; gibt True zurück, wenn sich die Stufe geändert hat."""
+        ms = frame_seconds * 1000
+        if self.frame_ms is None:
+            self.frame_ms = ms
+        else:
+            self.frame_ms += self.smoothing * (ms - self.frame_ms)
+
+        if self.frame_ms > self.budget_ms:
+            self._over += 1
+            self._under = 0
+            if self._over >= self.degrade_after and self.level < len(self.levels) - 1:
+                return self._set_level(self.level + 1)
+        elif self.frame_ms < self.budget_ms * self.headroom:
+            self._under += 1
+            self._over = 0
+            if self._under >= self.recover_after and self.level > 0:
+                return self._set_level(self.level - 1)
+        else:
+            self._over = self._under = 0
+        return False
+
+    def _set_level(self, level):
+        self.level = level
+        self._over = self._under = 0
+        return True
@@ -0,0 +1,183 @@
+"""Speicherprofil der Hauptschleife: Allokationen je Phase und Quellzeile, RSS über die Zeit.
+
+Lange Läufe von 7.py erzeugen pro Frame Speicherumschlag (f-Strings, Kopien
+von Deques, neu gerenderte Texte, Tupel in Zeichenaufrufen). ``profile_loop``
+rechnet dieselbe Schleife wie ``view.run``, unterteilt in die Phasen aus
+``PHASES``, und misst mit ``tracemalloc``:
+
+* je Phase und Frame die Spitze über dem Stand zu Phasenbeginn (enthält auch
+  sofort wieder freigegebene Zwischenobjekte) und das Nettowachstum,
+* in jedem ``every``-ten Frame Schnappschüsse an den Phasengrenzen; deren
+  Differenz ordnet Anzahl und Bytes der Allokationen, die die Phase überleben,
+  Quellzeilen zu,
+* alle ``rss_every`` Frames den residenten Speicher des Prozesses und den von
+  ``tracemalloc`` verfolgten Speicher. Eine Steigung über die zweite Hälfte
+  des Laufs deutet auf ein Leck hin.
+
+``tracemalloc`` verlangsamt die Schleife deutlich; die Frame-Raten im
+Profilmodus sind nicht aussagekräftig.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+PHASES = ("events", "step", "record", "draw", "plot", "present")
+
+
+def rss():
+    """Residenter Speicher des Prozesses in Bytes (Linux ``/proc``, sonst Höchststand)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _slope(points):
+    # Steigung der Ausgleichsgeraden durch (x, y)
+    n = len(points)
+    if n < 2:
+        return 0.0
+    mx = sum(x for x, _ in points) / n
+    my = sum(y for _, y in points) / n
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    return sum((x - mx) * (y - my) for x, y in points) / sxx if sxx else 0.0
+
+
+class MemoryProfiler:
+    """Sammelt Phasenstatistiken; ``frame()`` zu Beginn jedes Frames, ``phase(name)`` nach jeder Phase."""
+
+    def __init__(self, every=10, rss_every=60, nframes=1):
+        self.every = every
+        self.rss_every = rss_every
+        self.frames = 0
+        self.profiled = 0
+        self.peak = defaultdict(int)  # Phase -> Summe der Spitzen über alle Frames
+        self.growth = defaultdict(int)  # Phase -> Summe des Nettowachstums
+        self.lines = defaultdict(lambda: [0, 0])  # (Phase, Datei, Zeile) -> [Anzahl, Bytes]
+        self.samples = []  # (Frame, RSS, verfolgter Speicher)
+        self._filters = [tracemalloc.Filter(False, tracemalloc.__file__),
+                         tracemalloc.Filter(False, __file__),
+                         tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+                         tracemalloc.Filter(False, "<unknown>")]
+        self._snapshot = None
+        self._detailed = False
+        self._current = 0
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(nframes)
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def frame(self):
+        """Neuen Frame beginnen; Stand für die erste Phase festhalten."""
+        self.frames += 1
+        if self.frames % self.rss_every == 0:
+            self.samples.append((self.frames, rss(), tracemalloc.get_traced_memory()[0]))
+        self._detailed = self.frames % self.every == 0
+        if self._detailed:
+            self.profiled += 1
+            self._snapshot = self._take_snapshot()
+        tracemalloc.reset_peak()
+        self._current = tracemalloc.get_traced_memory()[0]
+
+    def phase(self, name):
+        """Phase ``name`` ist abgeschlossen; Spitze, Wachstum und ggf. Zeilen verbuchen."""
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak[name] += peak - self._current
+        self.growth[name] += current - self._current
+        if self._detailed:
+            snapshot = self._take_snapshot()
+            for stat in snapshot.compare_to(self._snapshot, "lineno"):
+                if stat.count_diff or stat.size_diff:
+                    frame = stat.traceback[0]
+                    entry = self.lines[name, frame.filename, frame.lineno]
+                    entry[0] += stat.count_diff
+                    entry[1] += stat.size_diff
+            self._snapshot = snapshot
+        tracemalloc.reset_peak()
+        self._current = tracemalloc.get_traced_memory()[0]
+
+    def stop(self):
+        self.samples.append((self.frames, rss(), tracemalloc.get_traced_memory()[0]))
+        tracemalloc.stop()
+
+    def report(self, top=15):
+        """Dict mit Phasen (Bytes je Frame), Quellzeilen (Anzahl und Bytes je Frame) und RSS-Verlauf."""
+        frames = max(1, self.frames)
+        profiled = max(1, self.profiled)
+        phases = {name: {"peak": self.peak[name] / frames, "growth": self.growth[name] / frames}
+                  for name in PHASES if name in self.peak}
+        lines = sorted(((abs(size), phase, filename, lineno, count / profiled, size / profiled)
+                        for (phase, filename, lineno), (count, size) in self.lines.items()), reverse=True)
+        # Lecksuche erst nach dem Einschwingen (zweite Hälfte)
+        late = [sample for sample in self.samples if sample[0] > self.frames / 2]
+        return {
+            "frames": self.frames,
+            "phases": phases,
+            "lines": [{"phase": phase, "file": filename, "line": lineno, "count": count, "bytes": size}
+                      for _, phase, filename, lineno, count, size in lines[:top]],
+            "samples": self.samples,
+            "rss_slope": _slope([(f, r) for f, r, _ in late]),
+            "traced_slope": _slope([(f, t) for f, _, t in late]),
+        }
+
+
+def profile_loop(scenario="7", frames=1800, seed=None, every=10, rss_every=60, window=False, plot=True,
+                 record=None):
+    """Hauptschleife wie ``view.run`` mit ``MemoryProfiler`` über ``frames`` Frames; gibt den Profiler zurück.
+
+    Ohne ``window`` wird offscreen gezeichnet und der Live-Graph mit dem
+    Agg-Backend von Matplotlib gerechnet, ohne Fenster und ohne Ziel-FPS.
+    """
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    if not window:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("MPLBACKEND", "Agg")
+    from .engine import Simulation
+    from .view import View
+
+    sim = Simulation(scenario, seed)
+    recorder = None
+    if record:
+        from .telemetry import TelemetryRecorder
+        recorder = TelemetryRecorder(record, sim, 1)
+    view = View(sim, offscreen=not window, live_plot=plot, recorder=recorder)
+    if not window and plot and sim.scenario.plot:
+        from .plot import LivePlot
+
+        sc = sim.scenario
+        view.plot = LivePlot(sc.plot, sc.history_length, sc.plot_interval)
+    profiler = MemoryProfiler(every, rss_every)
+    try:
+        for _ in range(frames):
+            profiler.frame()
+            frame_start = time.perf_counter()
+            running = view.handle_events()
+            profiler.phase("events")
+            if not running:
+                break
+            sim.step()
+            profiler.phase("step")
+            if recorder is not None:
+                recorder.record()
+                profiler.phase("record")
+            view.draw()
+            profiler.phase("draw")
+            view.update_plot()
+            profiler.phase("plot")
+            if window:
+                view.present(frame_start)
+                profiler.phase("present")
+    finally:
+        profiler.stop()
+        view.close()
+        if recorder is not None:
+            recorder.close()
+    return profiler
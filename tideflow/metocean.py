@@ -0,0 +1,260 @@
+"""Gemessene Wetter- und Seegangsreihen als Antrieb der Simulation.
+
+Boje- oder Hindcast-Daten (Wind, Windrichtung, signifikante Wellenhöhe,
+Wassertemperatur, Tide) werden einmal blockweise aus CSV in eine Binärdatei
+fester Datensatzgröße umgewandelt, wie die Telemetrie mit JSON-Kopf daneben.
+``MetOceanSeries`` liest sie per ``np.memmap``; ``MetOceanStream`` holt
+daraus Blöcke von ``chunk`` Datensätzen, lädt den nächsten Block in einem
+Hintergrund-Thread vor und interpoliert linear auf den Simulationstakt
+(Windrichtung über den kürzeren Bogen). Auch Jahrzehnte stündlicher Daten
+liegen so nie ganz im Speicher.
+"""
+
+import bisect
+import csv
+import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .scenario import DT
+
+# Messgrößen in der Datei; Zeit in Sekunden seit 1970 (UTC)
+FIELDS = ("wind_speed", "wind_direction", "wave_height", "temperature", "tide")
+METOCEAN_DTYPE = np.dtype([("time", "<f8")] + [(name, "<f8") for name in FIELDS])
+
+# Maßstab der Darstellung: 10 Pixel je Meter Wellenamplitude bzw. Tidenhub
+PIXELS_PER_METER = 10.0
+
+
+def header_path(path):
+    return path + ".json"
+
+
+def _parse_times(values):
+    # Sekunden seit 1970 oder ISO-8601-Zeitstempel
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except ValueError:
+        stamps = np.array([v.rstrip("Z") for v in values], dtype="datetime64[s]")
+        return stamps.astype(np.int64).astype(np.float64)
+
+
+def _fill_gaps(column, carry):
+    # Lücken (NaN) mit dem letzten gültigen Wert füllen, auch über Blockgrenzen
+    valid = ~np.isnan(column)
+    if valid.all():
+        return column, column[-1]
+    index = np.where(valid, np.arange(len(column)), -1)
+    np.maximum.accumulate(index, out=index)
+    filled = np.where(index >= 0, column[np.maximum(index, 0)], carry)
+    return filled, filled[-1]
+
+
+def _write_header(path, fields, source):
+    header = {"dtype": np.lib.format.dtype_to_descr(METOCEAN_DTYPE), "fields": list(fields), "source": source}
+    with open(header_path(path), "w", encoding="utf-8") as f:
+        json.dump(header, f)
+
+
+def import_csv(source, path, chunk_rows=65536, missing=("", "NaN", "nan", "MM", "999", "99.0", "9999")):
+    """CSV mit Kopfzeile (``time`` und beliebigen Spalten aus ``FIELDS``) blockweise umwandeln.
+
+    Fehlende Spalten bleiben NaN und werden in der Simulation nicht gesetzt;
+    Lücken innerhalb einer Spalte werden mit dem letzten gültigen Wert gefüllt.
+    Gibt die Zahl der Datensätze zurück.
+    """
+    missing = set(missing)
+    count = 0
+    last_time = -math.inf
+    with open(source, newline="", encoding="utf-8") as f, open(path, "wb") as out:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader)]
+        if "time" not in header:
+            raise ValueError(f"{source}: Spalte 'time' fehlt")
+        columns = {name: header.index(name) for name in FIELDS if name in header}
+        time_column = header.index("time")
+        carry = dict.fromkeys(columns, np.nan)
+        while True:
+            rows = [row for _, row in zip(range(chunk_rows), reader) if row]
+            if not rows:
+                break
+            records = np.zeros(len(rows), dtype=METOCEAN_DTYPE)
+            records["time"] = _parse_times([row[time_column].strip() for row in rows])
+            for name in FIELDS:
+                records[name] = np.nan
+            for name, i in columns.items():
+                values = np.array([np.nan if row[i].strip() in missing else float(row[i]) for row in rows])
+                records[name], carry[name] = _fill_gaps(values, carry[name])
+            if records["time"][0] < last_time or np.any(np.diff(records["time"]) < 0):
+                raise ValueError(f"{source}: Zeitstempel müssen aufsteigend sortiert sein")
+            last_time = records["time"][-1]
+            out.write(records.tobytes())
+            count += len(records)
+    _write_header(path, columns, os.path.basename(source))
+    return count
+
+
+def synthesize(path, years=30, seed=0, step_hours=1.0, chunk_rows=87600):
+    """Synthetische Stundenwerte über ``years`` Jahre, blockweise geschrieben (für Tests und Benchmarks)."""
+    rng = np.random.default_rng(seed)
+    total = int(years * 8760 / step_hours)
+    start = float(np.datetime64("2000-01-01T00:00:00", "s").astype(np.int64))
+    wind = 8.0
+    with open(path, "wb") as out:
+        for i0 in range(0, total, chunk_rows):
+            n = min(chunk_rows, total - i0)
+            hours = (i0 + np.arange(n)) * step_hours
+            # Wind als Random Walk mit Rückstellkraft und Jahresgang
+            steps = rng.normal(0, 0.6, n)
+            wind_series = np.empty(n)
+            for k in range(n):
+                wind += 0.02 * (8.0 - wind) + steps[k]
+                wind = max(0.0, wind)
+                wind_series[k] = wind
+            season = np.cos(2 * np.pi * hours / 8766)
+            records = np.zeros(n, dtype=METOCEAN_DTYPE)
+            records["time"] = start + hours * 3600
+            records["wind_speed"] = wind_series * (1 + 0.25 * season)
+            records["wind_direction"] = (200 + 40 * np.sin(2 * np.pi * hours / 97) + np.cumsum(steps) * 3) % 360
+            records["wave_height"] = 0.5 + 0.025 * records["wind_speed"] ** 2
+            records["temperature"] = 12 - 5 * season + rng.normal(0, 0.3, n)
+            # Halbtägige Mondtide (M2) mit Springtide-Modulation
+            records["tide"] = 2.0 * np.sin(2 * np.pi * hours / 12.42) * (1 + 0.3 * np.cos(2 * np.pi * hours / 354))
+            out.write(records.tobytes())
+    _write_header(path, FIELDS, f"synthetisch, seed={seed}")
+    return total
+
+
+class MetOceanSeries:
+    """Umgewandelte Reihe als Memory-Map; Zeitsuche per Bisektion auf der Datei."""
+
+    def __init__(self, path):
+        with open(header_path(path), encoding="utf-8") as f:
+            header = json.load(f)
+        dtype = np.lib.format.descr_to_dtype([tuple(field) for field in header["dtype"]])
+        if dtype != METOCEAN_DTYPE:
+            raise ValueError(f"{path}: unbekanntes Datenformat")
+        self.fields = tuple(header["fields"])
+        self.source = header.get("source")
+        count = os.path.getsize(path) // METOCEAN_DTYPE.itemsize
+        if not count:
+            raise ValueError(f"{path}: keine Datensätze")
+        self.records = np.memmap(path, dtype=METOCEAN_DTYPE, mode="r", shape=(count,))
+        # Spalte als Sicht, bisect liest nur O(log n) Einträge
+        self.times = self.records["time"]
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def start(self):
+        return float(self.times[0])
+
+    @property
+    def end(self):
+        return float(self.times[-1])
+
+    def locate(self, t):
+        """Index des letzten Datensatzes mit Zeit <= ``t`` (mindestens 0)."""
+        return max(0, bisect.bisect_right(self.times, t) - 1)
+
+    def chunk(self, i0, size):
+        """Datensätze ``i0`` bis ``i0 + size`` (inklusive, für die Interpolation über die Grenze) als Kopie."""
+        block = np.array(self.records[i0:i0 + size + 1])
+        return i0, block["time"], np.column_stack([block[name] for name in FIELDS])
+
+
+class MetOceanStream:
+    """Interpolierte Werte zum Simulationsschritt, mit Vorladen des nächsten Blocks.
+
+    Schritt 0 entspricht der Datenzeit ``start`` (Sekunden seit 1970,
+    Standard: Beginn der Reihe); ein Simulationsschritt rückt die Datenzeit um
+    ``DT * speed`` Sekunden vor. Nach dem Ende der Reihe bleibt der letzte Wert
+    stehen, mit ``loop`` beginnt sie von vorn.
+    """
+
+    def __init__(self, series, start=None, speed=60.0, chunk=4096, prefetch=True, loop=False):
+        self.series = series if isinstance(series, MetOceanSeries) else MetOceanSeries(series)
+        self.start = self.series.start if start is None else float(start)
+        self.seconds_per_step = DT * speed
+        self.chunk_size = chunk
+        self.loop = loop
+        self.fields = self.series.fields
+        self._columns = [FIELDS.index(name) for name in self.fields]
+        self._direction = FIELDS.index("wind_direction")
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="metocean") if prefetch else None
+        self._next = None
+        self.loads = 0
+        self._load(self.series.locate(self.start))
+
+    def _load(self, i0):
+        self._i0, self._times, self._values = self.series.chunk(i0, self.chunk_size)
+        self._cursor = 0
+        self.loads += 1
+        self._next = None
+        i1 = i0 + self.chunk_size
+        if self._executor is not None and i1 < len(self.series) - 1:
+            self._next = (i1, self._executor.submit(self.series.chunk, i1, self.chunk_size))
+
+    def _advance(self, i0):
+        # Vorgeladenen Block übernehmen, sonst synchron lesen (z.B. nach einem Sprung)
+        if self._next is not None and self._next[0] == i0:
+            future = self._next[1]
+            self._next = None
+            self._i0, self._times, self._values = future.result()
+            self._cursor = 0
+            self.loads += 1
+            i1 = i0 + self.chunk_size
+            if i1 < len(self.series) - 1:
+                self._next = (i1, self._executor.submit(self.series.chunk, i1, self.chunk_size))
+        else:
+            self._load(i0)
+
+    def data_time(self, step):
+        t = self.start + step * self.seconds_per_step
+        if self.loop and t > self.series.end:
+            t = self.series.start + (t - self.series.start) % (self.series.end - self.series.start)
+        return t
+
+    def sample(self, step):
+        """Dict der vorhandenen Messgrößen zum Simulationsschritt ``step``."""
+        t = self.data_time(step)
+        times = self._times
+        # Vorwärts innerhalb des Blocks (amortisiert O(1)), sonst Block wechseln
+        if t < times[0] and self._i0 > 0 or t >= times[-1] and self._i0 + len(times) < len(self.series):
+            i0 = self.series.locate(t)
+            if i0 == self._i0 + self.chunk_size:
+                self._advance(i0)
+            else:
+                self._load(i0)
+            times = self._times
+        cursor = self._cursor
+        if times[cursor] > t:
+            cursor = 0
+        while cursor + 1 < len(times) - 1 and times[cursor + 1] <= t:
+            cursor += 1
+        self._cursor = cursor
+
+        values = self._values
+        if cursor + 1 >= len(times) or t <= times[cursor]:
+            row = values[cursor] if t >= times[cursor] else values[0]
+            return {name: float(row[column]) for name, column in zip(self.fields, self._columns)}
+        w = (t - times[cursor]) / (times[cursor + 1] - times[cursor])
+        w = min(1.0, w)
+        a, b = values[cursor], values[cursor + 1]
+        sample = {}
+        for name, column in zip(self.fields, self._columns):
+            if column == self._direction:
+                delta = (b[column] - a[column] + 180) % 360 - 180
+                sample[name] = float((a[column] + w * delta) % 360)
+            else:
+                sample[name] = float(a[column] + w * (b[column] - a[column]))
+        return sample
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,166 @@
+"""Optimierung von Bohrgeschwindigkeit je Schicht und Reparaturschwelle.
+
+Eine Politik besteht aus einer Bohrgeschwindigkeit pro Schicht in
+``SCHICHTEN`` und der Verschleißschwelle, ab der der Bohrkopf instand gesetzt
+wird. Bewertet wird mit dem segmentweisen Bohrmodell aus
+``drilling.py``: entweder die Frames bis zur Zieltiefe (minimieren) oder die
+kumulierte Ölförderung über einen festen Horizont (maximieren).
+
+Die Suche ist eine Mustersuche: je Runde werden alle Nachbarn der besten
+Politik (eine Schicht schneller oder langsamer, Schwelle höher oder tiefer)
+parallel in einem Prozess-Pool bewertet. Bereits bewertete Politiken liegen im
+Cache und werden nie erneut gerechnet; der Cache kann als JSON-Datei zwischen
+Läufen erhalten bleiben.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from .drilling import DrillPolicy, cumulative_oil, drill_profile
+from .geology import MAX_TIEFE, SCHICHTEN
+
+OBJECTIVES = ("time", "oil")
+
+# Grenzen wie bei der Tastatursteuerung (untere) bzw. sinnvoller Obergrenze
+SPEED_RANGE = (0.1, 3.0)
+THRESHOLD_RANGE = (50.0, 99.0)
+
+
+@dataclass(frozen=True)
+class DrillModel:
+    """Feste Annahmen, unter denen Politiken verglichen werden."""
+    max_depth: float = MAX_TIEFE
+    horizon: int = 120000  # Frames für das Öl-Ziel
+    repair_amount: float = 30.0
+    repair_frames: int = 600  # Stillstand je Reparatur
+    wear_exponent: float = 2.0  # schnelleres Bohren verschleißt überproportional
+
+    def policy(self, speeds, threshold):
+        return DrillPolicy(speed=tuple(speeds), repair_threshold=threshold,
+                           repair_amount=self.repair_amount, repair_frames=self.repair_frames,
+                           wear_exponent=self.wear_exponent)
+
+
+def evaluate(model, speeds, threshold, objective="time"):
+    """Kennzahlen einer Politik; läuft auch in den Worker-Prozessen.
+
+    Gerechnet wird nur, was das Ziel braucht: für ``"time"`` der Verlauf bis
+    zur Zieltiefe ohne Ölförderung (``"oil"`` ist dann ``None``), für
+    ``"oil"`` der Verlauf über den Horizont.
+    """
+    policy = model.policy(speeds, threshold)
+    if objective == "time":
+        profile = drill_profile(policy, max_depth=model.max_depth)
+        return {"frames": profile.duration if profile.reached else None,
+                "oil": None, "repairs": profile.repairs}
+    # Nach Erreichen der Zieltiefe bleibt die Tiefe bis zum Horizont konstant
+    profile = drill_profile(policy, max_depth=model.max_depth, max_frames=model.horizon)
+    return {"frames": profile.time_to_depth(model.max_depth) if profile.reached else None,
+            "oil": cumulative_oil(profile, model.horizon),
+            "repairs": profile.repairs}
+
+
+def score(result, objective):
+    # Kleiner ist besser
+    if objective == "time":
+        return result["frames"] if result["frames"] is not None else float("inf")
+    return -result["oil"]
+
+
+def _key(speeds, threshold):
+    return tuple(round(float(s), 4) for s in speeds) + (round(float(threshold), 4),)
+
+
+class PolicyOptimizer:
+    def __init__(self, objective="time", model=DrillModel(), workers=None, cache_path=None):
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unbekanntes Ziel {objective!r}, erlaubt: {', '.join(OBJECTIVES)}")
+        self.objective = objective
+        self.model = model
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_path = cache_path
+        self.cache = {}
+        self.evaluations = 0  # tatsächlich gerechnete Politiken
+        if cache_path and os.path.exists(cache_path):
+            self._load_cache()
+
+    def _cache_file_key(self):
+        # Ergebnisse hängen vom Ziel ab (das Zeit-Ziel rechnet kein Öl)
+        return json.dumps(dict(vars(self.model), objective=self.objective), sort_keys=True)
+
+    def _load_cache(self):
+        with open(self.cache_path, encoding="utf-8") as f:
+            stored = json.load(f).get(self._cache_file_key(), [])
+        self.cache = {tuple(entry["key"]): entry["result"] for entry in stored}
+
+    def save_cache(self):
+        if not self.cache_path:
+            return
+        data = {}
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        data[self._cache_file_key()] = [{"key": list(k), "result": r} for k, r in self.cache.items()]
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def evaluate_many(self, candidates, pool=None):
+        """Politiken ``(speeds, threshold)`` bewerten, nur Cache-Fehlschläge rechnen."""
+        keys = [_key(speeds, threshold) for speeds, threshold in candidates]
+        todo = list(dict.fromkeys(k for k in keys if k not in self.cache))
+        if todo:
+            speeds = [k[:-1] for k in todo]
+            thresholds = [k[-1] for k in todo]
+            models = [self.model] * len(todo)
+            objectives = [self.objective] * len(todo)
+            if pool is None:
+                results = map(evaluate, models, speeds, thresholds, objectives)
+            else:
+                chunksize = max(1, len(todo) // (4 * self.workers))
+                results = pool.map(evaluate, models, speeds, thresholds, objectives, chunksize=chunksize)
+            for key, result in zip(todo, results):
+                self.cache[key] = result
+            self.evaluations += len(todo)
+        return [self.cache[k] for k in keys]
+
+    def _neighbours(self, speeds, threshold, step, threshold_step):
+        low, high = SPEED_RANGE
+        for i in range(len(speeds)):
+            for sign in (-1, 1):
+                candidate = list(speeds)
+                candidate[i] = float(np.clip(candidate[i] * (1 + sign * step), low, high))
+                yield candidate, threshold
+        for sign in (-1, 1):
+            yield list(speeds), float(np.clip(threshold + sign * threshold_step, *THRESHOLD_RANGE))
+
+    def optimize(self, start=None, threshold=90.0, rounds=50, step=0.5, threshold_step=8.0, min_step=0.01):
+        """Mustersuche ab ``start`` (Standard: 0.5 in jeder Schicht).
+
+        Rückgabe: ``(speeds, threshold, result)`` der besten Politik.
+        """
+        best = [0.5] * len(SCHICHTEN) if start is None else [float(s) for s in start]
+        best_threshold = threshold
+        pool = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        try:
+            best_result = self.evaluate_many([(best, best_threshold)], pool)[0]
+            for _ in range(rounds):
+                candidates = list(self._neighbours(best, best_threshold, step, threshold_step))
+                results = self.evaluate_many(candidates, pool)
+                scores = [score(r, self.objective) for r in results]
+                i = int(np.argmin(scores))
+                if scores[i] < score(best_result, self.objective):
+                    (best, best_threshold), best_result = candidates[i], results[i]
+                else:
+                    # Keine Verbesserung: Schrittweite verkleinern
+                    step, threshold_step = step / 2, threshold_step / 2
+                    if step < min_step:
+                        break
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        self.save_cache()
+        return _key(best, best_threshold)[:-1], best_threshold, best_result
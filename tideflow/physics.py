@@ -0,0 +1,180 @@
+"""Pymunk-Aufbau der Plattform für ein Szenario.
+
+Mit ``Scenario.physics_threads`` rechnet ``space.step`` im Thread-Modus von
+pymunk (Chipmunks ``cpHastySpace``). pymunk nutzt höchstens zwei Fäden und
+unter Windows keinen; mit zwei Fäden ist der Lauf nicht mehr bitgenau
+reproduzierbar. ``0`` wählt die schnellere Fadenzahl während des Laufs
+(``ThreadTuner``).
+"""
+
+import time
+
+import pymunk
+
+from .scenario import DT
+
+MAX_THREADS = 2  # Obergrenze von pymunk
+AUTO_MIN_BODIES = 200  # kleinere Szenen rechnen im Automatikmodus immer mit einem Faden
+AUTO_TRIAL_STEPS = 60  # Probeschritte je Messung, abwechselnd mit einem und zwei Fäden
+AUTO_RECHECK = 600  # Schritte zwischen zwei Prüfungen der Körperzahl
+AUTO_MIN_GAIN = 0.1  # zwei Fäden nur bei mindestens 10 % kürzerer Schrittzeit (kosten Reproduzierbarkeit)
+
+
+class ThreadTuner:
+    """Wählt die schnellere Fadenzahl für ``space.step`` anhand abwechselnder Probeschritte.
+
+    Zwei Fäden nur, wenn sie mindestens ``AUTO_MIN_GAIN`` schneller sind.
+    Gemessen wird erneut, sobald sich die Zahl der Körper im ``Space`` seit der
+    letzten Messung verdoppelt oder halbiert hat; unter ``min_bodies`` Körpern
+    bleibt es bei einem Faden.
+    """
+
+    def __init__(self, space, min_bodies=AUTO_MIN_BODIES, trial_steps=AUTO_TRIAL_STEPS, recheck=AUTO_RECHECK):
+        self.space = space
+        self.min_bodies = min_bodies
+        self.trial_steps = trial_steps
+        self.recheck = recheck
+        self.steps = 0
+        self.bodies = 0  # Körperzahl bei der letzten Messung
+        self.timings = None  # laufende Messung: Fäden -> Sekunden
+        self.trial = 0
+        self.choices = []  # (Körper, Fäden, µs je Schritt mit 1 Faden, mit 2 Fäden)
+        space.threads = 1
+
+    def step(self, dt):
+        space = self.space
+        if self.timings is None and self.steps % self.recheck == 0:
+            bodies = len(space.bodies)
+            if bodies < self.min_bodies:
+                space.threads = 1
+            elif not self.bodies / 2 <= bodies <= self.bodies * 2:
+                self.timings = {1: 0.0, MAX_THREADS: 0.0}
+                self.trial = 0
+                self.bodies = bodies
+        self.steps += 1
+        if self.timings is None:
+            space.step(dt)
+            return
+
+        # Probeschritt, abwechselnd mit einem und zwei Fäden
+        threads = 1 if self.trial % 2 == 0 else MAX_THREADS
+        space.threads = threads
+        start = time.perf_counter()
+        space.step(dt)
+        self.timings[threads] += time.perf_counter() - start
+        self.trial += 1
+        if self.trial >= 2 * self.trial_steps:
+            single, threaded = self.timings[1], self.timings[MAX_THREADS]
+            best = MAX_THREADS if threaded < single * (1 - AUTO_MIN_GAIN) else 1
+            space.threads = best
+            self.choices.append((self.bodies, best, single / self.trial_steps * 1e6,
+                                 threaded / self.trial_steps * 1e6))
+            self.timings = None
+
+
+class PlatformPhysics:
+    """Plattform an statischen Säulen in einem pymunk-``Space``."""
+
+    def __init__(self, scenario, threads=None):
+        sc = scenario
+        threads = sc.physics_threads if threads is None else threads
+        if not 0 <= threads <= MAX_THREADS:
+            raise ValueError(f"physics_threads muss 0 (automatisch), 1 oder {MAX_THREADS} sein, nicht {threads}")
+        # Den Thread-Modus nur bei Bedarf, damit die Standardläufe bitgenau bleiben
+        self.space = space = pymunk.Space(threaded=threads != 1)
+        space.gravity = (0, 1000)
+        self.tuner = None
+        if threads == 0:
+            self.tuner = ThreadTuner(space)
+        elif threads > 1:
+            space.threads = threads
+
+        # Statische Säulen als Verankerung
+        self.column_bodies = []
+        self.column_shapes = []
+        if sc.column_bodies:
+            for i in range(sc.num_columns):
+                column_body = pymunk.Body(body_type=pymunk.Body.STATIC)
+                column_body.position = (sc.column_x(i), sc.column_y + sc.column_height // 2)
+                column_shape = pymunk.Poly.create_box(column_body, (sc.column_radius, sc.column_height))
+                if sc.column_elasticity is not None:
+                    column_shape.elasticity = sc.column_elasticity
+                if sc.column_friction is not None:
+                    column_shape.friction = sc.column_friction
+                space.add(column_body, column_shape)
+                self.column_bodies.append(column_body)
+                self.column_shapes.append(column_shape)
+
+        # Dynamische Plattform
+        size = (sc.platform_width, sc.platform_height)
+        self.platform_body = pymunk.Body(sc.platform_mass, pymunk.moment_for_box(sc.platform_mass, size))
+        self.platform_body.position = (sc.platform_x + sc.platform_width // 2, sc.platform_y)
+        self.platform_shape = pymunk.Poly.create_box(self.platform_body, size)
+        if sc.platform_elasticity is not None:
+            self.platform_shape.elasticity = sc.platform_elasticity
+        if sc.platform_friction is not None:
+            self.platform_shape.friction = sc.platform_friction
+        space.add(self.platform_body, self.platform_shape)
+
+        # Verbindung Plattform - Säulen
+        self.joints = []
+        for i, column_body in enumerate(self.column_bodies):
+            if sc.joint == "pin":
+                joint = pymunk.PinJoint(self.platform_body, column_body, (0, 0), (0, sc.column_height // 2))
+            elif sc.joint == "slide":
+                joint = pymunk.SlideJoint(self.platform_body, column_body, (0, 0),
+                                          (0, sc.column_height // 2), 0, sc.slide_max)
+            elif sc.joint == "spring":
+                joint = pymunk.DampedSpring(
+                    self.platform_body, column_body,
+                    ((-sc.platform_width // 2) + (i + 0.5) * sc.column_spacing, 0),
+                    (0, -sc.column_height // 2),
+                    0, sc.spring_stiffness, sc.spring_damping)  # Länge, Steifheit, Dämpfung
+            elif sc.joint == "none":
+                continue
+            else:
+                raise ValueError(f"Unbekannter Gelenktyp {sc.joint!r}")
+            space.add(joint)
+            self.joints.append(joint)
+
+        # Schwimmende Körper (debris.DebrisField), werten nach jedem Schritt die Stöße aus
+        self.debris = None
+
+    @property
+    def position(self):
+        return self.platform_body.position
+
+    @property
+    def velocity(self):
+        return self.platform_body.velocity
+
+    @property
+    def angle(self):
+        return self.platform_body.angle
+
+    @property
+    def iterations(self):
+        return self.space.iterations
+
+    @iterations.setter
+    def iterations(self, value):
+        # Solver-Iterationen, vom Qualitätsregler an das Frame-Budget angepasst
+        self.space.iterations = value
+
+    def apply_force(self, force, point=(0, 0)):
+        self.platform_body.apply_force_at_local_point(force, point)
+
+    def set_height(self, y):
+        self.platform_body.position = (self.platform_body.position.x, y)
+
+    @property
+    def threads(self):
+        return self.space.threads
+
+    def step(self, dt=DT):
+        if self.tuner is not None:
+            self.tuner.step(dt)
+        else:
+            self.space.step(dt)
+        if self.debris is not None:
+            self.debris.collect()
@@ -0,0 +1,106 @@
+"""Matplotlib-Livegraphen für Energie und Ölförderung.
+
+Die Messreihen liegen als ``SummaryPyramid`` vor, sodass der Graph den ganzen
+Lauf zeigt: je Update wird die passende Auflösung abgefragt, die Mittelwerte
+per LTTB auf ``pixels`` Punkte ausgedünnt und Minimum/Maximum als Band
+gezeichnet. Wird mit der Matplotlib-Werkzeugleiste hineingezoomt und reicht
+die gespeicherte Auflösung nicht, holt ``fetch`` die Rohwerte aus der
+Telemetrie-Aufzeichnung. Taste ``f`` im Graphenfenster folgt wieder dem
+ganzen Lauf.
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from .colors import BLACK_MPL, YELLOW_MPL
+from .downsample import SummaryPyramid, lttb
+
+# Titel, Achsenbeschriftung, Linienfarbe und Telemetriefeld je Messreihe
+SERIES = {
+    "energy": ("Energieproduktion", "Energie (kW)", YELLOW_MPL, "power"),
+    "oil": ("Ölförderung", "Öl (Barrel/s)", BLACK_MPL, "oelfoerderung"),
+}
+
+
+class LivePlot:
+    def __init__(self, series, capacity=4096, interval=10, pixels=800, fetch=None):
+        self.series = tuple(series)
+        self.interval = interval
+        self.pixels = pixels
+        self.fetch = fetch  # fetch(feld, t0, t1, max_points) -> (schritte, werte) aus der Telemetrie
+        self.history = {name: SummaryPyramid(capacity) for name in self.series}
+        self.window = None  # None: ganzen Lauf zeigen, sonst gezoomter Bereich
+        self._updating = False
+
+        # Matplotlib Setup für Live-Graph
+        plt.ion()
+        self.fig, axes = plt.subplots(len(self.series), 1, figsize=(8, 4 * len(self.series)),
+                                      squeeze=False, sharex=True)
+        self.axes = axes[:, 0]
+        self.lines = {}
+        self.bands = dict.fromkeys(self.series)
+        for ax, name in zip(self.axes, self.series):
+            title, ylabel, color, _ = SERIES[name]
+            ax.set_xlabel("Zeit (Schritte)")
+            ax.set_ylabel(ylabel)
+            ax.set_title(title)
+            self.lines[name], = ax.plot([], [], color=color)
+            ax.callbacks.connect("xlim_changed", self._on_zoom)
+        self.fig.canvas.mpl_connect("key_press_event", self._on_key)
+
+    def _on_zoom(self, ax):
+        if not self._updating:
+            self.window = ax.get_xlim()
+
+    def _on_key(self, event):
+        if event.key == "f":
+            self.window = None
+            for ax in self.axes:
+                ax.set_autoscalex_on(True)
+
+    def append(self, time_step, **values):
+        for name in self.series:
+            self.history[name].append(time_step, values[name])
+
+    def _data(self, name, t0, t1):
+        # Linie und Band für [t0, t1]; Rohwerte aus der Telemetrie, wenn die
+        # gespeicherte Auflösung für den Bereich deutlich zu grob ist
+        level, t, lo, hi, mean = self.history[name].query(t0, t1, 2 * self.pixels)
+        if level and self.fetch is not None and len(t) < self.pixels // 4:
+            raw = self.fetch(SERIES[name][3], t0, t1, 8 * self.pixels)
+            if raw is not None and len(raw[0]):
+                t, values = raw
+                keep = lttb(t, values, self.pixels)
+                return t[keep], values[keep], None
+        keep = lttb(t, mean, self.pixels)
+        return t[keep], mean[keep], (t, lo, hi) if level else None
+
+    def update(self, time_step):
+        # Nur jeden n-ten Frame neu zeichnen, um Effizienz zu erhöhen
+        if time_step % self.interval:
+            return
+        self._updating = True
+        try:
+            for ax, name in zip(self.axes, self.series):
+                span = self.history[name].span()
+                if span is None:
+                    continue
+                t0, t1 = (int(self.window[0]), int(self.window[1])) if self.window else span
+                t, y, band = self._data(name, max(t0, span[0]), min(t1, span[1]))
+                self.lines[name].set_data(t, y)
+                if self.bands[name] is not None:
+                    self.bands[name].remove()
+                    self.bands[name] = None
+                ax.relim()
+                if band is not None:
+                    self.bands[name] = ax.fill_between(*band, color=SERIES[name][2], alpha=0.25, linewidth=0)
+                    # relim berücksichtigt keine Collections
+                    ax.update_datalim(np.column_stack([np.r_[band[0], band[0]], np.r_[band[1], band[2]]]))
+                ax.autoscale_view(scalex=self.window is None)
+        finally:
+            self._updating = False
+        plt.pause(0.001)
+
+    def close(self):
+        plt.ioff()
+        plt.close(self.fig)
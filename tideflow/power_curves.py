@@ -0,0 +1,95 @@
+"""Tabellierte Leistungskurven mit Einschalt-, Nenn- und Abschaltgeschwindigkeit.
+
+Eine Kurve wird aus einer CSV-Datei gelesen (zwei Spalten: Geschwindigkeit,
+Leistung in kW; Kennwerte als ``# cut_in=...``-Kopfzeilen) und mit
+``np.interp`` ausgewertet. Mit ``# interpolation=quadratic`` wird zwischen den
+Stützstellen linear im Quadrat der Geschwindigkeit interpoliert, so dass eine
+Kurve der Form a·v² zwischen den Stützstellen exakt wiedergegeben wird. Die
+Auswertung ist vollständig vektorisiert, so dass eine Zeitreihe über viele
+Jahre und viele Geräte in einem Aufruf durchläuft.
+"""
+
+import functools
+import os
+
+import numpy as np
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+# Stunden pro Jahr für Jahresenergie-Schätzungen
+HOURS_PER_YEAR = 8760.0
+
+
+class PowerCurve:
+    __slots__ = ("name", "speeds", "power", "cut_in", "rated", "cut_out", "quadratic", "_knots")
+
+    def __init__(self, speeds, power, cut_in, rated, cut_out=np.inf, name="",
+                 interpolation="linear"):
+        self.speeds = np.asarray(speeds, dtype=np.float64)
+        self.power = np.asarray(power, dtype=np.float64)
+        if self.speeds.shape != self.power.shape or self.speeds.ndim != 1:
+            raise ValueError("Leistungskurve braucht gleich lange Geschwindigkeits- und Leistungsspalten")
+        if np.any(np.diff(self.speeds) <= 0):
+            raise ValueError("Geschwindigkeiten der Leistungskurve müssen streng steigen")
+        if not cut_in <= rated <= cut_out:
+            raise ValueError("Es muss cut_in <= rated <= cut_out gelten")
+        if interpolation not in ("linear", "quadratic"):
+            raise ValueError(f"Unbekannte Interpolation {interpolation!r}")
+        if interpolation == "quadratic" and self.speeds[0] < 0:
+            raise ValueError("Quadratische Interpolation braucht Geschwindigkeiten >= 0")
+        self.quadratic = interpolation == "quadratic"
+        # Stützstellen, über denen ``np.interp`` läuft
+        self._knots = np.square(self.speeds) if self.quadratic else self.speeds
+        self.cut_in = float(cut_in)
+        self.rated = float(rated)
+        self.cut_out = float(cut_out)
+        self.name = name
+
+    @classmethod
+    def from_file(cls, path):
+        meta = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("#") and "=" in line:
+                    key, value = line[1:].split("=", 1)
+                    key, value = key.strip(), value.strip()
+                    meta[key] = value if key == "interpolation" else float(value)
+        table = np.loadtxt(path, delimiter=",", comments="#", ndmin=2)
+        try:
+            return cls(table[:, 0], table[:, 1], meta["cut_in"], meta["rated"],
+                       meta.get("cut_out", np.inf),
+                       name=os.path.splitext(os.path.basename(path))[0],
+                       interpolation=meta.get("interpolation", "linear"))
+        except KeyError as e:
+            raise ValueError(f"Leistungskurve {path} ohne Kennwert {e.args[0]}") from None
+
+    @property
+    def rated_power(self):
+        return float(self(self.rated))
+
+    def __call__(self, speed):
+        # Leistung in kW; unterhalb cut_in und oberhalb cut_out steht das Gerät.
+        # Das Vorzeichen gibt nur die Richtung an, ausgewertet wird der Betrag.
+        speed = np.abs(np.asarray(speed, dtype=np.float64))
+        power = np.interp(np.square(speed) if self.quadratic else speed, self._knots, self.power)
+        return np.where((speed < self.cut_in) | (speed > self.cut_out), 0.0, power)
+
+    def energy(self, speeds, dt_hours, efficiency=1.0):
+        """Energie in kWh für eine Zeitreihe ``speeds`` (Zeit x Geräte, beliebig geformt)."""
+        return float(np.sum(self(speeds) * efficiency)) * dt_hours
+
+    def annual_energy(self, speeds, dt_hours, efficiency=1.0):
+        """Auf ein Jahr hochgerechnete Energie in kWh; die Zeitachse ist Achse 0."""
+        speeds = np.asarray(speeds)
+        duration = speeds.shape[0] * dt_hours
+        return self.energy(speeds, dt_hours, efficiency) * HOURS_PER_YEAR / duration
+
+    def capacity_factor(self, speeds, efficiency=1.0):
+        return float(np.mean(self(speeds) * efficiency)) / self.rated_power
+
+
+@functools.lru_cache(maxsize=None)
+def load_curve(name):
+    """Mitgelieferte Kurve aus ``tideflow/data`` laden (z. B. ``"wind_turbine"``)."""
+    return PowerCurve.from_file(os.path.join(DATA_DIR, name + ".csv"))
@@ -0,0 +1,179 @@
+"""Deklarative Szenarien für die Varianten aus 1.py bis 7.py.
+
+Jede Variante ist nur noch eine Konfiguration: Gelenktyp, Antrieb der
+Plattform, Energie-, Bohr- und Wettermodell sowie ein paar Darstellungs-
+optionen. ``Simulation`` und ``View`` lesen ausschließlich diese Felder, so
+dass alle Varianten dieselben Hot-Paths, Benchmarks und Caches teilen.
+"""
+
+import math
+from dataclasses import dataclass, replace
+
+# Zeitschritt der Physik-Simulation
+DT = 1 / 60.0
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    title: str = "TideFlow Nexus - Offshore Simulation"
+
+    # Bildschirm und Geometrie
+    width: int = 1000
+    height: int = 600
+    platform_width: int = 500
+    platform_height: int = 40
+    platform_y: int = 180
+    num_columns: int = 6
+    column_radius: int = 30
+    column_height: int = 200
+    column_y: int = 500
+
+    # Physik: Backend "pymunk" oder "analytic" (nur Federn, ohne Kontakte)
+    physics: str = "pymunk"
+    # Gelenk: "none", "slide", "pin" oder "spring"
+    joint: str = "pin"
+    platform_mass: float = 10
+    platform_friction: float = None
+    platform_elasticity: float = None
+    column_bodies: bool = True
+    column_friction: float = None
+    column_elasticity: float = None
+    spring_stiffness: float = 8000
+    spring_damping: float = 500
+    slide_max: float = 30
+    physics_threads: int = 1  # Fäden für space.step: 1, 2 (Thread-Modus) oder 0 (schnellere automatisch)
+
+    # Antrieb: "force" (Wellenkraft) oder "position" (Plattform folgt der Welle)
+    drive: str = "force"
+    # Wellenkraft: "signed" sin, "rectified" |sin|, "rectified_xy" zweidimensional
+    wave_force: str = "signed"
+    current_force: bool = False
+    wind_tilt: bool = False
+
+    # Anfangsbedingungen Strömung & Wetter
+    wave_amplitude: float = 15
+    wave_frequency: float = 0.02
+    current_speed: float = 2.0
+    wind_speed: float = 0.0
+    temperature: float = 15.0
+
+    # Modelle
+    weather: str = "gusts"  # "gusts" (1.py-6.py) oder "full" (7.py)
+    storm_rate: float = None  # Sturmwahrscheinlichkeit je Frame (None: wie im Wettermodell)
+    events: str = "roll"  # "roll" (Würfeln pro Frame) oder "poisson" (vorab gezogen)
+    temperature_drift: bool = True
+    energy: str = "current"  # "current", "current_wave" oder "devices"
+    drilling: str = "none"  # "none", "linear" oder "layered"
+    bohrgeschwindigkeit: float = 0.5
+    widerstand_scale: float = 1.0  # Faktor auf den Gesteinswiderstand aller Schichten
+    wells: tuple = ()  # (x, y, kick_x, kick_y) je Bohrung in Metern, siehe subsurface; leer: ein Bohrturm
+    field_cells: tuple = (40, 20)  # Gitterzellen des Feldes (x, y)
+    field_spacing: float = 100.0  # Zellgröße in Metern
+    field_relief: float = 150.0  # Wölbung der Schichtflächen in Metern
+    column_health: bool = False
+    debris: int = 0  # schwimmende Körper, die gegen die Säulen treiben, siehe debris
+    debris_kind: str = "debris"  # "debris" (Treibgut) oder "ice" (Eisschollen)
+    debris_collide: bool = False  # Körper stoßen auch untereinander
+    brace_levels: int = 0  # Ebenen aus X- und Querstreben zwischen den Säulen
+    risers: int = 0  # Steigleitungen unter der Plattform
+    controls: str = "none"  # "none", "flow" (Pfeiltasten gehalten) oder "drill"
+    rates: tuple = ()  # (Teilsystem, Hz)-Paare, siehe scheduler; leer: alles im Frame-Takt
+
+    # Darstellung
+    water_offset: int = 120
+    water_waves: bool = False
+    draw_columns: bool = True
+    draw_drill: bool = False
+    spirals: bool = False
+    hud: tuple = ("temperature", "wind", "energy", "fatigue")
+    plot: tuple = ("energy",)
+    plot_interval: int = 1
+    history_length: int = 4096  # Buckets je Auflösungsstufe der Graphen
+    fps: int = 30
+
+    @property
+    def platform_x(self):
+        return (self.width - self.platform_width) // 2
+
+    @property
+    def column_spacing(self):
+        return self.platform_width // self.num_columns
+
+    def column_x(self, i):
+        return self.platform_x + (i + 0.5) * self.column_spacing
+
+    @property
+    def bohrturm_x(self):
+        return self.platform_x + self.platform_width // 2
+
+
+SCENARIOS = {}
+
+
+def register(scenario):
+    SCENARIOS[scenario.name] = scenario
+    return scenario
+
+
+# Frei schwebende Plattform, Strömungskraft, spiralförmige Generatoren
+register(Scenario(
+    "1", title="Realistische Offshore-Plattform Simulation",
+    platform_y=100, platform_mass=5, platform_friction=0.8, column_y=140,
+    joint="none", column_bodies=False, wave_amplitude=5, wave_frequency=0.03,
+    current_force=True, controls="flow", water_offset=100, spirals=True))
+
+# Plattform folgt der Welle, Slide-Joints an statischen Säulen
+register(Scenario(
+    "2", platform_mass=5, platform_friction=0.8, column_friction=1.0,
+    joint="slide", drive="position", controls="flow"))
+
+# Pin-Joints, Wind neigt die Plattform
+register(Scenario("3", wind_tilt=True))
+
+# Wie 3, zusätzlich Bohrkopf mit linearer Ölförderung
+register(Scenario(
+    "4", wind_tilt=True, drilling="linear", draw_columns=False, draw_drill=True,
+    hud=("temperature", "wind", "energy", "fatigue", "oil"), plot=()))
+
+# Gleichgerichtete Wellenkraft, Energie hängt von der Welle ab (5.py == 6.py)
+register(Scenario(
+    "5", wave_force="rectified", temperature_drift=False, energy="current_wave",
+    drilling="linear", hud=("energy", "fatigue", "oil")))
+SCENARIOS["6"] = replace(SCENARIOS["5"], name="6")
+
+# Vollständige Simulation: Federn, Geräte, Geologie, Wetter, Tageszeit
+register(Scenario(
+    "7", title="TideFlow Nexus - Erweiterte Offshore-Simulation",
+    width=1200, height=700, platform_mass=100, platform_friction=0.5,
+    platform_elasticity=0.4, column_height=250, column_y=580,
+    column_friction=0.7, column_elasticity=0.5, joint="spring",
+    wave_force="rectified_xy", wave_frequency=0.01, wind_speed=5.0, weather="full",
+    temperature_drift=False, energy="devices", drilling="layered",
+    column_health=True, controls="drill", water_waves=True, hud=(),
+    plot=("energy", "oil"), plot_interval=10, fps=60))
+
+# Wie 7, mit Fachwerk aus Streben und Steigleitungen
+register(replace(
+    SCENARIOS["7"], name="8", title="TideFlow Nexus - Tragwerk mit Streben und Steigleitungen",
+    column_radius=20, brace_levels=12, risers=10))
+
+# Wie 7, Ölfeld mit einer senkrechten und sechs abgelenkten Bohrungen vom selben Bohrturm
+register(replace(
+    SCENARIOS["7"], name="9", title="TideFlow Nexus - Ölfeld mit mehreren Bohrungen",
+    wells=((2000.0, 1000.0, 0.0, 0.0),) + tuple(
+        (2000.0, 1000.0, round(0.25 * math.cos(k * math.pi / 3), 6), round(0.25 * math.sin(k * math.pi / 3), 6))
+        for k in range(6))))
+
+# Wie 7, Eisschollen treiben mit Wellen und Strömung gegen die Säulen
+register(replace(
+    SCENARIOS["7"], name="10", title="TideFlow Nexus - Eisgang an den Säulen",
+    debris=600, debris_kind="ice", debris_collide=True))
+
+
+def get_scenario(name, **overrides):
+    try:
+        scenario = SCENARIOS[str(name)]
+    except KeyError:
+        raise ValueError(f"Unbekanntes Szenario {name!r}, verfügbar: {', '.join(SCENARIOS)}") from None
+    return replace(scenario, **overrides) if overrides else scenario
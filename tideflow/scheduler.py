@@ -0,0 +1,158 @@
+"""Eigene Taktrate je Teilsystem der Simulation.
+
+Im Frame-Takt (60 Hz) rechnet ``Simulation.step`` jedes Teilsystem in jedem
+Frame. Mit ``Scenario.rates`` deklariert jedes Teilsystem seine Rate in Hz:
+
+* Langsame Teilsysteme rechnen bei jedem Aufruf ``frames`` Frames in einem
+  Zug (Abklingfaktoren potenziert, Würfe mit der Wahrscheinlichkeit für
+  mindestens ein Ereignis, Zufallsschritte mit der Streuung der Summe).
+* Ausgaben, die schnelle Teilsysteme jeden Frame lesen (Wind, Windrichtung
+  und Wellenamplitude für Plattformkräfte und Turbinen), werden zu Beginn
+  einer Periode für deren Ende berechnet und über die Periode linear
+  interpoliert, nur solange die Periode läuft. Änderungen von außen (Stürme
+  aus der Ereignis-Warteschlange, Tastatur) werden auf beide Stützstellen
+  übertragen.
+* Die übrigen laufen am Ende ihrer Periode und holen die Frames seit dem
+  letzten Aufruf nach, das Tragwerk mit der über diese Frames summierten
+  Wellenlast. Tageszeit, Reservoirdruck und Förderrate liest kein schnelles
+  Teilsystem; Anzeige und Statistik sehen sie in Stufen ihrer Rate.
+* Die Physik kann schneller als der Frame-Takt laufen und macht dann mehrere
+  Unterschritte je Frame, etwa für steife Federn.
+"""
+
+from .scenario import DT
+
+FRAME_RATE = round(1 / DT)
+
+SUBSYSTEMS = ("sky", "weather", "structure", "drilling", "reservoir", "devices", "physics")
+
+# Interpolierte Ausgaben je Teilsystem als (Name, Periode bei Winkelgrößen)
+INTERPOLATED = {
+    "weather": (("wind_speed", None), ("wave_amplitude", None), ("wind_direction", 360.0)),
+}
+
+PRESETS = {
+    "frame": (),
+    "multi": (("physics", 240), ("devices", 60), ("structure", 10), ("weather", 1), ("sky", 1),
+              ("reservoir", 0.1)),
+}
+
+
+def chance(p, frames):
+    """Wahrscheinlichkeit für mindestens ein Ereignis in ``frames`` Frames bei ``p`` je Frame."""
+    return p if frames == 1 else 1 - (1 - p) ** frames
+
+
+def parse_rates(text):
+    """``"physics=240,weather=1"`` oder ein Name aus ``PRESETS`` als Tupel von Paaren."""
+    if text in PRESETS:
+        return PRESETS[text]
+    rates = []
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, _, value = item.partition("=")
+        rates.append((name.strip(), float(value)))
+    return tuple(rates)
+
+
+class Subsystem:
+    __slots__ = ("name", "rate", "every", "update", "argument", "fields", "last", "due", "calls",
+                 "base", "delta", "end", "written")
+
+    def __init__(self, name, update, rate):
+        self.name = name
+        self.update = update
+        self.rate = rate
+        self.calls = 0
+        if name == "physics":
+            if rate < FRAME_RATE or rate % FRAME_RATE:
+                raise ValueError(f"Physik-Rate muss ein Vielfaches von {FRAME_RATE} Hz sein, nicht {rate}")
+            self.every, self.argument = 1, int(rate // FRAME_RATE)
+        else:
+            if rate > FRAME_RATE:
+                raise ValueError(f"Nur die Physik läuft schneller als {FRAME_RATE} Hz ({name}={rate})")
+            self.every = max(1, round(FRAME_RATE / rate))
+            self.argument = self.every
+        # Im Frame-Takt gibt es nichts zu interpolieren
+        self.fields = INTERPOLATED.get(name) if self.every > 1 else None
+        # Stützstellen der laufenden Periode (``delta`` ist None, wenn keine läuft)
+        self.base = self.delta = self.end = self.written = None
+        # Vorausberechnete Teilsysteme starten im ersten Frame, nachholende am Ende ihrer Periode
+        self.last = -1
+        self.due = 0 if self.fields else self.every - 1
+
+
+class MultiRateScheduler:
+    """Ruft die Teilsysteme ``[(name, update), ...]`` in dieser Reihenfolge mit ihrer Rate auf."""
+
+    def __init__(self, rates, systems):
+        rates = dict(rates)
+        unknown = set(rates) - set(SUBSYSTEMS)
+        if unknown:
+            raise ValueError(f"Unbekannte Teilsysteme {', '.join(sorted(unknown))}, "
+                             f"verfügbar: {', '.join(SUBSYSTEMS)}")
+        self.subsystems = [Subsystem(name, update, rates.get(name, FRAME_RATE)) for name, update in systems]
+        self.frames = 0
+
+    def step(self, sim, frame):
+        for sub in self.subsystems:
+            if frame >= sub.due:
+                if sub.fields is not None:
+                    self._begin_period(sim, sub)
+                    sub.update(sub.argument)
+                    self._end_values(sim, sub)
+                else:
+                    sub.update(sub.argument if sub.every == 1 else frame - sub.last)
+                sub.last, sub.due = frame, frame + sub.every
+                sub.calls += 1
+            elif sub.delta is not None:
+                self._interpolate(sim, sub, frame)
+        self.frames += 1
+
+    @staticmethod
+    def _begin_period(sim, sub):
+        # Aktuelle Werte (Ende der letzten Periode plus Änderungen von außen) als Anfang
+        sub.base = [getattr(sim, name) for name, _ in sub.fields]
+
+    @staticmethod
+    def _end_values(sim, sub):
+        # Nach dem Update stehen die Werte am Periodenende; zurück auf den ersten Frame
+        end = sub.end = [getattr(sim, name) for name, _ in sub.fields]
+        delta = sub.delta = [b - a if period is None else (b - a + period / 2) % period - period / 2
+                             for (_, period), a, b in zip(sub.fields, sub.base, end)]
+        sub.written = written = []
+        w = 1 / sub.every
+        for (name, period), a, d in zip(sub.fields, sub.base, delta):
+            value = a + w * d if period is None else (a + w * d) % period
+            setattr(sim, name, value)
+            written.append(value)
+
+    @staticmethod
+    def _interpolate(sim, sub, frame):
+        w = (frame - sub.last + 1) / sub.every
+        base, delta, end, written = sub.base, sub.delta, sub.end, sub.written
+        for i, (name, period) in enumerate(sub.fields):
+            # Seit dem letzten Frame von außen gesetzte Werte als Sprung auf beide Stützstellen
+            jump = getattr(sim, name) - written[i]
+            if jump:
+                base[i] += jump
+                end[i] += jump
+                if period:
+                    base[i] %= period
+                    end[i] %= period
+            if w >= 1:
+                value = end[i]
+            elif period is None:
+                value = base[i] + w * delta[i]
+            else:
+                value = (base[i] + w * delta[i]) % period
+            setattr(sim, name, value)
+            written[i] = value
+        if w >= 1:
+            # Periode vorbei; bis zum nächsten Update bleiben die Endwerte stehen
+            sub.delta = None
+
+    def calls_per_second(self):
+        """Aufrufe je simulierter Sekunde und Teilsystem."""
+        seconds = self.frames * DT
+        return {sub.name: sub.calls * (sub.argument if sub.name == "physics" else 1) / seconds
+                for sub in self.subsystems if seconds}
@@ -0,0 +1,292 @@
+"""Globale Sensitivitätsanalyse über Szenario-Parameter (Sobol und Morris).
+
+Welche Eingaben treiben die Streuung von Förderung, Energie, Plattformbewegung
+und Ermüdung? Parameter werden in ihren Grenzen quasi-zufällig abgetastet
+(Sobol-Folge mit Richtungszahlen nach Joe und Kuo oder Latin Hypercube), die
+Stichproben in Blöcken auf dem Headless-Kern über einen Prozess-Pool
+gerechnet und ausgewertet:
+
+* Sobol: Saltelli-Schema mit den Matrizen A, B und A_B^(i); Indizes erster
+  Ordnung nach Saltelli (2010), Totaleffekte nach Jansen (1999).
+* Morris: Elementareffekte auf ``r`` Trajektorien durch ein Gitter mit
+  ``levels`` Stufen; ``mu*`` (mittlerer Betrag) und ``sigma``.
+
+Konfidenzintervalle kommen aus einem Bootstrap über die Basisstichproben bzw.
+Trajektorien. Alle Läufe nutzen denselben Seed (gemeinsame Zufallszahlen), so
+dass die Indizes die Wirkung der Parameter und nicht das Würfeln messen.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import numpy as np
+
+from .scenario import DT, get_scenario
+
+# Parameter und Grenzen (gleichverteilt)
+PARAMETERS = {
+    "wave_frequency": (0.005, 0.02),
+    "storm_rate": (0.0005, 0.005),
+    "spring_stiffness": (4000.0, 16000.0),
+    "spring_damping": (200.0, 1000.0),
+    "bohrgeschwindigkeit": (0.2, 2.0),
+    "widerstand_scale": (0.5, 2.0),
+}
+
+OUTPUTS = ("oil", "power", "motion", "fatigue")
+
+# Richtungszahlen (Grad s, Koeffizienten a, Startwerte m) der Dimensionen 2-16 nach Joe und Kuo
+_DIRECTIONS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+)
+_BITS = 32
+
+
+def _direction_numbers(d):
+    v = np.zeros((d, _BITS), dtype=np.uint64)
+    v[0] = [1 << (_BITS - 1 - j) for j in range(_BITS)]
+    for i, (s, a, m) in enumerate(_DIRECTIONS[:d - 1], start=1):
+        row = [0] * _BITS
+        for j in range(_BITS):
+            if j < s:
+                row[j] = m[j] << (_BITS - 1 - j)
+            else:
+                row[j] = row[j - s] ^ (row[j - s] >> s)
+                for k in range(1, s):
+                    if (a >> (s - 1 - k)) & 1:
+                        row[j] ^= row[j - k]
+        v[i] = row
+    return v
+
+
+def sobol_sequence(n, d, skip=0):
+    """Punkte ``skip`` bis ``skip + n - 1`` der Sobol-Folge in [0, 1)^d (Gray-Code-Ordnung)."""
+    if d > len(_DIRECTIONS) + 1:
+        raise ValueError(f"Sobol-Folge nur bis {len(_DIRECTIONS) + 1} Dimensionen")
+    v = _direction_numbers(d)
+    index = np.arange(skip, skip + n, dtype=np.uint64)
+    gray = index ^ (index >> np.uint64(1))
+    x = np.zeros((n, d), dtype=np.uint64)
+    for j in range(_BITS):
+        bit = ((gray >> np.uint64(j)) & np.uint64(1)).astype(bool)
+        x[bit] ^= v[:, j]
+    return x.astype(np.float64) / 2.0 ** _BITS
+
+
+def latin_hypercube(n, d, rng):
+    """Je Dimension genau ein Punkt in jedem der ``n`` Intervalle, zufällig kombiniert."""
+    u = (np.arange(n)[:, None] + rng.random((n, d))) / n
+    for j in range(d):
+        u[:, j] = u[rng.permutation(n), j]
+    return u
+
+
+def scale(u, bounds):
+    low, high = np.array(bounds, dtype=np.float64).T
+    return low + u * (high - low)
+
+
+def saltelli_samples(n, bounds, sampler="sobol", seed=0):
+    """Matrizen A und B (je (n, k)) sowie A_B mit Form (k, n, k): A mit Spalte i aus B."""
+    k = len(bounds)
+    if sampler == "sobol":
+        # Erster Punkt (Nullvektor) wird übersprungen, wie üblich beim Saltelli-Schema
+        u = sobol_sequence(n, 2 * k, skip=1)
+    elif sampler == "lhs":
+        u = latin_hypercube(n, 2 * k, np.random.default_rng(seed))
+    else:
+        raise ValueError(f"Unbekanntes Verfahren {sampler!r}, erlaubt: sobol, lhs")
+    a, b = scale(u[:, :k], bounds), scale(u[:, k:], bounds)
+    ab = np.repeat(a[None], k, axis=0)
+    for i in range(k):
+        ab[i, :, i] = b[:, i]
+    return a, b, ab
+
+
+def _sobol_estimates(fa, fb, fab):
+    # fa, fb: (..., n); fab: (..., k, n). Zentrieren senkt die Streuung des
+    # S1-Schätzers bei großem Mittelwert und kleiner Varianz erheblich
+    both = np.concatenate([fa, fb], axis=-1)
+    mean = both.mean(axis=-1, keepdims=True)
+    fa, fb, fab = fa - mean, fb - mean, fab - mean[..., None, :]
+    var = np.var(both, axis=-1)[..., None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        first = np.mean(fb[..., None, :] * (fab - fa[..., None, :]), axis=-1) / var
+        total = 0.5 * np.mean((fa[..., None, :] - fab) ** 2, axis=-1) / var
+    return first, total
+
+
+def _half_width(boot, confidence):
+    # Halbe Breite des Bootstrap-Perzentilintervalls
+    q = [(1 - confidence) / 2, (1 + confidence) / 2]
+    low, high = np.nanquantile(boot, q, axis=0)
+    return (high - low) / 2
+
+
+def sobol_indices(fa, fb, fab, bootstrap=500, confidence=0.95, seed=0):
+    """Indizes erster Ordnung ``S1`` und Totaleffekte ``ST`` mit halben Konfidenzintervallbreiten."""
+    fa, fb, fab = (np.asarray(f, dtype=np.float64) for f in (fa, fb, fab))
+    first, total = _sobol_estimates(fa, fb, fab)
+    rows = np.random.default_rng(seed).integers(0, len(fa), (bootstrap, len(fa)))
+    boot_first, boot_total = _sobol_estimates(fa[rows], fb[rows], fab[:, rows].transpose(1, 0, 2))
+    return {"S1": first, "S1_conf": _half_width(boot_first, confidence),
+            "ST": total, "ST_conf": _half_width(boot_total, confidence)}
+
+
+def morris_samples(r, bounds, levels=4, seed=0):
+    """``r`` Trajektorien mit Form (r, k + 1, k) im Einheitswürfel.
+
+    Je Schritt ändert sich genau ein Faktor um ±delta, in zufälliger Reihenfolge.
+    """
+    k = len(bounds)
+    rng = np.random.default_rng(seed)
+    delta = levels / (2 * (levels - 1))
+    grid = np.arange(levels) / (levels - 1)
+    u = np.empty((r, k + 1, k))
+    for t in range(r):
+        x = rng.choice(grid, k)
+        u[t, 0] = x
+        for step, i in enumerate(rng.permutation(k), start=1):
+            x = x.copy()
+            x[i] = x[i] + delta if x[i] + delta <= 1 else x[i] - delta
+            u[t, step] = x
+    return u
+
+
+def morris_indices(u, y, bootstrap=500, confidence=0.95, seed=0):
+    """``mu``, ``mu_star`` (mit halber Konfidenzintervallbreite) und ``sigma`` je Parameter.
+
+    Die Elementareffekte sind auf die Parameterspanne normiert, also in
+    Ausgabe-Einheiten je voller Spanne des Parameters.
+    """
+    r, steps, k = u.shape
+    y = np.asarray(y, dtype=np.float64).reshape(r, steps)
+    du = np.diff(u, axis=1)  # (r, k, k), je Schritt genau ein Eintrag ungleich null
+    factor = np.argmax(np.abs(du), axis=2)
+    effects = np.empty((r, k))
+    for t in range(r):
+        effects[t, factor[t]] = np.diff(y[t]) / du[t, np.arange(k), factor[t]]
+    rows = np.random.default_rng(seed).integers(0, r, (bootstrap, r))
+    boot = np.abs(effects)[rows].mean(axis=1)
+    return {"mu": effects.mean(axis=0), "mu_star": np.abs(effects).mean(axis=0),
+            "mu_star_conf": _half_width(boot, confidence),
+            "sigma": effects.std(axis=0, ddof=1) if r > 1 else np.zeros(k)}
+
+
+def evaluate(scenario, names, values, steps=6000, seed=0):
+    """Kennzahlen eines Laufs mit den Parametern ``names = values`` als Dict.
+
+    ``oil``: geförderte Barrel, ``power``: mittlere Leistung in kW, ``energy``:
+    erzeugte Energie in kWh, ``motion``: Standardabweichung der
+    Plattformposition in Pixel über den ganzen Lauf (in Szenario 7 vor allem das
+    Einschwingen), ``fatigue``: mittlerer Gesundheitsverlust des Tragwerks in
+    Prozent, ``min_health``: geringste Gesundheit einer Säule im Lauf (ohne
+    Tragwerk jeweils aus der Materialermüdung).
+    """
+    from .engine import Simulation
+    from .structure import KINDS
+
+    base = get_scenario(scenario) if isinstance(scenario, str) else scenario
+    sc = replace(base, **{name: float(value) for name, value in zip(names, values)})
+    sim = Simulation(sc, seed)
+    structure = sim.structure
+    columns = structure.kind == KINDS["column"][0] if structure is not None else None
+    if columns is not None and not columns.any():
+        columns[:] = True
+    oil = power = 0.0
+    min_health = 100.0
+    moments = np.zeros(4)  # Summen von x, y, x² und y²
+    for _ in range(steps):
+        sim.step()
+        oil += sim.oelfoerderung
+        power += sim.power
+        x, y = sim.physics.position
+        moments += (x, y, x * x, y * y)
+        if columns is not None:
+            min_health = min(min_health, float(structure.health[columns].min()))
+    mean = moments[:2] / steps
+    motion = math.sqrt(max(0.0, float(np.sum(moments[2:] / steps - mean ** 2))))
+    if structure is not None:
+        fatigue = 100 - float(structure.health.mean())
+    else:
+        fatigue = sim.material_fatigue
+        min_health = 100 - fatigue
+    return {"oil": oil * DT, "power": power / steps, "energy": power * DT / 3600, "motion": motion,
+            "fatigue": fatigue, "min_health": min_health}
+
+
+def _evaluate_batch(scenario, names, rows, steps, seed, outputs):
+    results = []
+    for row in rows:
+        metrics = evaluate(scenario, names, row, steps, seed)
+        results.append([metrics[output] for output in outputs])
+    return results
+
+
+def evaluate_all(scenario, names, samples, steps=6000, seed=0, workers=None, batch=4, outputs=OUTPUTS):
+    """Alle Zeilen von ``samples`` rechnen, in Blöcken zu ``batch`` über ``workers`` Prozesse.
+
+    Rückgabe: Array (Zeilen, ``outputs``) mit Kennzahlen aus ``evaluate``.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    outputs = tuple(outputs)
+    blocks = [samples[i:i + batch] for i in range(0, len(samples), batch)]
+    if workers == 1:
+        results = [_evaluate_batch(scenario, names, block, steps, seed, outputs) for block in blocks]
+    else:
+        n = len(blocks)
+        with ProcessPoolExecutor(workers or os.cpu_count()) as pool:
+            results = list(pool.map(_evaluate_batch, [scenario] * n, [names] * n, blocks, [steps] * n,
+                                    [seed] * n, [outputs] * n))
+    return np.array([row for block in results for row in block]).reshape(len(samples), len(outputs))
+
+
+def analyze(scenario="7", parameters=None, method="sobol", n=64, levels=4, sampler="sobol",
+            steps=6000, seed=0, workers=None, bootstrap=500):
+    """Sensitivität aller ``OUTPUTS`` auf ``parameters`` (Namen aus ``PARAMETERS``).
+
+    ``scenario`` ist ein Name oder ein ``Scenario`` (etwa mit analytischer
+    Physik oder Taktraten für schnellere Läufe).
+
+    Sobol braucht ``n * (k + 2)`` Läufe, Morris ``n * (k + 1)`` mit ``n``
+    Trajektorien. Rückgabe: Dict je Kennzahl mit Arrays je Parameter sowie
+    ``"parameters"`` und ``"runs"``.
+    """
+    names = tuple(parameters or PARAMETERS)
+    unknown = set(names) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unbekannte Parameter {', '.join(sorted(unknown))}, verfügbar: {', '.join(PARAMETERS)}")
+    bounds = [PARAMETERS[name] for name in names]
+    k = len(names)
+    result = {"parameters": names}
+    if method == "sobol":
+        a, b, ab = saltelli_samples(n, bounds, sampler, seed)
+        y = evaluate_all(scenario, names, np.concatenate([a, b, ab.reshape(-1, k)]), steps, seed, workers)
+        for j, output in enumerate(OUTPUTS):
+            fa, fb, fab = y[:n, j], y[n:2 * n, j], y[2 * n:, j].reshape(k, n)
+            result[output] = sobol_indices(fa, fb, fab, bootstrap, seed=seed)
+    elif method == "morris":
+        u = morris_samples(n, bounds, levels, seed)
+        y = evaluate_all(scenario, names, scale(u.reshape(-1, k), bounds), steps, seed, workers)
+        for j, output in enumerate(OUTPUTS):
+            result[output] = morris_indices(u, y[:, j], bootstrap, seed=seed)
+    else:
+        raise ValueError(f"Unbekannte Methode {method!r}, erlaubt: sobol, morris")
+    result["runs"] = len(y)
+    return result
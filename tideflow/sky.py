@@ -0,0 +1,106 @@
+"""Vorberechneter Himmel: Tagesverlauf als Farbverlauf-Tabelle und Wolken-Sprites.
+
+Der Himmel kommt aus einer 24-Stunden-Tabelle mit einem Farbverlauf pro
+Minute. Jeder Verlauf liegt als 1 Pixel breiter Streifen vor und wird nur beim
+Minutenwechsel auf Bildschirmbreite skaliert. Wolken werden einmal je Größe
+als weiche, alpha-geblendete Sprites gerendert und danach nur noch geblittet.
+"""
+
+import numpy as np
+import pygame
+
+MINUTES_PER_DAY = 24 * 60
+
+# Stützstellen des Tagesverlaufs: Stunde, Farbe oben, Farbe am Horizont
+SKY_KEYFRAMES = [
+    (0.0, (10, 10, 35), (25, 25, 60)),
+    (5.0, (30, 30, 70), (120, 80, 90)),
+    (6.0, (90, 120, 200), (255, 160, 110)),
+    (8.0, (70, 130, 230), (150, 190, 255)),
+    (12.0, (60, 120, 240), (140, 190, 255)),
+    (17.0, (70, 125, 230), (170, 190, 240)),
+    (18.5, (80, 80, 150), (255, 140, 90)),
+    (19.5, (25, 25, 65), (90, 60, 90)),
+    (24.0, (10, 10, 35), (25, 25, 60)),
+]
+
+
+def sky_gradient_table(height, keyframes=SKY_KEYFRAMES):
+    """Farbverläufe für jede Minute des Tages, Form (1440, height, 3), uint8."""
+    hours = np.array([k[0] for k in keyframes])
+    top = np.array([k[1] for k in keyframes], dtype=np.float64)
+    horizon = np.array([k[2] for k in keyframes], dtype=np.float64)
+    minutes = np.arange(MINUTES_PER_DAY) / 60.0
+    top_per_minute = np.stack([np.interp(minutes, hours, top[:, c]) for c in range(3)], axis=1)
+    horizon_per_minute = np.stack([np.interp(minutes, hours, horizon[:, c]) for c in range(3)], axis=1)
+    blend = np.linspace(0.0, 1.0, height)[None, :, None]
+    table = top_per_minute[:, None, :] * (1 - blend) + horizon_per_minute[:, None, :] * blend
+    return table.round().astype(np.uint8)
+
+
+class SkyRenderer:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.table = sky_gradient_table(height)
+        self._strips = {}
+        self._surface = pygame.Surface((width, height))
+        self._minute = None
+
+    def strip(self, minute):
+        # 1 Pixel breiter Verlauf, erst bei Bedarf aus der Tabelle erzeugt
+        strip = self._strips.get(minute)
+        if strip is None:
+            strip = pygame.surfarray.make_surface(self.table[minute][None, :, :])
+            self._strips[minute] = strip
+        return strip
+
+    def draw(self, surface, tageszeit):
+        minute = int(tageszeit * 60) % MINUTES_PER_DAY
+        if minute != self._minute:
+            pygame.transform.scale(self.strip(minute), (self.width, self.height), self._surface)
+            self._minute = minute
+        surface.blit(self._surface, (0, 0))
+
+
+class CloudSprites:
+    """Weiche Wolken-Sprites, je Radius einmal gerendert."""
+
+    # Lage und Größe der Wolkenballen relativ zum Radius
+    PUFFS = ((0.0, 0.0, 1.0), (-0.9, 0.25, 0.7), (0.9, 0.2, 0.75), (-0.4, -0.35, 0.65), (0.45, -0.3, 0.6))
+
+    def __init__(self, color=(220, 220, 220), opacity=0.85):
+        self.color = color
+        self.opacity = opacity
+        self._cache = {}
+
+    def sprite(self, radius):
+        sprite = self._cache.get(radius)
+        if sprite is None:
+            sprite = self._cache[radius] = self._render(radius)
+        return sprite
+
+    def _render(self, radius):
+        width, height = int(radius * 4.4), int(radius * 3.2)
+        x = np.arange(width)[:, None] - width / 2
+        y = np.arange(height)[None, :] - height / 2
+        density = np.zeros((width, height))
+        for dx, dy, size in self.PUFFS:
+            sigma = radius * size * 0.55
+            density += np.exp(-((x - dx * radius) ** 2 + (y - dy * radius) ** 2) / (2 * sigma ** 2))
+        # Schwelle, damit der Rand des Sprites vollständig transparent ist
+        alpha = np.clip((density - 0.08) / 0.6, 0, 1) * 255 * self.opacity
+
+        # Oben heller, unten leicht schattiert
+        shade = 1.0 - 0.15 * (y + height / 2) / height
+        rgb = np.clip(np.array(self.color)[None, None, :] * shade[..., None], 0, 255)
+        rgb = np.broadcast_to(rgb, (width, height, 3))
+
+        sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.surfarray.pixels3d(sprite)[...] = rgb.astype(np.uint8)
+        pygame.surfarray.pixels_alpha(sprite)[...] = alpha.astype(np.uint8)
+        return sprite
+
+    def draw(self, surface, x, y, radius):
+        sprite = self.sprite(radius)
+        surface.blit(sprite, (int(x) - sprite.get_width() // 2, int(y) - sprite.get_height() // 2))
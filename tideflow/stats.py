@@ -0,0 +1,187 @@
+"""Laufende Statistiken mit konstantem Speicher, zusammenführbar.
+
+``RunningStats`` hält je Messreihe Anzahl, Mittel und Varianz (Welford),
+Minimum, Maximum, einen exponentiell gewichteten Mittelwert und einen
+t-Digest für Quantile. Zwei Instanzen lassen sich mit ``merge`` exakt (bzw.
+beim Digest mit dessen Genauigkeit) vereinigen, etwa über Ensemble-Mitglieder
+oder Worker eines Prozess-Pools hinweg. ``SimulationStats`` verfolgt die
+Kennzahlen einer ``Simulation`` und wird in ``Simulation.step`` aktualisiert.
+"""
+
+import math
+
+import numpy as np
+
+
+class TDigest:
+    """Mischender t-Digest: Werte werden gepuffert und blockweise zu Zentroiden verdichtet."""
+
+    def __init__(self, compression=200, buffer_size=512):
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self._buffer = []
+
+    def add(self, value):
+        self._buffer.append(value)
+        if len(self._buffer) >= self.buffer_size:
+            self._compress()
+
+    def _compress(self, means=(), weights=()):
+        means = np.concatenate([self.means, self._buffer, means])
+        weights = np.concatenate([self.weights, np.ones(len(self._buffer)), weights])
+        self._buffer = []
+        if not len(means):
+            return
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        # Skalenfunktion k1: an den Rändern kleine, in der Mitte große Zentroide
+        q = (np.cumsum(weights) - weights / 2) / total
+        k = self.compression / (2 * math.pi) * np.arcsin(2 * q - 1) + self.compression / 4
+        bucket = np.floor(k).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def merge(self, other):
+        other._compress()
+        self._compress(other.means, other.weights)
+        return self
+
+    def quantile(self, q, low, high):
+        """Quantil ``q`` (Skalar oder Array); ``low``/``high`` sind Minimum und Maximum."""
+        self._compress()
+        if not len(self.means):
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else math.nan
+        total = self.weights.sum()
+        position = np.cumsum(self.weights) - self.weights / 2
+        return np.interp(np.asarray(q) * total, np.r_[0.0, position, total], np.r_[low, self.means, high])
+
+
+class RunningStats:
+    """Statistik einer Messreihe; ``alpha`` ist der Glättungsfaktor des EWMA."""
+
+    QUANTILES = (0.05, 0.5, 0.95)
+
+    def __init__(self, alpha=0.01, compression=200):
+        self.alpha = alpha
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.ewma = None
+        self.digest = TDigest(compression)
+
+    def update(self, value):
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.ewma = value if self.ewma is None else self.ewma + self.alpha * (value - self.ewma)
+        self.digest.add(value)
+
+    @property
+    def variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def quantile(self, q):
+        return self.digest.quantile(q, self.min, self.max)
+
+    def merge(self, other):
+        """``other`` in diese Statistik aufnehmen (Chan et al. für Mittel und Varianz).
+
+        Der EWMA beschreibt den jüngsten Stand einer Reihe; zusammengeführt wird
+        er nach Anzahl gewichtet gemittelt.
+        """
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max, self.ewma = other.min, other.max, other.ewma
+        else:
+            count = self.count + other.count
+            delta = other.mean - self.mean
+            self._m2 += other._m2 + delta * delta * self.count * other.count / count
+            self.mean += delta * other.count / count
+            self.ewma = (self.ewma * self.count + other.ewma * other.count) / count
+            self.count = count
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        self.digest.merge(other.digest)
+        return self
+
+    def summary(self):
+        p05, p50, p95 = self.quantile(self.QUANTILES) if self.count else (math.nan,) * 3
+        return {"count": self.count, "mean": self.mean, "std": self.std, "min": self.min,
+                "max": self.max, "ewma": self.ewma, "p05": float(p05), "p50": float(p50), "p95": float(p95)}
+
+
+# Verfolgte Kennzahlen einer Simulation
+METRICS = {
+    "power": lambda sim: sim.power,
+    "oelfoerderung": lambda sim: sim.oelfoerderung,
+    "wind_speed": lambda sim: sim.wind_speed,
+    "wave_amplitude": lambda sim: sim.wave_amplitude,
+    "material_fatigue": lambda sim: sim.material_fatigue,
+    # Schwächstes Bauteil des Tragwerks
+    "member_health": lambda sim: float(sim.structure.health.min()) if sim.structure is not None else None,
+}
+
+
+class SimulationStats:
+    def __init__(self, metrics=None, alpha=0.01):
+        self.metrics = tuple(metrics or METRICS)
+        self.stats = {name: RunningStats(alpha) for name in self.metrics}
+
+    def __getitem__(self, name):
+        return self.stats[name]
+
+    def update(self, sim):
+        for name in self.metrics:
+            value = METRICS[name](sim)
+            if value is not None:
+                self.stats[name].update(value)
+
+    def merge(self, other):
+        for name in self.metrics:
+            self.stats[name].merge(other.stats[name])
+        return self
+
+    def summary(self):
+        return {name: stats.summary() for name, stats in self.stats.items() if stats.count}
+
+
+def _member_stats(scenario, steps, seed):
+    from .engine import Simulation
+
+    sim = Simulation(scenario, seed, stats=True)
+    sim.run(steps)
+    return sim.stats
+
+
+def ensemble_stats(scenario="7", members=4, steps=3600, seed=0, workers=None):
+    """Statistiken über ``members`` Läufe mit Seeds ``seed, seed + 1, ...``, parallel gerechnet."""
+    seeds = [seed + i for i in range(members)]
+    if workers == 1:
+        results = [_member_stats(scenario, steps, s) for s in seeds]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_member_stats, [scenario] * members, [steps] * members, seeds))
+    total = SimulationStats()
+    for result in results:
+        total.merge(result)
+    return total
@@ -0,0 +1,167 @@
+"""Tragwerk als Struct-of-Arrays: Säulen, Streben und Steigleitungen.
+
+Jedes Bauteil hat Art, Lage, Belastungsgewicht und Gesundheit in NumPy-Arrays.
+Ermüdung, Reparaturwürfe und Farben der Gesundheitsbalken werden in einem
+Array-Durchgang berechnet. Beim Zeichnen wird die unveränderliche Geometrie
+einmal vorgerendert; die Balken kommen aus einer Farbpalette (eine Zeile je
+Prozent Gesundheit) und werden mit einem einzigen ``Surface.blits`` gezeichnet.
+So bleibt der Aufwand pro Frame auch bei Hunderten Bauteilen flach.
+"""
+
+import numpy as np
+
+from .colors import DARK_GRAY, GRAY
+from .scheduler import chance
+
+# Art: Code, Belastungsgewicht, Farbe, Linienstärke, Balkenbreite
+KINDS = {
+    "column": (0, 1.0, GRAY, None, None),
+    "brace": (1, 1.5, DARK_GRAY, 3, 12),
+    "riser": (2, 0.5, (70, 70, 70), 4, 8),
+}
+BAR_HEIGHT = 5
+
+
+def health_colors(health):
+    """Balkenfarben wie in 7.py: rot bei 0 %, grün bei 100 %; Form (N, 3)."""
+    fraction = np.clip(np.asarray(health, dtype=np.float64) / 100, 0, 1)
+    colors = np.zeros(fraction.shape + (3,), dtype=np.uint8)
+    colors[..., 0] = (255 * (1 - fraction)).astype(np.uint8)
+    colors[..., 1] = (255 * fraction).astype(np.uint8)
+    return colors
+
+
+class MemberBank:
+    """Bauteile des Tragwerks; ``x0, y0, x1, y1`` sind die Endpunkte der Achse."""
+
+    __slots__ = ("kind", "x0", "y0", "x1", "y1", "thickness", "bar_x", "bar_y", "bar_width",
+                 "weight", "health", "rng", "repair_below", "repair_chance", "repair_amount",
+                 "_static", "_palette")
+
+    def __init__(self, kind, x0, y0, x1, y1, thickness, bar_x, bar_y, bar_width, weight,
+                 health=100.0, seed=None, repair_below=50.0, repair_chance=0.05, repair_amount=10.0):
+        self.kind = np.asarray(kind, dtype=np.int8)
+        self.x0, self.y0, self.x1, self.y1 = (np.asarray(a, dtype=np.float64) for a in (x0, y0, x1, y1))
+        self.thickness = np.asarray(thickness, dtype=np.int64)
+        self.bar_x = np.asarray(bar_x, dtype=np.int64)
+        self.bar_y = np.asarray(bar_y, dtype=np.int64)
+        self.bar_width = np.asarray(bar_width, dtype=np.int64)
+        self.weight = np.asarray(weight, dtype=np.float64)
+        self.health = np.full(len(self.kind), health, dtype=np.float64)
+        self.rng = np.random.default_rng(seed)
+        self.repair_below = repair_below
+        self.repair_chance = repair_chance
+        self.repair_amount = repair_amount
+        self._static = self._palette = None
+
+    def __len__(self):
+        return len(self.kind)
+
+    def count(self, kind):
+        return int(np.count_nonzero(self.kind == KINDS[kind][0]))
+
+    def update(self, stress, roll_repairs=True, frames=1):
+        # Ermüdung je Bauteil nach Wellenbelastung und Alter; ``stress`` ist über ``frames`` Frames summiert
+        self.health -= stress * self.weight + 0.001 * frames
+        np.maximum(self.health, 0.0, out=self.health)
+
+        # Stark beschädigte Bauteile werden mit kleiner Wahrscheinlichkeit repariert
+        if roll_repairs:
+            damaged = self.health < self.repair_below
+            if damaged.any():
+                repaired = damaged & (self.rng.random(len(self)) < chance(self.repair_chance, frames))
+                self.health[repaired] += self.repair_amount
+
+    def repair_damaged(self):
+        """Wartungsbesuch: alle stark beschädigten Bauteile verstärken."""
+        self.health[self.health < self.repair_below] += self.repair_amount
+
+    def _render_static(self, size):
+        # Nur der Bereich des Tragwerks, mit Farbschlüssel statt Alphakanal (schneller zu blitten)
+        import pygame
+
+        margin = int(self.thickness.max()) if len(self) else 0
+        left = max(0, int(min(self.x0.min(), self.x1.min())) - margin)
+        top = max(0, int(min(self.y0.min(), self.y1.min())) - margin)
+        right = min(size[0], int(max(self.x0.max(), self.x1.max())) + margin + 1)
+        bottom = min(size[1], int(max(self.y0.max(), self.y1.max())) + margin + 1)
+        surface = pygame.Surface((max(1, right - left), max(1, bottom - top)))
+        key = (255, 0, 255)
+        surface.fill(key)
+        surface.set_colorkey(key, pygame.RLEACCEL)
+        for kind, (code, _, color, width, _) in KINDS.items():
+            for i in np.flatnonzero(self.kind == code):
+                x0, y0, x1, y1 = self.x0[i] - left, self.y0[i] - top, self.x1[i] - left, self.y1[i] - top
+                if kind == "column":
+                    pygame.draw.rect(surface, color, (int(x0 - self.thickness[i] // 2), int(y0),
+                                                      int(self.thickness[i]), int(y1 - y0)))
+                else:
+                    pygame.draw.line(surface, color, (x0, y0), (x1, y1), width)
+        return surface, (left, top)
+
+    def _render_palette(self):
+        # Zeile h (0-100) enthält die Balkenfarbe bei h Prozent Gesundheit
+        import pygame
+
+        width = int(self.bar_width.max()) if len(self) else 1
+        colors = health_colors(np.arange(101))
+        pixels = np.repeat(np.repeat(colors[None, :, :], width, axis=0), BAR_HEIGHT, axis=1)
+        return pygame.surfarray.make_surface(pixels)
+
+    def draw(self, surface):
+        if self._static is None:
+            self._static = self._render_static(surface.get_size())
+            self._palette = self._render_palette()
+        surface.blit(*self._static)
+
+        # Gesundheitsbalken: Palettenzeile und Breite je Bauteil, ein Blit-Aufruf
+        fraction = np.clip(self.health / 100, 0, 1)
+        rows = (fraction * 100).astype(np.int64) * BAR_HEIGHT
+        widths = (self.bar_width * fraction).astype(np.int64)
+        palette = self._palette
+        surface.blits([(palette, (x, y), (0, row, w, BAR_HEIGHT)) for x, y, row, w in
+                       zip(self.bar_x.tolist(), self.bar_y.tolist(), rows.tolist(), widths.tolist())],
+                      doreturn=False)
+
+
+def platform_structure(sc, seed=None):
+    """Tragwerk eines Szenarios: Säulen, ``brace_levels`` Ebenen aus X- und
+    Querstreben je Feld zwischen zwei Säulen sowie ``risers`` Steigleitungen."""
+    members = []
+
+    def add(kind, x0, y0, x1, y1, bar_x, bar_y, bar_width=None, thickness=None):
+        _, weight, _, width, default_bar = KINDS[kind]
+        if kind != "column":
+            # Streben und Leitungen nahe der Oberfläche tragen mehr Wellenlast
+            depth = ((y0 + y1) / 2 - sc.column_y) / max(1, sc.column_height)
+            weight *= float(np.exp(-depth))
+        members.append((KINDS[kind][0], x0, y0, x1, y1, thickness or width, bar_x, bar_y,
+                        bar_width or default_bar, weight))
+
+    r = sc.column_radius
+    top, bottom = sc.column_y, sc.column_y + sc.column_height
+    for i in range(sc.num_columns):
+        x = sc.column_x(i)
+        add("column", x, top, x, bottom, int(x - r), top - 10, 2 * r, 2 * r)
+
+    levels = np.linspace(top + 20, bottom, sc.brace_levels + 1) if sc.brace_levels else []
+    for i in range(sc.num_columns - 1):
+        left, right = sc.column_x(i) + r, sc.column_x(i + 1) - r
+        middle = (left + right) / 2
+        for upper, lower in zip(levels[:-1], levels[1:]):
+            bar_y = int((upper + lower) / 2) - BAR_HEIGHT // 2
+            add("brace", left, upper, right, lower, int(middle - 14), bar_y)
+            add("brace", left, lower, right, upper, int(middle + 2), bar_y)
+            add("brace", left, upper, right, upper, int(middle - 6), int(upper) - 8)
+
+    # Steigleitungen reihum auf die Felder verteilt, gleichmäßig innerhalb des Feldes
+    bays = max(1, sc.num_columns - 1)
+    for bay in range(bays):
+        count = len(range(bay, sc.risers, bays))
+        left, right = sc.column_x(bay) + r, sc.column_x(bay + 1) - r
+        for k in range(count):
+            x = left + (k + 0.5) * (right - left) / count
+            add("riser", x, top - 20, x, sc.height, int(x - 4), top - 28 - 7 * (k % 2))
+
+    columns = list(zip(*members))
+    return MemberBank(*columns, seed=seed)
@@ -0,0 +1,236 @@
+"""Räumlicher Untergrund mit mehreren Bohrungen.
+
+Statt der 1D-Liste ``SCHICHTEN`` unter einem einzigen Bohrturm liegt das Feld
+als NumPy-Gitter vor:
+
+* ``tops`` (Schichten, ny, nx): Tiefe der Schichtoberkanten je Gittersäule,
+  mit ``ny = 1`` ein 2D-Schnitt. Die Flächen wölben sich über das Feld.
+* ``saturation`` (nz, ny, nx): Ölsättigung je Zelle als Faktor auf den
+  Ölgehalt der Schicht.
+* ``pressure`` (ny, nx): Reservoirdruck je Säule. Fördernde Bohrungen senken
+  den Druck ihrer Zelle, Diffusion gleicht ihn mit den Nachbarzellen aus, so
+  dass benachbarte Bohrungen sich den Druck teilen.
+
+``WellBank`` hält alle Bohrungen als Struct-of-Arrays; Widerstand und
+Ölgehalt werden für alle Bohrköpfe (auch abgelenkter Bohrungen) mit einem
+Gather aus den Gittern geholt. Der Aufwand je Frame wächst so nur linear mit
+einer kleinen Konstante in der Zahl der Bohrungen. Die Regeln je Bohrung sind
+die von ``Simulation._drill_layered`` und ``_produce``; mit ``uniform`` und
+einer Bohrung ergibt sich genau das 1D-Modell.
+"""
+
+import math
+
+import numpy as np
+
+from .geology import MAX_TIEFE, SCHICHTEN
+
+# Förderung ab der Oberkante dieser Schicht (Sandstein)
+PRODUCTIVE_LAYER = 2
+
+
+class SubsurfaceGrid:
+    """Schichtflächen, Sättigung und Druck eines Feldes mit Zellgröße ``dx`` (horizontal) und ``dz`` Metern.
+
+    Zellen werden über den flachen Index ``iy * nx + ix`` angesprochen.
+    """
+
+    __slots__ = ("tops", "saturation", "pressure", "dx", "dz", "widerstand", "oelgehalt", "diffusion",
+                 "diffuse_every", "min_pressure", "_tops", "_saturation", "_pressure", "_pending")
+
+    def __init__(self, tops, saturation=None, dx=100.0, dz=50.0, diffusion=0.001, diffuse_every=10,
+                 min_pressure=10.0, layers=SCHICHTEN):
+        self.tops = np.asarray(tops, dtype=np.float64)
+        if self.tops.ndim == 2:
+            self.tops = self.tops[:, None, :]
+        _, ny, nx = self.tops.shape
+        if saturation is None:
+            saturation = np.ones((int(math.ceil(MAX_TIEFE / dz)) + 1, ny, nx))
+        self.saturation = np.asarray(saturation, dtype=np.float64)
+        self.pressure = np.full((ny, nx), 100.0)
+        self.dx = dx
+        self.dz = dz
+        self.widerstand = np.array([layer["widerstand"] for layer in layers], dtype=np.float64)
+        self.oelgehalt = np.array([layer["oelgehalt"] for layer in layers], dtype=np.float64)
+        self.diffusion = diffusion  # Druckausgleich je Frame als Anteil der Differenz zum Nachbarn
+        self.diffuse_every = diffuse_every  # Frames, die der Ausgleich gesammelt in einem Zug rechnet
+        self.min_pressure = min_pressure
+        # Flache Sichten für die Gather-Zugriffe
+        self._tops = self.tops.reshape(len(self.tops), -1)
+        self._saturation = self.saturation.reshape(len(self.saturation), -1)
+        self._pressure = self.pressure.reshape(-1)
+        self._pending = 0
+
+    @classmethod
+    def uniform(cls, nx=1, ny=1, dx=100.0, dz=50.0, diffusion=0.0):
+        """Ebene Schichten aus ``SCHICHTEN`` und volle Sättigung, wie das 1D-Modell."""
+        tops = np.repeat([[layer["tiefe"]] for layer in SCHICHTEN], ny * nx, axis=1).reshape(-1, ny, nx)
+        return cls(tops, dx=dx, dz=dz, diffusion=diffusion)
+
+    @classmethod
+    def generate(cls, nx=40, ny=20, dx=100.0, dz=50.0, relief=150.0, diffusion=0.001, seed=None):
+        """Gewölbte Schichtflächen um die Tiefen aus ``SCHICHTEN`` und glatt variierende Sättigung."""
+        rng = np.random.default_rng(seed)
+        x = np.arange(nx) * dx
+        y = np.arange(ny) * dx
+        extent = max(nx, ny) * dx
+
+        def smooth(waves=4):
+            # Summe weniger Sinuswellen über das Feld, Wertebereich etwa [-1, 1]
+            field = np.zeros((ny, nx))
+            for _ in range(waves):
+                kx, ky = rng.uniform(0.5, 2.5, 2) * 2 * np.pi / extent
+                field += np.sin(kx * x[None, :] + rng.uniform(0, 2 * np.pi)) \
+                    * np.cos(ky * y[:, None] + rng.uniform(0, 2 * np.pi))
+            return field / waves
+
+        tops = np.empty((len(SCHICHTEN), ny, nx))
+        for i, layer in enumerate(SCHICHTEN):
+            tops[i] = layer["tiefe"] + (relief * smooth() if i else 0.0)
+        # Schichten dürfen sich nicht überschneiden
+        np.maximum.accumulate(tops, axis=0, out=tops)
+        nz = int(math.ceil(MAX_TIEFE / dz)) + 1
+        lateral = smooth()
+        depth = np.arange(nz)[:, None, None] * dz
+        saturation = np.clip(0.8 + 0.2 * lateral[None] + 0.1 * np.sin(depth / 400.0 + lateral[None]), 0.0, 1.0)
+        return cls(tops, saturation, dx, dz, diffusion)
+
+    @property
+    def shape(self):
+        return self.tops.shape[1:]
+
+    def cell_index(self, x, y):
+        """Flacher Zellindex für Feldkoordinaten in Metern, am Rand abgeschnitten."""
+        ny, nx = self.shape
+        ix = np.clip(np.asarray(x) / self.dx, 0, nx - 1).astype(np.intp)
+        iy = np.clip(np.asarray(y) / self.dx, 0, ny - 1).astype(np.intp)
+        return iy * nx + ix
+
+    def layer_index(self, cell, depth):
+        """Schicht je Punkt: Zahl der Oberkanten oberhalb von ``depth`` minus eins."""
+        return np.count_nonzero(self._tops[:, cell] <= depth, axis=0) - 1
+
+    def oil_content(self, cell, depth, layer):
+        iz = (np.asarray(depth) / self.dz).astype(np.intp)
+        np.minimum(iz, len(self.saturation) - 1, out=iz)
+        return self.oelgehalt[layer] * self._saturation[iz, cell]
+
+    def deplete(self, cell, amount, frames=1):
+        """Druck der Zellen um ``amount`` senken (mehrere Bohrungen je Zelle addieren sich), dann ausgleichen."""
+        p = self._pressure
+        np.subtract.at(p, cell, amount)
+        p[cell] = np.maximum(p[cell], self.min_pressure)
+        if self.diffusion:
+            self._pending += frames
+            if self._pending >= self.diffuse_every:
+                self._diffuse(self._pending)
+                self._pending = 0
+
+    def _diffuse(self, frames):
+        # Explizite Diffusion als Flüsse zwischen Nachbarzellen (erhält die Summe, Rand dicht);
+        # stabil bis 0.2 je Teilschritt, Mittelwerte unterschreiten das Minimum nicht
+        steps = max(1, int(math.ceil(self.diffusion * frames / 0.2)))
+        rate = self.diffusion * frames / steps
+        p = self.pressure
+        for _ in range(steps):
+            flux_x = np.diff(p, axis=1) * rate
+            flux_y = np.diff(p, axis=0) * rate
+            p[:, :-1] += flux_x
+            p[:, 1:] -= flux_x
+            p[:-1] += flux_y
+            p[1:] -= flux_y
+
+
+class WellBank:
+    """Bohrungen mit Ansatzpunkt ``x, y`` (Meter im Feld) und Ablenkung ``kick_x, kick_y`` (Meter je Meter Tiefe)."""
+
+    __slots__ = ("grid", "x", "y", "kick_x", "kick_y", "depth", "wear", "downtime", "layer", "rate",
+                 "rng", "_cell")
+
+    def __init__(self, grid, x, y, kick_x=0.0, kick_y=0.0, seed=None):
+        self.grid = grid
+        self.x = np.atleast_1d(np.asarray(x, dtype=np.float64))
+        n = len(self.x)
+        self.y = np.broadcast_to(np.asarray(y, dtype=np.float64), (n,)).copy()
+        self.kick_x = np.broadcast_to(np.asarray(kick_x, dtype=np.float64), (n,)).copy()
+        self.kick_y = np.broadcast_to(np.asarray(kick_y, dtype=np.float64), (n,)).copy()
+        self.depth = np.zeros(n)
+        self.wear = np.zeros(n)
+        self.downtime = np.zeros(n, dtype=np.int64)
+        self.layer = np.zeros(n, dtype=np.intp)
+        self.rate = np.zeros(n)
+        self.rng = np.random.default_rng(seed)
+        self._cell = grid.cell_index(self.x, self.y)
+
+    def __len__(self):
+        return len(self.x)
+
+    def bottom_hole(self):
+        """Lage der Bohrköpfe in Feldkoordinaten (x, y, Tiefe)."""
+        return self.x + self.kick_x * self.depth, self.y + self.kick_y * self.depth, self.depth
+
+    def drill(self, speed, widerstand_scale=1.0, roll_repairs=True, frames=1):
+        # Schicht am Bohrkopf vor dem Bohren bestimmt Widerstand und später den Ölgehalt
+        grid = self.grid
+        x, y, depth = self.bottom_hole()
+        cell = self._cell = grid.cell_index(x, y)
+        layer = self.layer = grid.layer_index(cell, depth)
+        drilling = (depth < MAX_TIEFE) & (self.wear < 100)
+        if self.downtime.any():
+            waiting = (depth < MAX_TIEFE) & (self.downtime > 0)
+            self.downtime[waiting] = np.maximum(0, self.downtime[waiting] - frames)
+            drilling &= ~waiting
+        widerstand = grid.widerstand[layer] * widerstand_scale
+        self.depth += np.where(drilling, speed / widerstand * frames, 0.0)
+        self.wear += np.where(drilling, 0.01 * widerstand * frames, 0.0)
+
+        # Bohrkopf-Reparatur wenn stark verschlissen
+        worn = self.wear > 90
+        if roll_repairs and worn.any():
+            p = 0.1 if frames == 1 else 1 - 0.9 ** frames
+            repaired = worn & (self.rng.random(len(self)) < p)
+            self.wear[repaired] = np.maximum(0, self.wear[repaired] - 30)
+
+    def produce(self, frames=1):
+        """Förderung je Bohrung nach dem Druck ihrer Zelle; Summe in Barrel/s."""
+        grid = self.grid
+        cell = self._cell
+        producing = self.depth > grid._tops[PRODUCTIVE_LAYER, cell]
+        if producing.any():
+            content = grid.oil_content(cell, self.depth, self.layer)
+            self.rate = np.where(producing, content * 0.5 * (grid._pressure[cell] / 100), self.rate)
+            grid.deplete(cell[producing], 0.01 * frames, frames)
+        return float(self.rate.sum())
+
+    def pressure(self):
+        """Reservoirdruck an den Bohrköpfen."""
+        return self.grid._pressure[self._cell]
+
+    def repair(self, downtime=0, threshold=None, amount=None):
+        """Alle Bohrköpfe (oder nur die über ``threshold``) instand setzen."""
+        selected = slice(None) if threshold is None else self.wear > threshold
+        self.wear[selected] = 0 if amount is None else np.maximum(0, self.wear[selected] - amount)
+        if downtime:
+            self.downtime[selected] = downtime
+
+
+def well_pattern(n, spacing=300.0, center=(2000.0, 1000.0), kick=0.25):
+    """``n`` Bohrungen: die erste senkrecht im Zentrum, weitere abgelenkt im Kreis, ab 9 im Raster."""
+    cx, cy = center
+    if n <= 9:
+        angles = np.linspace(0, 2 * np.pi, max(1, n - 1), endpoint=False)
+        wells = [(cx, cy, 0.0, 0.0)] + [(cx, cy, kick * math.cos(a), kick * math.sin(a)) for a in angles[:n - 1]]
+        return tuple(wells)
+    side = int(math.ceil(math.sqrt(n)))
+    offsets = (np.arange(side) - (side - 1) / 2) * spacing
+    return tuple((cx + offsets[i % side], cy + offsets[i // side], 0.0, 0.0) for i in range(n))
+
+
+def field_from_scenario(sc, seed=None):
+    """Gitter und Bohrungen für ``sc.wells``."""
+    rng = np.random.default_rng(seed)
+    nx, ny = sc.field_cells
+    grid = SubsurfaceGrid.generate(nx, ny, sc.field_spacing, relief=sc.field_relief,
+                                   seed=int(rng.integers(2 ** 63)))
+    x, y, kick_x, kick_y = np.array(sc.wells, dtype=np.float64).T
+    return WellBank(grid, x, y, kick_x, kick_y, seed=int(rng.integers(2 ** 63)))
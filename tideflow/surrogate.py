@@ -0,0 +1,265 @@
+"""Surrogatmodell für sofortige Was-wäre-wenn-Abfragen.
+
+Ein langer Headless-Lauf dauert Sekunden; das Surrogat beantwortet dieselbe
+Frage in Mikrosekunden. Ein Gauß-Prozess (quadratisch-exponentieller Kern mit
+eigener Längenskala je Parameter) wird auf Läufe über die Parameter aus
+``sensitivity.PARAMETERS`` angepasst und sagt erzeugte Energie, Förderung und
+geringste Säulengesundheit samt Standardabweichung voraus.
+
+* Eingaben werden auf [0, 1] skaliert, jede Kennzahl auf Mittel 0 und Streuung
+  1; alle Kennzahlen teilen sich Kern und Inverse.
+* Längenskalen und Rauschen maximieren die Randlikelihood (Koordinatensuche
+  in logarithmischen Schritten, ohne SciPy).
+* Neue Läufe erweitern die Inverse der Kernmatrix über das Schur-Komplement in
+  O(n²); erst wenn sich die Zahl der Läufe seit der letzten Anpassung
+  verdoppelt hat, werden die Hyperparameter neu bestimmt.
+* Die Stichproben setzen die Sobol-Folge fort, so dass nachgereichte Läufe
+  die Lücken der bisherigen füllen.
+"""
+
+import json
+import math
+
+import numpy as np
+
+from .scenario import get_scenario
+from .sensitivity import PARAMETERS, evaluate_all, scale, sobol_sequence
+
+OUTPUTS = ("energy", "oil", "min_health")
+
+# Grenzen der Hyperparameter (Längenskala in Einheiten des Einheitswürfels, Rauschen relativ)
+LENGTH_BOUNDS = (0.02, 20.0)
+NOISE_BOUNDS = (1e-6, 1.0)
+
+
+def rbf_kernel(a, b):
+    """Kernmatrix zwischen bereits durch die Längenskalen geteilten Punkten ``a`` und ``b``."""
+    d2 = np.sum(a * a, axis=1)[:, None] + np.sum(b * b, axis=1)[None, :] - 2 * a @ b.T
+    return np.exp(-0.5 * np.maximum(d2, 0.0))
+
+
+def log_likelihood(x, y, lengths, noise):
+    """Logarithmische Randlikelihood der normierten Kennzahlen ``y`` (n, m), summiert über m."""
+    n, m = y.shape
+    k = rbf_kernel(x / lengths, x / lengths) + noise * np.eye(n)
+    try:
+        chol = np.linalg.cholesky(k)
+    except np.linalg.LinAlgError:
+        return -math.inf
+    z = np.linalg.solve(chol, y)
+    return float(-0.5 * np.sum(z * z) - m * np.sum(np.log(np.diag(chol))) - 0.5 * n * m * math.log(2 * math.pi))
+
+
+def fit_hyperparameters(x, y, lengths=None, noise=1e-4, step=1.0, tolerance=0.05, rounds=40):
+    """Längenskalen und Rauschen per Koordinatensuche auf der Randlikelihood."""
+    d = x.shape[1]
+    params = np.log(np.append(np.full(d, 0.5) if lengths is None else lengths, noise))
+    low = np.log([LENGTH_BOUNDS[0]] * d + [NOISE_BOUNDS[0]])
+    high = np.log([LENGTH_BOUNDS[1]] * d + [NOISE_BOUNDS[1]])
+    params = np.clip(params, low, high)
+    best = log_likelihood(x, y, np.exp(params[:d]), math.exp(params[d]))
+    for _ in range(rounds):
+        improved = False
+        for i in range(d + 1):
+            for sign in (1, -1):
+                trial = params.copy()
+                trial[i] = min(high[i], max(low[i], trial[i] + sign * step))
+                if trial[i] == params[i]:
+                    continue
+                value = log_likelihood(x, y, np.exp(trial[:d]), math.exp(trial[d]))
+                if value > best:
+                    params, best, improved = trial, value, True
+                    break
+        if not improved:
+            step /= 2
+            if step < tolerance:
+                break
+    return np.exp(params[:d]), float(math.exp(params[d])), best
+
+
+class GaussianProcess:
+    """Gauß-Prozess mit gemeinsamer Inverse für mehrere Kennzahlen; Eingaben in [0, 1]^d."""
+
+    __slots__ = ("lengths", "noise", "x", "y", "y_mean", "y_scale", "likelihood", "fitted_at",
+                 "_scaled", "_inverse", "_alpha", "_std_scale")
+
+    def __init__(self, lengths, noise=1e-4):
+        self.lengths = np.asarray(lengths, dtype=np.float64)
+        self.noise = float(noise)
+        self.likelihood = None
+        self.fitted_at = 0
+
+    def __len__(self):
+        return len(self.x)
+
+    def fit(self, x, y, optimize=True):
+        """Auf alle Läufe ``x`` (n, d) mit Kennzahlen ``y`` (n, m) anpassen."""
+        self.x = np.asarray(x, dtype=np.float64).copy()
+        self.y = np.asarray(y, dtype=np.float64).copy()
+        self.y_mean = self.y.mean(axis=0)
+        spread = self.y.std(axis=0)
+        self.y_scale = np.where(spread > 0, spread, 1.0)
+        if optimize:
+            self.lengths, self.noise, self.likelihood = fit_hyperparameters(
+                self.x, self._normalized(self.y), self.lengths, self.noise)
+            self.fitted_at = len(self.x)
+        self._factorize()
+        return self
+
+    def _normalized(self, y):
+        return (y - self.y_mean) / self.y_scale
+
+    def _factorize(self):
+        self._scaled = self.x / self.lengths
+        k = rbf_kernel(self._scaled, self._scaled) + self.noise * np.eye(len(self.x))
+        chol_inverse = np.linalg.inv(np.linalg.cholesky(k))
+        self._inverse = chol_inverse.T @ chol_inverse
+        self._update_alpha()
+
+    def _update_alpha(self):
+        self._alpha = self._inverse @ self._normalized(self.y)
+        # Bisher konstante Kennzahlen (etwa Öl vor Erreichen der Lagerstätte) ohne Unsicherheit
+        self._std_scale = np.where(np.ptp(self.y, axis=0) > 0, self.y_scale, 0.0)
+
+    def add(self, x, y):
+        """Läufe anhängen; die Inverse wächst je Lauf über das Schur-Komplement in O(n²)."""
+        for row, values in zip(np.atleast_2d(x), np.atleast_2d(y)):
+            scaled = row / self.lengths
+            k = rbf_kernel(self._scaled, scaled[None, :])[:, 0]
+            v = self._inverse @ k
+            schur = 1.0 + self.noise - k @ v
+            if schur <= 1e-12:
+                # Numerisch nicht mehr positiv definit: komplett neu zerlegen
+                self.x = np.vstack([self.x, row])
+                self.y = np.vstack([self.y, values])
+                self._factorize()
+                continue
+            n = len(self.x)
+            inverse = np.empty((n + 1, n + 1))
+            inverse[:n, :n] = self._inverse + np.outer(v, v) / schur
+            inverse[:n, n] = inverse[n, :n] = -v / schur
+            inverse[n, n] = 1.0 / schur
+            self._inverse = inverse
+            self._scaled = np.vstack([self._scaled, scaled])
+            self.x = np.vstack([self.x, row])
+            self.y = np.vstack([self.y, values])
+        self._update_alpha()
+        return self
+
+    def predict(self, x):
+        """Mittelwert und Standardabweichung (ohne Rauschen) je Punkt und Kennzahl, Form (p, m)."""
+        k = rbf_kernel(np.atleast_2d(x) / self.lengths, self._scaled)
+        mean = k @ self._alpha
+        variance = 1.0 - np.einsum("ij,jk,ik->i", k, self._inverse, k)
+        std = np.sqrt(np.maximum(variance, 0.0))[:, None] * self._std_scale
+        return mean * self.y_scale + self.y_mean, std
+
+    def predict_one(self, u):
+        """Schneller Pfad für einen Punkt ``u`` (d,): Tupel aus Mittelwert und Streuung je Kennzahl."""
+        diff = self._scaled - u / self.lengths
+        k = np.exp(-0.5 * np.einsum("ij,ij->i", diff, diff))
+        variance = 1.0 - k @ self._inverse @ k
+        return k @ self._alpha * self.y_scale + self.y_mean, math.sqrt(max(variance, 0.0)) * self._std_scale
+
+    def loo_errors(self):
+        """Leave-one-out-Residuen aller Läufe in Einheiten der Kennzahlen (geschlossene Form)."""
+        return self._alpha / np.diag(self._inverse)[:, None] * self.y_scale
+
+
+class Surrogate:
+    """Surrogat eines Szenarios über die Parameter ``names`` (Teilmenge von ``PARAMETERS``).
+
+    Alle Läufe nutzen ``steps`` Schritte und denselben ``seed``, so dass das
+    Modell die Wirkung der Parameter lernt und nicht das Würfeln.
+    """
+
+    def __init__(self, scenario="7", names=None, steps=6000, seed=0, outputs=OUTPUTS):
+        self.names = tuple(names or PARAMETERS)
+        unknown = set(self.names) - set(PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unbekannte Parameter {', '.join(sorted(unknown))}, verfügbar: {', '.join(PARAMETERS)}")
+        self.scenario = scenario
+        self.steps = steps
+        self.seed = seed
+        self.outputs = tuple(outputs)
+        self.bounds = np.array([PARAMETERS[name] for name in self.names], dtype=np.float64)
+        self.gp = None
+        base = get_scenario(scenario)
+        # Standardwerte für nicht angegebene Parameter: Szenario, sonst Mitte der Grenzen
+        self.defaults = np.array([
+            getattr(base, name) if getattr(base, name) is not None and low <= getattr(base, name) <= high
+            else (low + high) / 2 for name, (low, high) in zip(self.names, self.bounds)])
+
+    def __len__(self):
+        return 0 if self.gp is None else len(self.gp)
+
+    def encode(self, values):
+        low, high = self.bounds[:, 0], self.bounds[:, 1]
+        return (np.asarray(values, dtype=np.float64) - low) / (high - low)
+
+    def decode(self, u):
+        return scale(u, self.bounds)
+
+    def fit(self, values, results):
+        """Auf Parameterwerte ``values`` (n, d) und Kennzahlen ``results`` (n, m) anpassen."""
+        self.gp = GaussianProcess(np.full(len(self.names), 0.5)).fit(self.encode(values), results)
+        return self
+
+    def update(self, values, results, refit=None):
+        """Neue Läufe einarbeiten; ``refit=None`` passt die Hyperparameter an, sobald sich die Läufe verdoppelt haben."""
+        if self.gp is None:
+            return self.fit(values, results)
+        self.gp.add(self.encode(values), results)
+        if refit or refit is None and len(self.gp) >= 2 * self.gp.fitted_at:
+            self.gp.fit(self.gp.x, self.gp.y)
+        return self
+
+    def sample(self, n):
+        """Nächste ``n`` Parameterpunkte der Sobol-Folge (ohne den Nullpunkt)."""
+        return self.decode(sobol_sequence(n, len(self.names), skip=len(self) + 1))
+
+    def run(self, n, workers=None):
+        """``n`` weitere Läufe auf dem Headless-Kern rechnen und einarbeiten."""
+        values = self.sample(n)
+        results = evaluate_all(self.scenario, self.names, values, self.steps, self.seed, workers,
+                               outputs=self.outputs)
+        return self.update(values, results)
+
+    def predict(self, values):
+        """Mittelwert und Standardabweichung für Parameterzeilen ``values`` (p, d), je Form (p, m)."""
+        return self.gp.predict(self.encode(values))
+
+    def query(self, **params):
+        """Was wäre, wenn: Dict Kennzahl -> (Mittelwert, Standardabweichung) für einzelne Parameter."""
+        unknown = set(params) - set(self.names)
+        if unknown:
+            raise ValueError(f"Parameter {', '.join(sorted(unknown))} nicht im Modell ({', '.join(self.names)})")
+        values = self.defaults.copy()
+        for name, value in params.items():
+            values[self.names.index(name)] = value
+        mean, std = self.gp.predict_one(self.encode(values))
+        return {output: (float(mean[j]), float(std[j])) for j, output in enumerate(self.outputs)}
+
+    def cross_validation(self):
+        """Leave-one-out-RMSE je Kennzahl."""
+        errors = self.gp.loo_errors()
+        return dict(zip(self.outputs, np.sqrt(np.mean(errors ** 2, axis=0)).tolist()))
+
+    def save(self, path):
+        meta = {"scenario": self.scenario, "names": self.names, "steps": self.steps, "seed": self.seed,
+                "outputs": self.outputs, "noise": self.gp.noise, "fitted_at": self.gp.fitted_at}
+        np.savez(path, meta=json.dumps(meta), x=self.gp.x, y=self.gp.y, lengths=self.gp.lengths,
+                 y_mean=self.gp.y_mean, y_scale=self.gp.y_scale)
+
+    @classmethod
+    def load(cls, path):
+        """Gespeichertes Modell laden; die Inverse wird aus den Läufen neu zerlegt."""
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            model = cls(meta["scenario"], meta["names"], meta["steps"], meta["seed"], meta["outputs"])
+            gp = model.gp = GaussianProcess(data["lengths"], meta["noise"])
+            gp.x, gp.y = data["x"], data["y"]
+            gp.y_mean, gp.y_scale = data["y_mean"], data["y_scale"]
+        gp.fitted_at = meta["fitted_at"]
+        gp._factorize()
+        return model
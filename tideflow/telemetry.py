@@ -0,0 +1,263 @@
+"""Telemetrie aufzeichnen und per Memory-Map wieder abspielen.
+
+Jeder aufgezeichnete Schritt ist ein Datensatz fester Größe (NumPy-Strukturtyp)
+mit Plattform-Pose, Bohr- und Wetterzustand, Tragwerks- und Gerätezustand. Die
+Datensätze liegen hintereinander in einer Binärdatei, Szenario und Datentyp in
+einer JSON-Datei daneben. Weil alle Datensätze gleich groß sind, ist der
+Zeitindex eine Rechnung: Schritt ``s`` liegt an Position
+``(s - start) // every``. ``TelemetryReplay`` liest über ``np.memmap`` nur die
+Seiten, die gerade gebraucht werden; der Speicherbedarf hängt nicht von der
+Lauflänge ab.
+"""
+
+import dataclasses
+import json
+import os
+
+import numpy as np
+
+from .analytic import Vec
+from .engine import Simulation
+from .geology import SCHICHTEN
+from .scenario import Scenario
+
+# Skalare Zustandsgrößen der Simulation, die die Darstellung braucht
+SCALARS = ("bohrtiefe", "bohrgeschwindigkeit", "bohrer_verschleiss", "oelfoerderung",
+           "reservoir_druck", "wave_amplitude", "wave_frequency", "current_speed",
+           "wind_speed", "wind_direction", "temperature", "storm_intensity",
+           "material_fatigue", "wave_factor_x", "wave_factor_y", "tageszeit", "power")
+WEATHER = ("regen", "nebel", "wolken")
+# Optionale Teilsysteme der Simulation, die nicht aufgezeichnet werden; im
+# Abspielzustand stehen sie auf ``None`` und die View lässt sie weg
+UNRECORDED = ("metocean", "wells", "debris")
+
+
+def header_path(path):
+    return path + ".json"
+
+
+def telemetry_dtype(sim):
+    """Strukturtyp eines Datensatzes für die Simulation ``sim``."""
+    fields = [("time_step", "<i8"), ("x", "<f8"), ("y", "<f8"), ("angle", "<f8"), ("layer", "<i1"),
+              ("tide_level", "<f8")]
+    fields += [(name, "<f8") for name in SCALARS + WEATHER]
+    if sim.structure is not None:
+        fields.append(("member_health", "<f8", (len(sim.structure),)))
+    if sim.wind_turbines is not None:
+        fields.append(("turbine_rotation", "<f8", (len(sim.wind_turbines),)))
+        fields.append(("turbine_health", "<f8", (len(sim.wind_turbines),)))
+        fields.append(("generator_health", "<f8", (len(sim.wave_generators),)))
+    return np.dtype(fields)
+
+
+class TelemetryRecorder:
+    """Schreibt jeden ``every``-ten Schritt; gepuffert, mit konstantem Speicher."""
+
+    def __init__(self, path, sim, every=1, buffer_size=1024):
+        self.path = path
+        self.sim = sim
+        self.every = every
+        self.dtype = telemetry_dtype(sim)
+        self._buffer = np.zeros(buffer_size, dtype=self.dtype)
+        self._count = 0
+        self._written = 0  # Datensätze in der Datei
+        self._map = None  # Memory-Map der Datei für ``series``, wächst mit der Aufzeichnung
+        self.start = None
+        self._file = open(path, "wb")
+
+    def _write_header(self):
+        header = {
+            "scenario": dataclasses.asdict(self.sim.scenario),
+            "dtype": np.lib.format.dtype_to_descr(self.dtype),
+            "start": self.start,
+            "every": self.every,
+        }
+        with open(header_path(self.path), "w", encoding="utf-8") as f:
+            json.dump(header, f)
+
+    def record(self):
+        sim = self.sim
+        if self.start is None:
+            self.start = sim.time_step
+            self._write_header()
+        elif (sim.time_step - self.start) % self.every:
+            return
+        row = self._buffer[self._count]
+        position = sim.physics.position
+        row["time_step"] = sim.time_step
+        row["x"], row["y"], row["angle"] = position.x, position.y, sim.physics.angle
+        row["layer"] = SCHICHTEN.index(sim.current_layer)
+        row["tide_level"] = sim.tide_level()  # synthetisch oder aus der Messreihe
+        for name in SCALARS:
+            row[name] = getattr(sim, name)
+        for name in WEATHER:
+            row[name] = sim.wetterbedingungen[name]
+        if sim.structure is not None:
+            row["member_health"] = sim.structure.health
+        if sim.wind_turbines is not None:
+            row["turbine_rotation"] = sim.wind_turbines.blades_rotation
+            row["turbine_health"] = sim.wind_turbines.health
+            row["generator_health"] = sim.wave_generators.health
+        self._count += 1
+        if self._count == len(self._buffer):
+            self.flush()
+
+    def flush(self):
+        self._file.write(self._buffer[:self._count].tobytes())
+        self._file.flush()
+        self._written += self._count
+        self._count = 0
+
+    def series(self, field, t0, t1, max_points=None):
+        """Bisher aufgezeichnete Werte eines Feldes zwischen zwei Schritten.
+
+        Geschriebene Datensätze kommen aus einer Memory-Map, die nur neu
+        angelegt wird, wenn die Datei über den gemappten Bereich hinaus
+        gewachsen ist; noch gepufferte kommen direkt aus dem Puffer.
+        """
+        if self.start is None:
+            return None
+        if self._written and (self._map is None or len(self._map) < self._written):
+            self._map = np.memmap(self.path, dtype=self.dtype, mode="r", shape=(self._written,))
+        count = self._written + self._count
+        i0 = _index(t0, self.start, self.every, count)
+        i1 = _index(t1, self.start, self.every, count) + 1
+        stride = max(1, (i1 - i0) // max_points) if max_points else 1
+        rows = np.arange(i0, i1, stride)
+        split = np.searchsorted(rows, self._written)
+        buffered = self._buffer[rows[split:] - self._written]
+        if not split:
+            return buffered["time_step"].copy(), buffered[field].copy()
+        mapped = self._map[rows[:split]]
+        return (np.concatenate([mapped["time_step"], buffered["time_step"]]),
+                np.concatenate([mapped[field], buffered[field]]))
+
+    def close(self):
+        self.flush()
+        self._file.close()
+        self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _index(step, start, every, count):
+    # Position des Datensatzes zum Schritt ``step``, auf [0, count) begrenzt
+    return min(max((int(step) - start) // every, 0), count - 1)
+
+
+def _tuples(value):
+    # JSON-Listen zurück in (verschachtelte) Tupel wie im Szenario
+    return tuple(_tuples(item) for item in value) if isinstance(value, list) else value
+
+
+class _Pose:
+    # Ersatz für das Physik-Backend: nur die Pose, die die View liest
+    iterations = 10
+
+    def __init__(self):
+        self.position = Vec(0.0, 0.0)
+        self.angle = 0.0
+
+
+class ReplayState:
+    """Zustand zu einem aufgezeichneten Schritt, mit den Attributen einer ``Simulation``."""
+
+    water_level = Simulation.water_level
+
+    def __init__(self, scenario):
+        self.scenario = sc = scenario
+        self.physics = _Pose()
+        self.time_step = 0
+        for name in UNRECORDED:
+            setattr(self, name, None)
+        self.recorded_tide = None  # fehlt in Aufzeichnungen ohne Gezeitenkanal
+        self.wetterbedingungen = dict.fromkeys(WEATHER, 0.0)
+        self.current_layer = SCHICHTEN[0]
+        self.structure = None
+        if sc.column_health:
+            from .structure import platform_structure
+            self.structure = platform_structure(sc)
+        self.wind_turbines = self.wave_generators = None
+        if sc.energy == "devices":
+            from .devices import platform_devices
+            self.wind_turbines, self.wave_generators = platform_devices(
+                sc.platform_x, sc.platform_y, sc.platform_width, sc.platform_height)
+
+    def tide_level(self):
+        if self.recorded_tide is None:
+            return Simulation.tide_level(self)
+        return self.recorded_tide
+
+    def load(self, row):
+        names = row.dtype.names
+        self.time_step = int(row["time_step"])
+        self.physics.position = Vec(float(row["x"]), float(row["y"]))
+        self.physics.angle = float(row["angle"])
+        self.current_layer = SCHICHTEN[int(row["layer"])]
+        if "tide_level" in names:
+            self.recorded_tide = float(row["tide_level"])
+        for name in SCALARS:
+            setattr(self, name, float(row[name]))
+        for name in WEATHER:
+            self.wetterbedingungen[name] = float(row[name])
+        if "member_health" in names:
+            self.structure.health[:] = row["member_health"]
+        if "turbine_rotation" in names:
+            self.wind_turbines.blades_rotation[:] = row["turbine_rotation"]
+            self.wind_turbines.health[:] = row["turbine_health"]
+            self.wave_generators.health[:] = row["generator_health"]
+
+
+class TelemetryReplay:
+    """Aufzeichnung als Memory-Map mit Zugriff in O(1) auf jeden Schritt."""
+
+    def __init__(self, path):
+        with open(header_path(path), encoding="utf-8") as f:
+            header = json.load(f)
+        values = {key: _tuples(value) for key, value in header["scenario"].items()}
+        self.scenario = Scenario(**values)
+        self.dtype = np.lib.format.descr_to_dtype(
+            [tuple(field) for field in header["dtype"]])
+        self.start = header["start"]
+        self.every = header["every"]
+        count = os.path.getsize(path) // self.dtype.itemsize
+        self.records = np.memmap(path, dtype=self.dtype, mode="r", shape=(count,)) if count else \
+            np.zeros(0, dtype=self.dtype)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def first_step(self):
+        return self.start
+
+    @property
+    def last_step(self):
+        return self.start + (len(self) - 1) * self.every
+
+    def index(self, step):
+        """Position des Datensatzes zum Schritt ``step`` (auf den Bereich begrenzt)."""
+        return _index(step, self.start, self.every, len(self))
+
+    def series(self, field, t0, t1, max_points=None):
+        """``(schritte, werte)`` eines Feldes zwischen zwei Schritten (inklusive).
+
+        Mit ``max_points`` wird mit fester Schrittweite gelesen, sodass nur ein
+        Teil der Seiten der Datei angefasst wird.
+        """
+        if not len(self):
+            return None
+        i0, i1 = self.index(t0), self.index(t1) + 1
+        stride = max(1, (i1 - i0) // max_points) if max_points else 1
+        rows = slice(i0, i1, stride)
+        return np.asarray(self.records["time_step"][rows]), np.asarray(self.records[field][rows])
+
+    def state(self, index, into=None):
+        """Zustand an Position ``index``; ``into`` wird wiederverwendet, wenn angegeben."""
+        state = into if into is not None else ReplayState(self.scenario)
+        state.load(self.records[index])
+        return state
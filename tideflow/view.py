@@ -0,0 +1,405 @@
+"""Pygame-Darstellung und Eingabe für eine ``Simulation``."""
+
+import math
+import random
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+
+from .colors import (BLACK, BLUE, DARK_BLUE, DARK_GRAY, GRAY, GREEN,
+                     LIGHT_BLUE, RED, WHITE, YELLOW)
+from .engine import Simulation
+from .geology import SCHICHTEN
+from .governor import QualityGovernor
+from .sky import CloudSprites, SkyRenderer
+
+
+class View:
+    def __init__(self, sim, budget_ms=None, offscreen=False, live_plot=True, recorder=None):
+        self.sim = sim
+        self.recorder = recorder
+        self.offscreen = offscreen
+        sc = sim.scenario
+
+        # Pygame-Initialisierung; offscreen wird nur in eine Surface gezeichnet
+        pygame.init()
+        if offscreen:
+            self.screen = pygame.Surface((sc.width, sc.height))
+        else:
+            self.screen = pygame.display.set_mode((sc.width, sc.height))
+            pygame.display.set_caption(sc.title)
+
+        # Schrift und Statistik-Oberfläche nur einmal anlegen
+        self.font = pygame.font.Font(None, 24 if sc.weather == "full" else 20)
+        self.stats_surface = pygame.Surface((350, 290))
+
+        # Uhr für die Zeitmessung
+        self.clock = pygame.time.Clock()
+        self.last_time = time.perf_counter()
+        self.fps_history = deque(maxlen=30)
+
+        # Himmel und Wolken werden vorberechnet und nur noch geblittet
+        if sc.weather == "full":
+            self.sky = SkyRenderer(sc.width, sc.column_y - 50)
+            self.clouds = CloudSprites()
+
+        # Qualitätsregler: Frame-Budget aus der Ziel-FPS des Szenarios
+        self.governor = QualityGovernor(budget_ms or 1000 / sc.fps)
+
+        self._field_profiles = None
+
+        self.plot = None
+        if sc.plot and live_plot and not offscreen:
+            from .plot import LivePlot
+            # Beim Hineinzoomen Rohwerte aus der laufenden Aufzeichnung holen
+            fetch = recorder.series if recorder is not None else None
+            self.plot = LivePlot(sc.plot, sc.history_length, sc.plot_interval, fetch=fetch)
+
+    def handle_events(self):
+        sim = self.sim
+        running = True
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            # Tastendruck für Steuerung
+            elif event.type == pygame.KEYDOWN and sim.scenario.controls == "drill":
+                if event.key == pygame.K_UP:
+                    sim.adjust_drill_speed(0.2)
+                elif event.key == pygame.K_DOWN:
+                    sim.adjust_drill_speed(-0.2)
+                elif event.key == pygame.K_r:
+                    # Bohrkopf reparieren
+                    sim.repair_bit()
+                elif event.key == pygame.K_s:
+                    # Sturm auslösen
+                    sim.trigger_storm()
+
+        # Benutzersteuerung über gehaltene Pfeiltasten
+        if sim.scenario.controls == "flow":
+            keys = pygame.key.get_pressed()
+            sim.adjust_flow(
+                current_delta=0.1 * (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]),
+                wind_delta=0.1 * (keys[pygame.K_UP] - keys[pygame.K_DOWN]))
+        return running
+
+    def draw(self):
+        sim = self.sim
+        sc = sim.scenario
+        screen = self.screen
+        screen.fill(DARK_BLUE)
+
+        water_level = sim.water_level()
+        if sc.weather == "full":
+            self.draw_sky()
+        if sc.water_waves:
+            self.draw_water_surface(water_level)
+        else:
+            pygame.draw.rect(screen, BLUE, (0, water_level, sc.width, sc.height - water_level))
+        if sc.drilling == "layered":
+            if sim.wells is not None:
+                self.draw_field(water_level)
+            else:
+                self.draw_geology(water_level)
+        if sim.wind_turbines is not None:
+            sim.wind_turbines.draw(screen)
+            sim.wave_generators.draw(screen)
+        if sc.draw_columns:
+            self.draw_columns()
+        if sim.debris is not None:
+            self.draw_debris()
+        self.draw_platform()
+        if sc.draw_drill:
+            self.draw_simple_drill()
+        if sc.spirals:
+            self.draw_spirals()
+        if sc.weather == "full":
+            self.draw_stats_panel()
+        else:
+            self.draw_hud()
+
+    def draw_sky(self):
+        sim = self.sim
+        sc = sim.scenario
+        screen = self.screen
+        wetter = sim.wetterbedingungen
+
+        # Himmelsverlauf je nach Tageszeit aus der Minutentabelle
+        self.sky.draw(screen, sim.tageszeit)
+
+        # Wolken
+        knobs = self.governor.knobs
+        if wetter["wolken"] > 2:
+            for i in range(min(int(wetter["wolken"]), knobs.clouds)):
+                cloud_x = (sim.time_step * 0.5 + i * 200) % (sc.width + 200) - 100
+                cloud_y = 50 + i * 20
+                cloud_radius = 30 + i * 5
+                self.clouds.draw(screen, cloud_x, cloud_y, cloud_radius)
+
+        # Regen (nur Darstellung, beeinflusst den Simulationszustand nicht)
+        if wetter["regen"] > 3:
+            for i in range(int(wetter["regen"] * 10 * knobs.rain)):
+                rain_x = random.randint(0, sc.width)
+                rain_y = random.randint(0, sc.column_y)
+                rain_length = random.randint(5, 15)
+                pygame.draw.line(screen, LIGHT_BLUE, (rain_x, rain_y),
+                                 (rain_x - 2, rain_y + rain_length), 1)
+
+    def draw_water_surface(self, water_level):
+        # Welleneffekt auf Wasseroberfläche
+        sim = self.sim
+        sc = sim.scenario
+        step = self.governor.knobs.water_step
+        for x in range(0, sc.width, step):
+            wave_y = water_level + sim.wave_amplitude * 0.5 * math.sin(sim.wave_frequency * (sim.time_step + x * 0.2))
+            pygame.draw.rect(self.screen, BLUE, (x, wave_y, step, sc.height - wave_y))
+
+    def draw_geology(self, water_level):
+        sim = self.sim
+        sc = sim.scenario
+        screen = self.screen
+        bohrturm_x = sc.bohrturm_x
+        bohrkopf_y = sc.platform_y
+
+        # Unterwasser-Sedimentschichten zeichnen
+        for schicht in SCHICHTEN:
+            if schicht["tiefe"] > sim.bohrtiefe:
+                layer_y = water_level + 50 + schicht["tiefe"] * 0.05  # Skalierung für die Anzeige
+                if layer_y < sc.height:
+                    pygame.draw.rect(screen, schicht["farbe"], (0, layer_y, sc.width, sc.height - layer_y))
+
+        # Bohrloch zeichnen
+        current_y = bohrkopf_y + min(sc.height - bohrkopf_y, sim.bohrtiefe * 0.05)
+        if sim.bohrtiefe > 0:
+            pygame.draw.line(screen, DARK_GRAY, (bohrturm_x, bohrkopf_y), (bohrturm_x, current_y), 4)
+
+        # Aktueller Bohrkopf
+        if current_y < sc.height:
+            verschleiss = sim.bohrer_verschleiss
+            drill_color = GREEN if verschleiss < 50 else (YELLOW if verschleiss < 80 else RED)
+            pygame.draw.circle(screen, drill_color, (bohrturm_x, int(current_y)), 5)
+
+    def draw_field(self, water_level):
+        # Schnitt durch die Gitterzeile der ersten Bohrung, im Maßstab der Tiefe (0.05 px/m) um den Bohrturm
+        sim = self.sim
+        sc = sim.scenario
+        screen = self.screen
+        wells = sim.wells
+        grid = wells.grid
+        origin = sc.bohrturm_x - wells.x[0] * 0.05
+        if self._field_profiles is None:
+            iy = int(grid.cell_index(wells.x[0], wells.y[0])) // grid.shape[1]
+            xs = (origin + (grid.dx * (0.5 + np.arange(grid.shape[1]))) * 0.05).tolist()
+            self._field_profiles = [
+                (layer["farbe"], [(0, tops[0])] + list(zip(xs, tops)) + [(sc.width, tops[-1])])
+                for layer, tops in zip(SCHICHTEN[1:], (grid.tops[1:, iy] * 0.05).tolist())]
+        top = water_level + 50
+        bottom = [(sc.width, sc.height), (0, sc.height)]
+        for color, profile in self._field_profiles:
+            pygame.draw.polygon(screen, color, [(x, top + y) for x, y in profile] + bottom)
+
+        # Bohrpfade in die Schnittebene projiziert, Bohrköpfe nach Verschleiß gefärbt
+        bohrkopf_y = sc.platform_y
+        x, _, depth = wells.bottom_hole()
+        for x0, x1, d, verschleiss in zip((origin + wells.x * 0.05).tolist(), (origin + x * 0.05).tolist(),
+                                          depth.tolist(), wells.wear.tolist()):
+            y1 = bohrkopf_y + min(sc.height - bohrkopf_y, d * 0.05)
+            if d > 0:
+                pygame.draw.line(screen, DARK_GRAY, (x0, bohrkopf_y), (x1, y1), 3)
+            if y1 < sc.height:
+                drill_color = GREEN if verschleiss < 50 else (YELLOW if verschleiss < 80 else RED)
+                pygame.draw.circle(screen, drill_color, (int(x1), int(y1)), 4)
+
+    def draw_columns(self):
+        sc = self.sim.scenario
+        if self.sim.structure is not None:
+            # Tragwerk mit Gesundheitsbalken in einem Durchgang
+            self.sim.structure.draw(self.screen)
+            return
+        for i in range(sc.num_columns):
+            left = int(sc.column_x(i) - sc.column_radius)
+            pygame.draw.rect(self.screen, GRAY, (left, sc.column_y, 2 * sc.column_radius, sc.column_height))
+
+    def draw_debris(self):
+        debris = self.sim.debris
+        visible = np.flatnonzero((debris.x > -debris.width) & (debris.x < self.sim.scenario.width + debris.width))
+        if debris.kind == "ice":
+            for corners in debris.corners(visible).tolist():
+                pygame.draw.polygon(self.screen, (225, 240, 250), corners)
+        else:
+            for x, y, r in zip(debris.x[visible].tolist(), debris.y[visible].tolist(),
+                               (debris.width[visible] / 2).tolist()):
+                pygame.draw.circle(self.screen, (120, 90, 50), (x, y), r)
+
+    def draw_platform(self):
+        sc = self.sim.scenario
+        position = self.sim.physics.position
+        pygame.draw.rect(self.screen, GRAY, (
+            int(position.x - sc.platform_width // 2),
+            int(position.y - sc.platform_height // 2),
+            sc.platform_width, sc.platform_height))
+
+        # Bohrturm zeichnen
+        if sc.drilling == "layered":
+            bohrturm_y = sc.platform_y - 50
+            pygame.draw.rect(self.screen, DARK_GRAY, (sc.bohrturm_x - 30, bohrturm_y - 80, 60, 80))
+
+    def draw_simple_drill(self):
+        sc = self.sim.scenario
+        bohrturm_y = sc.platform_y - 50
+        pygame.draw.rect(self.screen, BLACK, (sc.bohrturm_x - 15, bohrturm_y, 30, 80))
+        pygame.draw.circle(self.screen, RED, (sc.bohrturm_x, int(bohrturm_y + 50 + self.sim.bohrtiefe * 0.05)), 10)
+
+    def draw_spirals(self):
+        # Spiralförmige Generatoren an den Säulen
+        sc = self.sim.scenario
+        t = self.sim.time_step * 0.1
+        for i in range(sc.num_columns):
+            x = sc.column_x(i)
+            for j in range(sc.column_height // 10):
+                spiral_x = x + math.sin(j * 0.5 + t) * 6
+                pygame.draw.circle(self.screen, YELLOW, (int(spiral_x), sc.column_y + j * 10), 3)
+
+    def draw_hud(self):
+        sim = self.sim
+        lines = {
+            "temperature": ((20, 50), WHITE, f"Temperatur: {sim.temperature:.1f}°C"),
+            "wind": ((20, 70), WHITE, f"Windstärke: {sim.wind_speed:.1f} m/s"),
+            "energy": ((20, 90), YELLOW, f"Energie: {sim.power} kW"),
+            "fatigue": ((20, 110), RED, f"Materialermüdung: {sim.material_fatigue:.3f}"),
+            "oil": ((20, 130), WHITE, f"Ölförderung: {sim.oelfoerderung:.2f} Barrel/s"),
+            "quality": ((20, 150), WHITE, f"Qualität: {self.governor.label}"),
+        }
+        for key in sim.scenario.hud + ("quality",):
+            pos, color, text = lines[key]
+            self.screen.blit(self.font.render(text, True, color), pos)
+
+    def draw_stats_panel(self):
+        sim = self.sim
+        fps_history = self.fps_history
+        self.stats_surface.fill((0, 0, 0, 150))
+        stats_texts = [
+            (f"Energie: {sim.power} kW", YELLOW),
+            (f"Ölförderung: {sim.oelfoerderung:.2f} Barrel/s", WHITE),
+            (f"Bohrtiefe: {sim.bohrtiefe:.1f}m", WHITE),
+            (f"Aktuell: {sim.current_layer['name']}", WHITE),
+            (f"Wellenhöhe: {sim.wave_amplitude:.1f}m", WHITE),
+            (f"Wind: {sim.wind_speed:.1f} km/h, {sim.wind_direction:.0f}°", WHITE),
+            (f"Reservoirdruck: {sim.reservoir_druck:.1f}%", WHITE),
+            (f"Bohrkopf: {100-sim.bohrer_verschleiss:.0f}%", RED if sim.bohrer_verschleiss > 70 else WHITE),
+            (f"Tageszeit: {int(sim.tageszeit)}:{int((sim.tageszeit % 1) * 60):02d}", WHITE),
+            (f"FPS: {sum(fps_history)/len(fps_history):.1f}" if fps_history else "FPS: -", WHITE),
+            (f"Qualität: {self.governor.label}", WHITE),
+        ]
+        for i, (text, color) in enumerate(stats_texts):
+            self.stats_surface.blit(self.font.render(text, True, color), (10, 10 + i * 25))
+        self.screen.blit(self.stats_surface, (10, 10))
+
+    def update_plot(self):
+        if self.plot is not None:
+            self.plot.append(self.sim.time_step, energy=self.sim.power, oil=self.sim.oelfoerderung)
+            self.plot.update(self.sim.time_step)
+
+    def apply_quality(self):
+        knobs = self.governor.knobs
+        self.sim.physics.iterations = knobs.iterations
+        if self.plot is not None:
+            self.plot.interval = self.sim.scenario.plot_interval * knobs.plot_interval
+
+    def present(self, frame_start):
+        pygame.display.flip()
+
+        # Rechenzeit des Frames (ohne Warten auf die Ziel-FPS) an den Regler melden
+        if self.governor.record(time.perf_counter() - frame_start):
+            self.apply_quality()
+        self.clock.tick(self.sim.scenario.fps)
+
+        # FPS berechnen
+        current_time = time.perf_counter()
+        dt = current_time - self.last_time
+        self.last_time = current_time
+        if dt > 0:
+            self.fps_history.append(1.0 / dt)
+
+    def close(self):
+        pygame.quit()
+        if self.plot is not None:
+            self.plot.close()
+
+
+def run(scenario="7", seed=None, budget_ms=None, record=None, record_every=1, metocean=None):
+    """Interaktive Simulation eines Szenarios im Pygame-Fenster.
+
+    Mit ``record`` wird die Telemetrie in diese Datei geschrieben, mit
+    ``metocean`` (``MetOceanStream``) kommt das Wetter aus einer Messreihe.
+    """
+    sim = Simulation(scenario, seed, metocean=metocean)
+    recorder = None
+    if record:
+        from .telemetry import TelemetryRecorder
+        recorder = TelemetryRecorder(record, sim, record_every)
+    view = View(sim, budget_ms, recorder=recorder)
+    try:
+        while view.handle_events():
+            frame_start = time.perf_counter()
+            sim.step()
+            if recorder is not None:
+                recorder.record()
+            view.draw()
+            view.update_plot()
+            view.present(frame_start)
+    finally:
+        view.close()
+        if recorder is not None:
+            recorder.close()
+
+
+def replay(path, speed=1.0):
+    """Aufzeichnung abspielen: Leertaste Pause, Pfeiltasten Tempo und Richtung,
+    Pos1/Ende springen, Mausklick auf die Leiste unten sucht."""
+    from .telemetry import TelemetryReplay
+
+    recording = TelemetryReplay(path)
+    if not len(recording):
+        raise ValueError(f"Keine Datensätze in {path}")
+    state = recording.state(0)
+    view = View(state, live_plot=False)
+    sc = recording.scenario
+    bar = pygame.Rect(20, sc.height - 24, sc.width - 40, 8)
+    cursor, paused = 0.0, False
+    try:
+        running = True
+        while running:
+            frame_start = time.perf_counter()
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE:
+                        paused = not paused
+                    elif event.key == pygame.K_RIGHT:
+                        speed = speed * 2 if speed > 0 else (speed / 2 if speed < -0.25 else 0.25)
+                    elif event.key == pygame.K_LEFT:
+                        speed = speed * 2 if speed < 0 else (speed / 2 if speed > 0.25 else -0.25)
+                    elif event.key == pygame.K_HOME:
+                        cursor = 0.0
+                    elif event.key == pygame.K_END:
+                        cursor = len(recording) - 1.0
+                elif event.type == pygame.MOUSEBUTTONDOWN and bar.inflate(0, 16).collidepoint(event.pos):
+                    cursor = (event.pos[0] - bar.left) / bar.width * (len(recording) - 1)
+
+            # Tempo in aufgezeichneten Schritten pro Frame; am Rand anhalten
+            if not paused:
+                cursor = min(max(cursor + speed / recording.every, 0.0), len(recording) - 1.0)
+            recording.state(int(cursor), into=state)
+            view.draw()
+
+            progress = cursor / max(1, len(recording) - 1)
+            pygame.draw.rect(view.screen, DARK_GRAY, bar)
+            pygame.draw.rect(view.screen, YELLOW, (bar.left, bar.top, int(bar.width * progress), bar.height))
+            label = f"Schritt {state.time_step} / {recording.last_step}  {speed:+g}x" + ("  Pause" if paused else "")
+            view.screen.blit(view.font.render(label, True, WHITE), (bar.left, bar.top - 22))
+            view.present(frame_start)
+    finally:
+        view.close()